@@ -0,0 +1,304 @@
+"""
+Component icons for `Visuino/images`.
+
+Every component declared in the library gets `Visuino/images/<ClassName>.png`
+unless one is already there. If `<library>/icons/<ClassName>.png` exists it is
+scaled to `ICON_SIZE` (aspect kept, letterboxed on transparency); otherwise a
+placeholder is drawn from the component's category and pins. PNGs are read and
+written by the small pure-Python codec below, so no imaging library is needed.
+
+Rendering runs on a process pool. Results are cached in
+`<library>/.vtpc/icons/` under a key of (source hash, size), and
+`.vtpc/icons.json` records which icons this stage wrote, so hand-made icons
+are never overwritten and a rerun only renders new or changed components.
+
+    python app_assets.py <library> [--nick NICK] [--size 64]
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import struct
+import sys
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+
+from app_library import CACHE_DIRNAME
+
+ICON_SIZE = 64
+SOURCE_DIR = "icons"
+_VERSION = 1            # bump when rendering changes, invalidates cached icons
+
+
+class IconJob(NamedTuple):
+    dest: str           # Visuino/images/<ClassName>.png
+    key: str            # cache key: sha256 of (source, size, renderer version)
+    source: str         # path of a source PNG, or "" for a placeholder
+    category: str
+    inputs: int
+    outputs: int
+    size: int
+
+
+class AssetsResult(NamedTuple):
+    written: int
+    cached: int
+    skipped: int        # already present (hand-made or up to date)
+    errors: list[str]
+
+
+# ── PNG codec ───────────────────────────────────────────────────────────
+def _chunk(kind: bytes, data: bytes) -> bytes:
+    return (struct.pack(">I", len(data)) + kind + data
+            + struct.pack(">I", zlib.crc32(kind + data)))
+
+
+def encode_png(width: int, height: int, rgba: bytes | bytearray) -> bytes:
+    """8-bit RGBA, no filtering (icons are small, zlib does the work)."""
+    stride = width * 4
+    raw = b"".join(b"\0" + bytes(rgba[y * stride:(y + 1) * stride]) for y in range(height))
+    return (b"\x89PNG\r\n\x1a\n"
+            + _chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0))
+            + _chunk(b"IDAT", zlib.compress(raw, 9))
+            + _chunk(b"IEND", b""))
+
+
+def _paeth(a: int, b: int, c: int) -> int:
+    p = a + b - c
+    pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+    return a if pa <= pb and pa <= pc else b if pb <= pc else c
+
+
+def decode_png(data: bytes) -> tuple[int, int, bytearray]:
+    """(width, height, RGBA bytes) for 8-bit, non-interlaced PNGs."""
+    if data[:8] != b"\x89PNG\r\n\x1a\n":
+        raise ValueError("not a PNG file")
+    pos, idat, palette, trns = 8, [], b"", b""
+    w = h = depth = ctype = interlace = None
+    while pos < len(data):
+        n, kind = struct.unpack(">I4s", data[pos:pos + 8])
+        body = data[pos + 8:pos + 8 + n]
+        pos += 12 + n
+        if kind == b"IHDR":
+            w, h, depth, ctype, _, _, interlace = struct.unpack(">IIBBBBB", body)
+        elif kind == b"PLTE":
+            palette = body
+        elif kind == b"tRNS":
+            trns = body
+        elif kind == b"IDAT":
+            idat.append(body)
+        elif kind == b"IEND":
+            break
+    if depth != 8 or interlace or ctype not in (0, 2, 3, 4, 6):
+        raise ValueError("only 8-bit non-interlaced PNGs are supported")
+    bpp = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}[ctype]
+    raw, stride = zlib.decompress(b"".join(idat)), w * bpp
+    if len(raw) != h * (stride + 1):
+        raise ValueError(f"image data is {len(raw)} bytes, {w}x{h} needs {h * (stride + 1)}")
+    px, prev = bytearray(), bytearray(stride)
+    for y in range(h):
+        ftype = raw[y * (stride + 1)]
+        if ftype > 4:
+            raise ValueError(f"unknown filter type {ftype} in row {y}")
+        row = bytearray(raw[y * (stride + 1) + 1:(y + 1) * (stride + 1)])
+        if ftype == 1:
+            for i in range(bpp, stride):
+                row[i] = (row[i] + row[i - bpp]) & 0xFF
+        elif ftype == 2:
+            for i in range(stride):
+                row[i] = (row[i] + prev[i]) & 0xFF
+        elif ftype == 3:
+            for i in range(stride):
+                left = row[i - bpp] if i >= bpp else 0
+                row[i] = (row[i] + ((left + prev[i]) >> 1)) & 0xFF
+        elif ftype == 4:
+            for i in range(stride):
+                left = row[i - bpp] if i >= bpp else 0
+                upleft = prev[i - bpp] if i >= bpp else 0
+                row[i] = (row[i] + _paeth(left, prev[i], upleft)) & 0xFF
+        px += row
+        prev = row
+
+    if ctype == 6:
+        return w, h, px
+    if ctype == 3 and px and max(px) * 3 + 3 > len(palette):
+        raise ValueError("palette index out of range")
+    out = bytearray(w * h * 4)
+    for i in range(w * h):
+        if ctype == 2:
+            out[i * 4:i * 4 + 4] = px[i * 3:i * 3 + 3] + b"\xff"
+        elif ctype == 0:
+            out[i * 4:i * 4 + 4] = bytes((px[i],) * 3) + b"\xff"
+        elif ctype == 4:
+            out[i * 4:i * 4 + 4] = bytes((px[i * 2],) * 3) + px[i * 2 + 1:i * 2 + 2]
+        else:
+            k = px[i]
+            alpha = trns[k] if k < len(trns) else 255
+            out[i * 4:i * 4 + 4] = palette[k * 3:k * 3 + 3] + bytes((alpha,))
+    return w, h, out
+
+
+# ── rendering (process pool workers) ────────────────────────────────────
+def scale_to_fit(w: int, h: int, rgba: bytearray, size: int) -> bytearray:
+    """Box-filter `rgba` into a `size`×`size` canvas, keeping the aspect ratio."""
+    f = max(w, h) / size
+    tw, th = max(1, round(w / f)), max(1, round(h / f))
+    x0, y0 = (size - tw) // 2, (size - th) // 2
+    out = bytearray(size * size * 4)
+    for ty in range(th):
+        sy0, sy1 = int(ty * f), max(int(ty * f) + 1, int((ty + 1) * f))
+        for tx in range(tw):
+            sx0, sx1 = int(tx * f), max(int(tx * f) + 1, int((tx + 1) * f))
+            acc = [0, 0, 0, 0]
+            for sy in range(sy0, min(sy1, h)):
+                base = sy * w * 4
+                for sx in range(sx0, min(sx1, w)):
+                    i = base + sx * 4
+                    a = rgba[i + 3]
+                    acc[0] += rgba[i] * a
+                    acc[1] += rgba[i + 1] * a
+                    acc[2] += rgba[i + 2] * a
+                    acc[3] += a
+            n = (min(sy1, h) - sy0) * (min(sx1, w) - sx0)
+            o = ((y0 + ty) * size + x0 + tx) * 4
+            if acc[3]:
+                out[o:o + 4] = bytes((acc[0] // acc[3], acc[1] // acc[3],
+                                      acc[2] // acc[3], acc[3] // n))
+    return out
+
+
+def _category_color(category: str) -> tuple[int, int, int]:
+    h = hashlib.md5(category.encode()).digest()
+    return 96 + h[0] % 128, 96 + h[1] % 128, 96 + h[2] % 128
+
+
+def placeholder(size: int, category: str, inputs: int, outputs: int) -> bytearray:
+    """Bordered tile in the category colour with pin ticks on both sides."""
+    r, g, b = _category_color(category)
+    px = bytearray(size * size * 4)
+    m = max(2, size // 8)                       # margin left for pin ticks
+
+    def fill(x0, y0, x1, y1, color):
+        for y in range(max(0, y0), min(size, y1)):
+            for x in range(max(0, x0), min(size, x1)):
+                px[(y * size + x) * 4:(y * size + x) * 4 + 4] = color
+
+    fill(m, 1, size - m, size - 1, bytes((r // 2, g // 2, b // 2, 255)))
+    fill(m + 1, 2, size - m - 1, size - 2, bytes((r, g, b, 255)))
+    for count, x0 in ((inputs, 0), (outputs, size - m)):
+        count = min(count, 8)
+        for i in range(count):
+            y = (i + 1) * size // (count + 1)
+            fill(x0, y - 1, x0 + m, y + 1, b"\x30\x30\x30\xff")
+    return px
+
+
+def render(job: IconJob) -> bytes:
+    if job.source:
+        w, h, rgba = decode_png(Path(job.source).read_bytes())
+        return encode_png(job.size, job.size, scale_to_fit(w, h, rgba, job.size))
+    return encode_png(job.size, job.size,
+                      placeholder(job.size, job.category, job.inputs, job.outputs))
+
+
+# ── pipeline ────────────────────────────────────────────────────────────
+def _key(source: bytes, size: int) -> str:
+    return hashlib.sha256(b"%d|%d|" % (_VERSION, size) + source).hexdigest()
+
+
+def plan(root: Path, nick: str, size: int = ICON_SIZE) -> tuple[list[IconJob], int]:
+    """Icon jobs for components that need one, and how many were skipped."""
+    from app_index import walk
+    images = root / "Visuino" / "images"
+    written = _load_manifest(root)
+    jobs, skipped, seen = [], 0, set()
+    for e in walk(root, nick):
+        if not e.class_name or e.class_name in seen:
+            continue
+        seen.add(e.class_name)
+        src = root / SOURCE_DIR / f"{e.class_name}.png"
+        ins = sum(p.direction == "in" for p in e.pins)
+        outs = sum(p.direction == "out" for p in e.pins)
+        try:
+            key = _key(src.read_bytes(), size)
+            source = os.fspath(src)
+        except OSError:
+            key = _key(f"{e.category}|{ins}|{outs}".encode(), size)
+            source = ""
+        dest = images / f"{e.class_name}.png"
+        if dest.exists() and (dest.name not in written or written[dest.name] == key):
+            skipped += 1                # hand-made, or ours and still current
+            continue
+        jobs.append(IconJob(os.fspath(dest), key, source, e.category, ins, outs, size))
+    return jobs, skipped
+
+
+def _manifest_path(root: Path) -> Path:
+    return root / CACHE_DIRNAME / "icons.json"
+
+
+def _load_manifest(root: Path) -> dict[str, str]:
+    try:
+        return json.loads(_manifest_path(root).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def generate_icons(root: Path, nick: str = "", size: int = ICON_SIZE,
+                   workers: int | None = None) -> AssetsResult:
+    jobs, skipped = plan(root, nick, size)
+    cache = root / CACHE_DIRNAME / "icons"
+    cache.mkdir(parents=True, exist_ok=True)
+    (root / "Visuino" / "images").mkdir(parents=True, exist_ok=True)
+    manifest = _load_manifest(root)
+    todo, cached, errors = [], 0, []
+    for job in jobs:
+        blob = cache / f"{job.key}.png"
+        if blob.exists():
+            shutil.copyfile(blob, job.dest)
+            manifest[Path(job.dest).name] = job.key
+            cached += 1
+        else:
+            todo.append(job)
+
+    written = 0
+    if todo:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futs = [(job, pool.submit(render, job)) for job in todo]
+            for job, fut in futs:
+                try:
+                    png = fut.result()
+                except (OSError, ValueError, zlib.error, struct.error) as e:
+                    errors.append(f"{Path(job.dest).name}: {e}")
+                    continue
+                (cache / f"{job.key}.png").write_bytes(png)
+                Path(job.dest).write_bytes(png)
+                manifest[Path(job.dest).name] = job.key
+                written += 1
+    _manifest_path(root).write_text(json.dumps(manifest, indent=1), encoding="utf-8")
+    return AssetsResult(written, cached, skipped, errors)
+
+
+def summarize(r: AssetsResult) -> str:
+    icon = "⚠️" if r.errors else "🖼"
+    return (f"{icon} Icons: {r.written} rendered, {r.cached} from cache, "
+            f"{r.skipped} already present, {len(r.errors)} error(s).")
+
+
+if __name__ == "__main__":
+    import argparse
+    ap = argparse.ArgumentParser(description="Generate Visuino component icons.")
+    ap.add_argument("root", type=Path)
+    ap.add_argument("--nick", default="")
+    ap.add_argument("--size", type=int, default=ICON_SIZE)
+    args = ap.parse_args()
+    res = generate_icons(args.root.expanduser(), args.nick, args.size)
+    for err in res.errors:
+        print(err)
+    print(summarize(res))
+    sys.exit(1 if res.errors else 0)
@@ -0,0 +1,271 @@
+"""
+Component block view for the `-CANVAS-` area.
+
+Each component from the index is drawn as a block with its input pins on the
+left and output pins on the right. Blocks sit in fixed grid slots (a slot is
+reused when its component disappears, so updates never reshuffle the view)
+and are registered in a uniform-grid spatial index, which serves both
+hit-testing and viewport culling.
+
+Only blocks inside the viewport have canvas items. Panning shifts the existing
+items and draws/deletes just the blocks crossing the edge; index deltas and
+selection changes redraw only the blocks they touch. Zoom redraws the
+visible set, with pin detail dropped when zoomed far out.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import NamedTuple
+
+import PySimpleGUI as sg
+
+from app_index import Delta, Entry
+
+CANVAS  = (1100, 330)           # Graph size in pixels
+CELL_W, CELL_H = 220, 160       # slot size in world units
+BLOCK_W = 180
+PIN_DY  = 14
+GRID    = 512                   # spatial-index cell size in world units
+MIN_SCALE, MAX_SCALE = 0.05, 4.0
+
+
+class Block(NamedTuple):
+    key: tuple[str, str]        # (path, class name)
+    entry: Entry
+    x: float
+    y: float
+    w: float
+    h: float
+
+
+class BlockView:
+    KEY, INFO = "-BLOCKS-", "-BLOCKINFO-"
+    ZOOMIN, ZOOMOUT, FIT = "-BLOCKZOOMIN-", "-BLOCKZOOMOUT-", "-BLOCKFIT-"
+
+    def __init__(self) -> None:
+        self.blocks: dict[tuple, Block] = {}
+        self._slot_of: dict[tuple, int] = {}
+        self._free: list[int] = []
+        self._next_slot = 0
+        self._grid: dict[tuple[int, int], set[tuple]] = defaultdict(set)
+        self._figs: dict[tuple, list[int]] = {}      # drawn blocks → canvas items
+        self.scale, self.ox, self.oy = 1.0, 0.0, 0.0  # view: screen = (world - o) * scale
+        self.selected: tuple | None = None
+        self._drag_last = self._drag_start = None
+        self._drag_moved = 0.0
+
+    def layout(self) -> list[list]:
+        return [
+            [sg.Graph(CANVAS, graph_bottom_left=(0, CANVAS[1]), graph_top_right=(CANVAS[0], 0),
+                      key=self.KEY, background_color="lightgrey", drag_submits=True,
+                      enable_events=True)],
+            [sg.Button("+", key=self.ZOOMIN, size=(3, 1)),
+             sg.Button("−", key=self.ZOOMOUT, size=(3, 1)),
+             sg.Button("Fit", key=self.FIT),
+             sg.Text("Drag to pan, wheel to zoom, click a block for details.",
+                     key=self.INFO, expand_x=True)],
+        ]
+
+    def bind(self, win) -> None:
+        """Mouse-wheel zoom; call once the window is finalized."""
+        g = win[self.KEY]
+        g.bind("<MouseWheel>", "+WHEEL")
+        g.bind("<Button-4>", "+WHEELUP")       # X11
+        g.bind("<Button-5>", "+WHEELDOWN")
+
+    # ── model ────────────────────────────────────────────────────────
+    def _cells(self, x0, y0, x1, y1):
+        for gx in range(int(x0 // GRID), int(x1 // GRID) + 1):
+            for gy in range(int(y0 // GRID), int(y1 // GRID) + 1):
+                yield gx, gy
+
+    def _place(self, e: Entry) -> Block:
+        key = (e.path, e.class_name)
+        slot = self._slot_of.get(key)
+        if slot is None:
+            slot = self._free.pop() if self._free else self._next_slot
+            self._next_slot = max(self._next_slot, slot + 1)
+            self._slot_of[key] = slot
+        cols = 40
+        x, y = (slot % cols) * CELL_W, (slot // cols) * CELL_H
+        n = max(sum(p.direction == "in" for p in e.pins),
+                sum(p.direction == "out" for p in e.pins), 1)
+        h = min(CELL_H - 20, 28 + n * PIN_DY)
+        return Block(key, e, x, y, BLOCK_W, h)
+
+    def reset(self, win) -> None:
+        """Forget every block, e.g. when another library is opened."""
+        win[self.KEY].erase()
+        self.__init__()
+
+    def apply(self, delta: Delta, win) -> None:
+        """Fold an index delta in and redraw only the affected blocks."""
+        dirty = set()
+        for e in delta.removed:
+            key = (e.path, e.class_name)
+            b = self.blocks.pop(key, None)
+            if b is not None:
+                for c in self._cells(b.x, b.y, b.x + b.w, b.y + b.h):
+                    self._grid[c].discard(key)
+                dirty.add(key)
+        for e in delta.added:
+            b = self._place(e)
+            self.blocks[b.key] = b
+            for c in self._cells(b.x, b.y, b.x + b.w, b.y + b.h):
+                self._grid[c].add(b.key)
+            dirty.add(b.key)
+        for key in dirty - self.blocks.keys():          # gone for good: free the slot
+            self._free.append(self._slot_of.pop(key))
+            if self.selected == key:
+                self.selected = None
+        g = win[self.KEY]
+        visible = self._visible()
+        for key in dirty:
+            self._erase(g, key)
+            if key in visible:
+                self._draw(g, self.blocks[key])
+        self._sync(g, visible)
+
+    def query(self, x0, y0, x1, y1) -> set[tuple]:
+        """Keys of blocks overlapping a world rectangle."""
+        out = set()
+        for c in self._cells(x0, y0, x1, y1):
+            for key in self._grid.get(c, ()):
+                b = self.blocks[key]
+                if b.x <= x1 and b.x + b.w >= x0 and b.y <= y1 and b.y + b.h >= y0:
+                    out.add(key)
+        return out
+
+    def hit(self, sx: float, sy: float) -> tuple | None:
+        wx, wy = self.ox + sx / self.scale, self.oy + sy / self.scale
+        hits = self.query(wx, wy, wx, wy)
+        return next(iter(hits), None)
+
+    # ── drawing ──────────────────────────────────────────────────────
+    def _visible(self) -> set[tuple]:
+        w, h = CANVAS[0] / self.scale, CANVAS[1] / self.scale
+        return self.query(self.ox, self.oy, self.ox + w, self.oy + h)
+
+    def _erase(self, g, key) -> None:
+        for fid in self._figs.pop(key, ()):
+            g.delete_figure(fid)
+
+    def _draw(self, g, b: Block) -> None:
+        s = self.scale
+        x, y = (b.x - self.ox) * s, (b.y - self.oy) * s
+        w, h = b.w * s, b.h * s
+        sel = b.key == self.selected
+        figs = [g.draw_rectangle((x, y), (x + w, y + h), fill_color="white",
+                                 line_color="red" if sel else "black",
+                                 line_width=2 if sel else 1)]
+        if s >= 0.5:
+            font = ("Helvetica", max(6, int(8 * s)))
+            title = b.entry.name or b.entry.comp
+            figs.append(g.draw_text(title, (x + w / 2, y + 10 * s), font=font))
+            ins  = [p for p in b.entry.pins if p.direction == "in"]
+            outs = [p for p in b.entry.pins if p.direction == "out"]
+            for side, pins in ((0, ins), (1, outs)):
+                for i, p in enumerate(pins):
+                    py = y + (28 + i * PIN_DY) * s
+                    if py > y + h - 4 * s:
+                        break
+                    px = x + side * w
+                    figs.append(g.draw_rectangle((px - 4 * s, py - 4 * s), (px + 4 * s, py + 4 * s),
+                                                 fill_color="green" if side else "blue"))
+                    anchor = sg.TEXT_LOCATION_RIGHT if side else sg.TEXT_LOCATION_LEFT
+                    figs.append(g.draw_text(p.name, (px + (-7 if side else 7) * s, py),
+                                            font=font, text_location=anchor))
+        self._figs[b.key] = figs
+
+    def _sync(self, g, visible: set[tuple] | None = None) -> None:
+        """Draw blocks that entered the viewport, drop those that left."""
+        visible = self._visible() if visible is None else visible
+        for key in self._figs.keys() - visible:
+            self._erase(g, key)
+        for key in visible - self._figs.keys():
+            self._draw(g, self.blocks[key])
+
+    def _redraw(self, g) -> None:
+        for key in list(self._figs):
+            self._erase(g, key)
+        self._sync(g)
+
+    def _zoom(self, g, factor: float, sx: float, sy: float) -> None:
+        new = min(MAX_SCALE, max(MIN_SCALE, self.scale * factor))
+        # keep the world point under the cursor fixed
+        wx, wy = self.ox + sx / self.scale, self.oy + sy / self.scale
+        self.scale = new
+        self.ox, self.oy = wx - sx / new, wy - sy / new
+        self._redraw(g)
+
+    def _pan(self, g, dx: float, dy: float) -> None:
+        self.ox -= dx / self.scale
+        self.oy -= dy / self.scale
+        g.move(dx, dy)                  # shift what is already on the canvas
+        self._sync(g)
+
+    def _fit(self, g) -> None:
+        if not self.blocks:
+            return
+        x1 = max(b.x + b.w for b in self.blocks.values())
+        y1 = max(b.y + b.h for b in self.blocks.values())
+        self.scale = max(MIN_SCALE, min(MAX_SCALE, CANVAS[0] / (x1 + 20), CANVAS[1] / (y1 + 20)))
+        self.ox = self.oy = 0.0
+        self._redraw(g)
+
+    def _select(self, g, key: tuple | None) -> str:
+        old, self.selected = self.selected, key
+        visible = self._visible()
+        for k in {old, key} - {None}:
+            if k in self.blocks:
+                self._erase(g, k)
+                if k in visible:
+                    self._draw(g, self.blocks[k])
+        if key is None:
+            return ""
+        e = self.blocks[key].entry
+        ins  = ", ".join(p.name for p in e.pins if p.direction == "in") or "–"
+        outs = ", ".join(p.name for p in e.pins if p.direction == "out") or "–"
+        return f"{e.namespace}::{e.name or e.comp}  [{e.category or 'no category'}]  in: {ins}  out: {outs}"
+
+    # ── events ───────────────────────────────────────────────────────
+    def handle_event(self, event, vals, win) -> bool:
+        if not isinstance(event, str) or not event.startswith("-BLOCK"):
+            return False
+        g = win[self.KEY]
+        cx, cy = CANVAS[0] / 2, CANVAS[1] / 2
+
+        if event == self.KEY:                           # button down / dragging
+            pos = vals[self.KEY]
+            if pos == (None, None):
+                return True
+            if self._drag_last is None:
+                self._drag_start = self._drag_last = pos
+                self._drag_moved = 0.0
+            else:
+                dx, dy = pos[0] - self._drag_last[0], pos[1] - self._drag_last[1]
+                self._drag_moved += abs(dx) + abs(dy)
+                self._drag_last = pos
+                if dx or dy:
+                    self._pan(g, dx, dy)
+        elif event == self.KEY + "+UP":
+            if self._drag_start is not None and self._drag_moved < 3:
+                info = self._select(g, self.hit(*self._drag_start))
+                if info:
+                    win[self.INFO].update(info)
+            self._drag_last = self._drag_start = None
+        elif event in (self.KEY + "+WHEEL", self.KEY + "+WHEELUP", self.KEY + "+WHEELDOWN"):
+            ev = g.user_bind_event
+            up = event.endswith("UP") or (event.endswith("WHEEL") and ev is not None and ev.delta > 0)
+            x, y = (ev.x, ev.y) if ev is not None else (cx, cy)
+            self._zoom(g, 1.25 if up else 0.8, x, y)
+        elif event == self.ZOOMIN:
+            self._zoom(g, 1.25, cx, cy)
+        elif event == self.ZOOMOUT:
+            self._zoom(g, 0.8, cx, cy)
+        elif event == self.FIT:
+            self._fit(g)
+        else:
+            return False
+        return True
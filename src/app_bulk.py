@@ -0,0 +1,155 @@
+"""
+Bulk actions on the components selected in `-COMPLIST-`.
+
+Each action is a plain function `(root, nick, comp) -> str | None` so it can
+be used headlessly; `BulkRunner` fans them out over a thread pool and reports
+back to the window through `Window.write_event_value`, which keeps the GUI
+thread free while hundreds of files are processed.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+from pathlib import Path
+from typing import Callable
+
+from app_cache import CACHE
+from app_vcomp import (component_path, default_fields, render_header, render_vcomp,
+                       set_category, sync_headers, validate)
+
+Action = Callable[[Path, str, str], "str | None"]
+
+
+# ── actions ─────────────────────────────────────────────────────────────
+def prepopulate(root: Path, nick: str, comp: str, header_file: str = "") -> str | None:
+    """Pre populate an empty component with the editor's defaults (or `header_file`)."""
+    path = component_path(root, nick, comp)
+    if path.stat().st_size and path.read_text(encoding="utf-8").strip():
+        return f"ℹ️ {comp}: not empty, skipped."
+    f = default_fields(path)
+    if header_file:
+        f["header_file"] = header_file
+    path.write_text(render_vcomp(**f), encoding="utf-8")
+    header = root / "SRC" / f["header_file"]
+    if not header.exists():
+        header.parent.mkdir(parents=True, exist_ok=True)
+        header.write_text(render_header(f["namespace"], f["create_name"]), encoding="utf-8")
+    return None
+
+
+def validate_one(root: Path, nick: str, comp: str) -> str | None:
+    path  = component_path(root, nick, comp)
+    diags = validate(CACHE.model(path), root / "SRC")
+    if not diags:
+        return None
+    return "\n".join(f"{path.name}:{d.line + 1}: {d.severity}: {d.message}" for d in diags)
+
+
+def delete(root: Path, nick: str, comp: str) -> str | None:
+    component_path(root, nick, comp).unlink()
+    return None
+
+
+def recategorize(category: str) -> Action:
+    def action(root: Path, nick: str, comp: str) -> str | None:
+        path = component_path(root, nick, comp)
+        text = path.read_text(encoding="utf-8")
+        new  = set_category(text, category)
+        if new != text:
+            path.write_text(new, encoding="utf-8")
+        return None
+    return action
+
+
+def format_one(root: Path, nick: str, comp: str) -> str | None:
+    from app_format import format_file
+    r = format_file(str(component_path(root, nick, comp)))
+    return f"⚠️ {comp}: {r.error}" if r.error else None
+
+
+def regenerate_headers(root: Path, nick: str, comp: str) -> str | None:
+    msgs = sync_headers(root, component_path(root, nick, comp))
+    return "\n".join(m for m in msgs if not m.startswith("✅")) or None
+
+
+# ── runner ──────────────────────────────────────────────────────────────
+class BulkRunner:
+    """Run one bulk action at a time on a shared worker pool."""
+
+    PROGRESS, DONE = "-BULKPROGRESS-", "-BULKDONE-"
+    POST_EVERY     = 0.05       # seconds between progress events
+
+    def __init__(self, workers: int = 8, log: Callable[[str], None] | None = None) -> None:
+        self._pool   = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bulk")
+        self._log    = log
+        self._cancel = threading.Event()
+        self._busy   = False
+
+    @property
+    def busy(self) -> bool:
+        return self._busy
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    def close(self) -> None:
+        """Cancel what has not started and wait for the components in progress."""
+        self._cancel.set()
+        self._pool.shutdown(cancel_futures=True)
+
+    def start(self, win, label: str, action: Action, root: Path, nick: str,
+              comps: list[str]) -> None:
+        """
+        Queue `action` for every component and return immediately. The window
+        receives throttled `PROGRESS` events `(done, total)` and one `DONE`
+        event `(label, failures, cancelled)`.
+        """
+        if self._busy:
+            raise RuntimeError("A bulk action is already running.")
+        self._busy = True
+        self._cancel = threading.Event()
+        cancel = self._cancel
+
+        def guarded(comp: str) -> str | None:
+            if cancel.is_set():
+                return None
+            return action(root, nick, comp)
+
+        futures = {self._pool.submit(guarded, c): c for c in comps}
+        threading.Thread(target=self._collect, args=(win, label, futures, cancel),
+                         daemon=True).start()
+
+    def _collect(self, win, label, futures, cancel) -> None:
+        total, done, last = len(futures), 0, 0.0
+        stopped = False
+        problems: list[str] = []
+        for fut in as_completed(futures):
+            done += 1
+            try:
+                msg = None if fut.cancelled() else fut.result()
+            except Exception as e:  # noqa: BLE001
+                msg = f"❌ {futures[fut]}: {e}"
+            if msg:
+                problems.append(msg)
+                if self._log is not None:
+                    self._log(msg)
+            if cancel.is_set() and not stopped:
+                stopped = True
+                for f in futures:
+                    f.cancel()
+            now = time.monotonic()
+            if now - last >= self.POST_EVERY or done == total:
+                last = now
+                win.write_event_value(self.PROGRESS, (done, total))
+        self._busy = False
+        win.write_event_value(self.DONE, (label, problems, cancel.is_set()))
+
+
+def run_headless(action: Action, root: Path, nick: str, comps: list[str],
+                 workers: int = 8) -> list[str]:
+    """Blocking variant for scripts and benchmarks; returns non-empty messages."""
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return [m for m in pool.map(partial(action, root, nick), comps) if m]
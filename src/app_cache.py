@@ -0,0 +1,139 @@
+"""
+Process-wide cache of component files: raw text and parsed `Document`.
+
+Entries are keyed by (path, mtime_ns, size), so one `stat` decides whether a
+cached parse is still valid. The cache is an LRU bounded by an estimated byte
+budget and can be pickled to `~/.vtpc/parse-cache.pickle`, so a restarted app
+opens large libraries warm. The editor, the validator and the component index
+all go through the shared `CACHE` instance.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import NamedTuple
+
+from app_vcomp import Document, parse
+
+DISK_PATH   = Path.home() / ".vtpc" / "parse-cache.pickle"
+_FORMAT     = 1         # bump when Document/Node change shape
+_MODEL_COST = 4         # parsed model ≈ this many times the text size
+
+
+class _Entry(NamedTuple):
+    mtime_ns: int
+    size: int
+    text: str
+    doc: Document | None
+    cost: int
+
+
+class ComponentCache:
+    def __init__(self, budget_bytes: int = 64 << 20, disk_path: Path | None = DISK_PATH) -> None:
+        self.budget    = budget_bytes
+        self.disk_path = disk_path
+        self.hits = self.misses = 0
+        self._used  = 0
+        self._items: OrderedDict[str, _Entry] = OrderedDict()
+        self._lock  = threading.Lock()
+
+    # ── lookups ──────────────────────────────────────────────────────
+    def _lookup(self, path: Path, want_doc: bool) -> _Entry:
+        key = os.fspath(path)
+        st  = os.stat(key)
+        with self._lock:
+            e = self._items.get(key)
+            if e is not None and e.mtime_ns == st.st_mtime_ns and e.size == st.st_size \
+                    and (e.doc is not None or not want_doc):
+                self._items.move_to_end(key)
+                self.hits += 1
+                return e
+            self.misses += 1
+        if e is not None and e.mtime_ns == st.st_mtime_ns and e.size == st.st_size:
+            text = e.text                   # text is current, only the parse is missing
+        else:
+            with open(key, encoding="utf-8") as f:
+                text = f.read()
+        doc  = parse(text) if want_doc else None
+        cost = len(text) * (1 + (_MODEL_COST if doc is not None else 0))
+        e = _Entry(st.st_mtime_ns, st.st_size, text, doc, cost)
+        self._store(key, e)
+        return e
+
+    def _store(self, key: str, e: _Entry) -> None:
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._used -= old.cost
+            self._items[key] = e
+            self._used += e.cost
+            while self._used > self.budget and len(self._items) > 1:
+                _, ev = self._items.popitem(last=False)
+                self._used -= ev.cost
+
+    def text(self, path: Path) -> str:
+        return self._lookup(path, want_doc=False).text
+
+    def model(self, path: Path) -> Document:
+        return self._lookup(path, want_doc=True).doc
+
+    def invalidate(self, path: Path) -> None:
+        with self._lock:
+            e = self._items.pop(os.fspath(path), None)
+            if e is not None:
+                self._used -= e.cost
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._used = 0
+
+    @property
+    def used_bytes(self) -> int:
+        return self._used
+
+    # ── optional persistence ─────────────────────────────────────────
+    def save(self, path: Path | None = None) -> None:
+        path = path or self.disk_path
+        if path is None:
+            return
+        with self._lock:
+            items = list(self._items.items())
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        try:
+            with open(tmp, "wb") as f:
+                pickle.dump((_FORMAT, items), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)     # never leave half a cache behind
+            raise
+
+    def load(self, path: Path | None = None) -> int:
+        """Merge a saved cache; stale entries simply miss later. Returns count."""
+        path = path or self.disk_path
+        if path is None:
+            return 0
+        try:
+            with open(path, "rb") as f:
+                fmt, items = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError, AttributeError):
+            return 0
+        if fmt != _FORMAT:
+            return 0
+        n = 0
+        for key, e in items:
+            with self._lock:
+                if key in self._items:      # something fresher was read meanwhile
+                    continue
+            self._store(key, _Entry(*e))
+            n += 1
+        return n
+
+
+CACHE = ComponentCache(
+    disk_path=None if os.environ.get("VTPC_DISK_CACHE", "1") == "0" else DISK_PATH)
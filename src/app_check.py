@@ -0,0 +1,168 @@
+"""
+Offline syntax check of generated `SRC/*.h` headers.
+
+Each header is compiled with the local `g++ -fsyntax-only` (or clang) against
+the stand-in `stubs/Mitov.h`, so broken output shows up before the library is
+opened in Visuino. Compiles run in parallel; results are cached per header
+content hash in `<library>/.vtpc/check.json`, so only changed headers are
+recompiled. The hash also covers every `SRC/` header a header `#include`s,
+directly or not, so editing a shared base header rechecks its users.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+
+from app_library import CACHE_DIRNAME
+
+STUB_DIR      = Path(__file__).with_name("stubs")
+COMPILERS     = ("g++", "clang++", "clang")
+FLAGS         = ("-fsyntax-only", "-x", "c++", "-std=gnu++11", "-w")
+
+
+class CheckResult(NamedTuple):
+    header: str          # path relative to SRC/
+    ok: bool
+    output: str          # compiler diagnostics (empty when ok)
+    cached: bool
+
+
+# ── helpers ─────────────────────────────────────────────────────────────
+def find_compiler() -> str | None:
+    """Return the first C++ compiler found on PATH, or None."""
+    for name in COMPILERS:
+        found = shutil.which(name)
+        if found:
+            return found
+    return None
+
+
+def _digest(data: bytes, salt: str) -> str:
+    return hashlib.sha256(salt.encode() + b"\0" + data).hexdigest()
+
+
+def _salt(compiler: str) -> str:
+    """Everything besides the header that influences the outcome."""
+    stub = (STUB_DIR / "Mitov.h").read_bytes()
+    return "|".join([Path(compiler).name, *FLAGS, hashlib.sha256(stub).hexdigest()])
+
+
+_INCLUDE_RE = re.compile(rb'^[ \t]*#[ \t]*include[ \t]*[<"]([^>"]+)[>"]', re.M)
+
+
+def _includes(header: Path, data: bytes, src_dir: Path, known: set[Path]) -> list[Path]:
+    """`SRC/` headers `header` includes, resolved the way `-I src_dir` would."""
+    out = []
+    for m in _INCLUDE_RE.finditer(data):
+        name = m.group(1).decode("utf-8", "replace")
+        for base in (header.parent, src_dir):
+            p = Path(os.path.normpath(base / name))
+            if p in known:
+                out.append(p)
+                break
+    return out
+
+
+def _keys(headers: list[Path], src_dir: Path, salt: str) -> dict[Path, str]:
+    """Cache key per header: its own bytes plus those of everything it includes."""
+    data = {h: h.read_bytes() for h in headers}
+    own = {h: _digest(b, salt) for h, b in data.items()}
+    known = set(headers)
+    deps = {h: _includes(h, data[h], src_dir, known) for h in headers}
+    keys = {}
+    for h in headers:
+        seen, todo = {h}, list(deps[h])
+        while todo:
+            d = todo.pop()
+            if d not in seen:
+                seen.add(d)
+                todo.extend(deps[d])
+        seen.discard(h)
+        closure = sorted(f"{d.relative_to(src_dir).as_posix()}={own[d]}" for d in seen)
+        keys[h] = _digest("\n".join(closure).encode(), own[h]) if closure else own[h]
+    return keys
+
+
+def _load_cache(path: Path) -> dict:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _compile(compiler: str, src_dir: Path, header: Path) -> tuple[bool, str]:
+    cmd = [compiler, *FLAGS, "-I", str(STUB_DIR), "-I", str(src_dir), str(header)]
+    try:
+        proc = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+    except (OSError, subprocess.TimeoutExpired) as exc:
+        return False, str(exc)
+    return proc.returncode == 0, (proc.stdout + proc.stderr).strip()
+
+
+# ── public API ──────────────────────────────────────────────────────────
+def check_headers(root: Path, compiler: str | None = None,
+                  jobs: int | None = None) -> list[CheckResult]:
+    """Syntax-check every header under `root/SRC`, reusing cached verdicts."""
+    compiler = compiler or find_compiler()
+    if compiler is None:
+        raise RuntimeError("No C++ compiler (g++/clang) found on PATH.")
+
+    src_dir    = root / "SRC"
+    cache_path = root / CACHE_DIRNAME / "check.json"
+    cache      = _load_cache(cache_path)
+    salt       = _salt(compiler)
+
+    headers = sorted(p for p in src_dir.rglob("*.h") if p.is_file())
+    keys    = _keys(headers, src_dir, salt)
+    stale   = [h for h in headers if keys[h] not in cache]
+
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as pool:
+        fresh = dict(zip(stale, pool.map(lambda h: _compile(compiler, src_dir, h), stale)))
+
+    results, new_cache = [], {}
+    for h in headers:
+        key = keys[h]
+        if h in fresh:
+            ok, out = fresh[h]
+        else:
+            ok, out = cache[key]["ok"], cache[key]["output"]
+        new_cache[key] = {"ok": ok, "output": out}
+        results.append(CheckResult(h.relative_to(src_dir).as_posix(), ok, out, h not in fresh))
+
+    # Entries for headers that no longer exist are dropped on every run.
+    try:
+        cache_path.parent.mkdir(exist_ok=True)
+        cache_path.write_text(json.dumps(new_cache, indent=1), encoding="utf-8")
+    except OSError:
+        pass
+    return results
+
+
+def summarize(results: list[CheckResult]) -> str:
+    """One-line status message in the style of `WorkdirWidget.handle_event`."""
+    if not results:
+        return "ℹ️ No headers under SRC/."
+    failed = [r.header for r in results if not r.ok]
+    cached = sum(r.cached for r in results)
+    if failed:
+        return f"❌ {len(failed)} of {len(results)} header(s) failed: {', '.join(failed)}"
+    return f"✅ {len(results)} header(s) OK ({cached} cached)."
+
+
+if __name__ == "__main__":
+    lib = Path(sys.argv[1] if len(sys.argv) > 1 else ".").expanduser()
+    res = check_headers(lib)
+    for r in res:
+        if not r.ok:
+            print(f"--- {r.header}\n{r.output}")
+    print(summarize(res))
+    sys.exit(0 if all(r.ok for r in res) else 1)
@@ -0,0 +1,151 @@
+"""
+Library statistics dashboard, the first tab of the `-CANVAS-` area.
+
+`LibraryStats` keeps counters (per category, per pin type, missing headers,
+file sizes, recent changes) that are updated from `ComponentIndex` deltas, so
+a refresh costs work proportional to what changed, not to the library size.
+A background thread polls the index and posts the rendered text (plus the
+delta itself, for the block view) to the window; the GUI thread only swaps a
+string into a Multiline.
+"""
+
+from __future__ import annotations
+
+import heapq
+import threading
+import time
+from collections import Counter, deque
+from pathlib import Path
+
+import PySimpleGUI as sg
+
+from app_index import ComponentIndex, Delta, Entry
+
+TOP_N = 10
+
+
+class LibraryStats:
+    def __init__(self) -> None:
+        self.components = 0
+        self.categories: Counter[str] = Counter()
+        self.pin_types: Counter[str] = Counter()
+        self.missing: Counter[tuple[str, str]] = Counter()  # (comp, header)
+        self._sizes: dict[str, tuple[int, str]] = {}        # path → (size, comp)
+        self._top: list[tuple[int, str]] | None = []
+        self.recent: deque[tuple[float, str, str]] = deque(maxlen=TOP_N)
+
+    def _count(self, e: Entry, sign: int) -> None:
+        self.components += sign
+        self.categories[e.category or "(none)"] += sign
+        for p in e.pins:
+            self.pin_types[p.type] += sign
+        if e.class_name and not e.has_header:
+            self.missing[(e.comp, e.include or "(no ArduinoInclude)")] += sign
+
+    def apply(self, delta: Delta, record: bool = True) -> None:
+        """Fold one index delta in; `record=False` skips the recent-changes feed."""
+        gone = {e.path for e in delta.removed}
+        for e in delta.removed:
+            self._count(e, -1)
+        for e in delta.added:
+            self._count(e, +1)
+        for c in (self.categories, self.pin_types, self.missing):
+            for k in [k for k, v in c.items() if v <= 0]:
+                del c[k]
+
+        # Top-N by size: pushes are cheap; dropping a member forces a rescan.
+        for path in gone:
+            old = self._sizes.pop(path, None)
+            if old is not None and self._top is not None and (old[0], path) in self._top:
+                self._top = None
+        for e in {e.path: e for e in delta.added}.values():
+            self._sizes[e.path] = (e.size, e.comp)
+            if self._top is not None:
+                self._top = heapq.nlargest(TOP_N, self._top + [(e.size, e.path)])
+
+        if not record:
+            return
+        now = time.time()
+        comps = lambda es: {e.path: e.comp for e in es}    # noqa: E731
+        added, removed = comps(delta.added), comps(delta.removed)
+        for path, comp in added.items():
+            self.recent.appendleft((now, "changed" if path in removed else "added", comp))
+        for path in removed.keys() - added.keys():
+            self.recent.appendleft((now, "removed", removed[path]))
+
+    def largest(self) -> list[tuple[int, str]]:
+        if self._top is None:
+            self._top = heapq.nlargest(TOP_N, ((s, p) for p, (s, _) in self._sizes.items()))
+        return [(s, self._sizes[p][1]) for s, p in self._top if p in self._sizes]
+
+    def render(self) -> str:
+        w = max([len(k) for k in self.categories] + [10])
+        lines = [f"Components: {self.components}", "", "Per category:"]
+        lines += [f"  {k:<{w}} {v:>7}" for k, v in self.categories.most_common()]
+        lines += ["", "Pin types:"]
+        lines += [f"  {k:<{w}} {v:>7}" for k, v in self.pin_types.most_common(TOP_N)]
+        lines += ["", f"Missing headers: {len(self.missing)}"]
+        lines += [f"  {c} → SRC/{h}" for c, h in sorted(self.missing)[:TOP_N]]
+        lines += ["", "Largest files:"]
+        lines += [f"  {s / 1024:8.1f} KB  {c}" for s, c in self.largest()]
+        lines += ["", "Recent changes:"]
+        lines += [f"  {time.strftime('%H:%M:%S', time.localtime(t))} {a:<8} {c}"
+                  for t, a, c in self.recent]
+        return "\n".join(lines)
+
+
+class Dashboard:
+    KEY, TEXT, EVENT = "-DASH-", "-DASHTEXT-", "-DASHUPDATE-"
+    POLL = 3.0          # seconds between index refreshes
+
+    def __init__(self) -> None:
+        self.library: tuple[Path, str] | None = None
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def element(self):
+        return sg.Column(
+            [[sg.Multiline("Verify a library to see its statistics.", key=self.TEXT,
+                           disabled=True, font=("Consolas", 9), background_color="lightgrey",
+                           expand_x=True, expand_y=True, size=(60, 15))]],
+            key=self.KEY, expand_x=True, expand_y=True)
+
+    def set_library(self, library: tuple[Path, str] | None) -> None:
+        with self._lock:
+            self.library = library
+        self._wake.set()
+
+    def start(self, win) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, args=(win,), daemon=True,
+                                            name="dashboard")
+            self._thread.start()
+
+    def _run(self, win) -> None:
+        index, stats, current, first = None, None, None, False
+        while True:
+            self._wake.wait(self.POLL)
+            self._wake.clear()
+            with self._lock:
+                lib = self.library
+            if lib is None:
+                continue
+            if lib != current:
+                current, index, stats = lib, ComponentIndex(*lib), LibraryStats()
+                first = True
+            try:
+                delta = index.refresh()
+            except Exception as e:  # noqa: BLE001
+                win.write_event_value(self.EVENT, (f"⚠️ {e}", None, False))
+                continue
+            if delta or first:
+                stats.apply(delta, record=not first)
+                win.write_event_value(self.EVENT, (stats.render(), delta, first))
+                first = False
+
+    def handle_event(self, event, vals, win) -> bool:
+        if event != self.EVENT:
+            return False
+        win[self.TEXT].update(vals[event][0])
+        return True
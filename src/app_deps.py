@@ -0,0 +1,300 @@
+"""
+`depends=` resolution across the installed Arduino libraries.
+
+Every folder under `Arduino/libraries` with a `library.properties` is indexed
+by its `name=`, `version=` and `depends=`. The index is kept in
+`<libraries>/.vtpc/deps.json` together with each file's (size, mtime), and in
+memory per process, so after the first pass a refresh is one `scandir` plus a
+`stat` per library and only edited `library.properties` files are re-read.
+
+Dependencies follow the Arduino format: a comma-separated list of library
+names, each optionally with a version constraint in parentheses, e.g.
+`depends=Adafruit GFX Library (>=1.10.0), Wire`. Constraints use
+`= == != < <= > >=` and may be combined with `&&`, `||` and `!`.
+
+    python app_deps.py <library> [<library>...]
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import sys
+import threading
+from pathlib import Path
+from typing import NamedTuple
+
+from app_library import CACHE_DIRNAME
+
+_FORMAT = 1
+
+
+class Requirement(NamedTuple):
+    name: str
+    constraint: str = ""        # e.g. ">=1.2.0", "" for any version
+
+
+class LibraryInfo(NamedTuple):
+    name: str
+    version: str
+    folder: str
+    depends: tuple[Requirement, ...] = ()
+
+
+class Problem(NamedTuple):
+    library: str                # who asked
+    requirement: Requirement
+    found: str = ""             # installed version for conflicts, "" when missing
+
+    def __str__(self) -> str:
+        want = f"{self.requirement.name} ({self.requirement.constraint})" \
+            if self.requirement.constraint else self.requirement.name
+        if self.found:
+            return f"⚠️ {self.library} needs {want}, {self.found} is installed"
+        return f"❌ {self.library} needs {want}, which is not installed"
+
+
+class Duplicate(NamedTuple):
+    """Several installed folders declare the same `name=`; `chosen` is the one resolved."""
+    chosen: LibraryInfo
+    others: tuple[LibraryInfo, ...]
+
+    def __str__(self) -> str:
+        also = ", ".join(f"{o.folder} ({o.version or 'no version'})" for o in self.others)
+        return (f"⚠️ {self.chosen.name} is installed {len(self.others) + 1} times: using "
+                f"{self.chosen.folder} ({self.chosen.version or 'no version'}), also {also}")
+
+
+class Resolution(NamedTuple):
+    root: str
+    order: list[LibraryInfo]    # transitive dependencies, dependencies first
+    missing: list[Problem]
+    conflicts: list[Problem]
+    cycles: list[list[str]]
+    duplicates: list[Duplicate] = []
+
+    @property
+    def ok(self) -> bool:
+        return not (self.missing or self.conflicts)
+
+
+# ── parsing ─────────────────────────────────────────────────────────────
+def parse_properties(text: str) -> dict[str, str]:
+    out = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, _, value = line.partition("=")
+        out[key.strip()] = value.strip()
+    return out
+
+
+_DEP_RE = re.compile(r"\s*([^,()]+?)\s*(?:\(([^)]*)\))?\s*(?:,|$)")
+
+
+def parse_depends(value: str) -> tuple[Requirement, ...]:
+    """`A (>=1.0), B C` → (Requirement("A", ">=1.0"), Requirement("B C"))."""
+    return tuple(Requirement(m.group(1), (m.group(2) or "").strip())
+                 for m in _DEP_RE.finditer(value) if m.group(1))
+
+
+def _version_key(v: str) -> tuple:
+    """Semver-ish ordering: numeric parts compare as numbers, a pre-release sorts first."""
+    core, _, pre = v.strip().lstrip("vV").partition("-")
+    nums = [int(p) if p.isdigit() else 0 for p in core.split("+")[0].split(".")]
+    while len(nums) < 3:
+        nums.append(0)
+    return (*nums, 0 if pre else 1, pre)
+
+
+_CMP_RE = re.compile(r"^(==|=|!=|<=|>=|<|>)?\s*(.+)$")
+
+
+def satisfies(version: str, constraint: str) -> bool:
+    constraint = constraint.strip()
+    if not constraint:
+        return True
+    if "||" in constraint:
+        return any(satisfies(version, c) for c in constraint.split("||"))
+    if "&&" in constraint:
+        return all(satisfies(version, c) for c in constraint.split("&&"))
+    if constraint.startswith("!") and not constraint.startswith("!="):
+        return not satisfies(version, constraint[1:].strip("() "))
+    m = _CMP_RE.match(constraint.strip("() "))
+    if not m or not version:
+        return False
+    op, have, want = m.group(1) or "=", _version_key(version), _version_key(m.group(2))
+    return {"=": have == want, "==": have == want, "!=": have != want,
+            "<": have < want, "<=": have <= want,
+            ">": have > want, ">=": have >= want}[op]
+
+
+# ── index ───────────────────────────────────────────────────────────────
+class DependencyIndex:
+    """Name → installed library for one `libraries` folder, refreshed by stat."""
+
+    def __init__(self, libraries: Path) -> None:
+        self.libraries = libraries
+        self.cache_path = libraries / CACHE_DIRNAME / "deps.json"
+        self._files: dict[str, list] = {}           # folder → [size, mtime_ns, info]
+        self._by_name: dict[str, LibraryInfo] = {}
+        self.duplicates: dict[str, Duplicate] = {}  # name → the copy used and the others
+        self._lock = threading.Lock()
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            if data.get("format") == _FORMAT:
+                self._files = data["libraries"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def refresh(self) -> int:
+        """Re-read changed `library.properties`; returns how many were parsed."""
+        with self._lock:
+            seen, parsed = {}, 0
+            try:
+                with os.scandir(self.libraries) as it:
+                    folders = sorted(e.name for e in it if e.is_dir() and e.name[0] != ".")
+            except OSError:
+                folders = []
+            for folder in folders:
+                props = os.path.join(self.libraries, folder, "library.properties")
+                try:
+                    st = os.stat(props)
+                except OSError:
+                    continue
+                old = self._files.get(folder)
+                if old is not None and old[:2] == [st.st_size, st.st_mtime_ns]:
+                    seen[folder] = old
+                    continue
+                try:
+                    with open(props, encoding="utf-8", errors="replace") as f:
+                        p = parse_properties(f.read())
+                except OSError:
+                    continue
+                info = [p.get("name") or folder, p.get("version", ""), folder,
+                        [list(r) for r in parse_depends(p.get("depends", ""))]]
+                seen[folder] = [st.st_size, st.st_mtime_ns, info]
+                parsed += 1
+            changed = parsed or seen.keys() != self._files.keys()
+            self._files = seen
+            if changed or not self._by_name:
+                self._rebuild()
+            if changed:
+                try:
+                    self.cache_path.parent.mkdir(exist_ok=True)
+                    self.cache_path.write_text(json.dumps({"format": _FORMAT,
+                                                           "libraries": self._files}),
+                                               encoding="utf-8")
+                except OSError:
+                    pass
+            return parsed
+
+    def _rebuild(self) -> None:
+        by_name, others = {}, {}
+        for _, _, (name, version, folder, deps) in self._files.values():
+            info = LibraryInfo(name, version, folder, tuple(Requirement(*r) for r in deps))
+            if name in by_name:
+                others.setdefault(name, []).append(info)
+            else:
+                by_name[name] = info
+        self._by_name = by_name
+        self.duplicates = {n: Duplicate(by_name[n], tuple(o)) for n, o in others.items()}
+
+    def get(self, name: str) -> LibraryInfo | None:
+        return self._by_name.get(name)
+
+    def __len__(self) -> int:
+        return len(self._by_name)
+
+    def resolve(self, root: LibraryInfo) -> Resolution:
+        """Transitive closure of `root`'s dependencies (depth-first, post-order)."""
+        order, missing, conflicts, cycles = [], [], [], []
+        state: dict[str, int] = {root.name: 1}      # 1 = on the stack, 2 = done
+        stack = [root.name]
+
+        def visit(lib: LibraryInfo) -> None:
+            for req in lib.depends:
+                dep = self._by_name.get(req.name)
+                if dep is None:
+                    missing.append(Problem(lib.name, req))
+                    continue
+                if not satisfies(dep.version, req.constraint):
+                    conflicts.append(Problem(lib.name, req, dep.version or "no version"))
+                s = state.get(dep.name)
+                if s == 1:
+                    cycles.append(stack[stack.index(dep.name):] + [dep.name])
+                    continue
+                if s == 2:
+                    continue
+                state[dep.name] = 1
+                stack.append(dep.name)
+                visit(dep)
+                stack.pop()
+                state[dep.name] = 2
+                order.append(dep)
+
+        visit(root)
+        duplicates = [self.duplicates[d.name] for d in order if d.name in self.duplicates]
+        d, one = self.duplicates.get(root.name), self._by_name.get(root.name)
+        copies = (d.chosen, *d.others) if d else (one,) if one else ()
+        if others := tuple(c for c in copies if c.folder != root.folder):
+            duplicates.insert(0, Duplicate(root, others))   # other installed copies of root
+        return Resolution(root.name, order, missing, conflicts, cycles, duplicates)
+
+
+_INDEXES: dict[Path, DependencyIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def index_for(libraries: Path) -> DependencyIndex:
+    """The process-wide index of a `libraries` folder, refreshed."""
+    key = libraries.resolve()
+    with _INDEXES_LOCK:
+        idx = _INDEXES.get(key)
+        if idx is None:
+            idx = _INDEXES[key] = DependencyIndex(key)
+    idx.refresh()
+    return idx
+
+
+def resolve_library(root: Path) -> Resolution:
+    """Resolve the library at `root` against its sibling libraries."""
+    idx = index_for(root.parent)
+    try:
+        p = parse_properties((root / "library.properties").read_text(encoding="utf-8"))
+    except OSError:
+        p = {}
+    info = LibraryInfo(p.get("name") or root.name, p.get("version", ""), root.name,
+                       parse_depends(p.get("depends", "")))
+    return idx.resolve(info)
+
+
+def report(r: Resolution) -> str:
+    lines = [f"{r.root} depends on {len(r.order)} librar{'y' if len(r.order) == 1 else 'ies'}:"]
+    lines += [f"  {d.name} {d.version} ({d.folder})" for d in r.order]
+    lines += [str(p) for p in r.missing + r.conflicts]
+    lines += [str(d) for d in r.duplicates]
+    lines += [f"🔁 Cycle: {' → '.join(c)}" for c in r.cycles]
+    return "\n".join(lines)
+
+
+def summarize(r: Resolution) -> str:
+    if r.ok and r.duplicates:
+        return (f"⚠️ {r.root}: {len(r.order)} dependenc{'y' if len(r.order) == 1 else 'ies'} "
+                f"resolved, {len(r.duplicates)} installed more than once.")
+    if r.ok:
+        return f"✅ {r.root}: {len(r.order)} dependenc{'y' if len(r.order) == 1 else 'ies'} resolved."
+    return (f"❌ {r.root}: {len(r.missing)} missing, {len(r.conflicts)} conflicting "
+            f"dependenc{'y' if len(r.missing) + len(r.conflicts) == 1 else 'ies'}.")
+
+
+if __name__ == "__main__":
+    failed = False
+    for arg in sys.argv[1:] or ["."]:
+        res = resolve_library(Path(arg).expanduser().resolve())
+        print(report(res))
+        print(summarize(res))
+        failed |= not res.ok
+    sys.exit(1 if failed else 0)
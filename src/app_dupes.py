@@ -0,0 +1,252 @@
+"""
+Near-duplicate component detection.
+
+Every `.vcomp` is parsed and flattened to a token stream where identifiers and
+string values are abstracted away (types, pin count, attribute names,
+categories and the shape of `ArduinoInclude` / `ArduinoClass` are kept), so
+copies that only differ in names normalize identically. That stream gives an
+exact hash plus a MinHash signature over token shingles; LSH banding proposes
+candidate pairs, which are confirmed by estimated Jaccard similarity and
+merged into clusters.
+
+Every component Pre populate creates starts from the same skeleton, so that
+skeleton is not evidence of copying: files still in the untouched template
+shape are left out, and shingles of the template are ignored when the rest
+of a file is compared.
+
+Signatures are computed in one pass on a process pool:
+
+    python app_dupes.py <library>... [--workspace <libraries dir>] [--threshold 0.8]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple
+
+from app_vcomp import CATEGORIES, Document, Node, parse, render_vcomp
+
+NUM_PERM = 32
+BANDS    = 8            # NUM_PERM / BANDS rows per band
+SHINGLE  = 4
+_PRIME   = (1 << 61) - 1
+_rng     = random.Random(0x5EED)
+_PERMS   = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+
+
+class Signature(NamedTuple):
+    path: str
+    exact: str
+    minhash: tuple[int, ...]
+
+
+class Cluster(NamedTuple):
+    paths: list[str]
+    exact: bool             # all members normalize identically
+    similarity: float       # lowest estimated Jaccard between linked members
+
+
+# ── normalization ───────────────────────────────────────────────────────
+_WORD_RE = re.compile(r"\w+")
+_SHAPED  = ("ArduinoInclude", "ArduinoClass")   # `'sub/X.h'` → `w/w.w`, `'ns::X<A>'` → `w::w<w>`
+
+
+def _node_tokens(n: Node) -> Iterator[str]:
+    for a in n.attrs:
+        # argument text is an identifier or a string: abstract it, keep arity
+        if a.name == "Category":
+            yield f"@{a.name}({','.join(a.args)})"
+        elif a.name in _SHAPED:
+            yield f"@{a.name}({','.join(_WORD_RE.sub('w', x.strip(chr(39))) for x in a.args)})"
+        else:
+            yield f"@{a.name}/{len(a.args)}"
+    yield f"{'+' if n.plus else ''}_:{n.type}{'=' if n.value else ''}"
+    if n.block:
+        yield "{"
+        for c in n.children:
+            yield from _node_tokens(c)
+        yield "}"
+
+
+def normalize(doc: Document) -> list[str]:
+    out: list[str] = []
+    for n in doc.nodes:
+        out.extend(_node_tokens(n))
+    return out
+
+
+def _h64(s: str) -> int:
+    return int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), "little")
+
+
+def _any_category(tokens: list[str]) -> list[str]:
+    return ["@Category" if t.startswith("@Category(") else t for t in tokens]
+
+
+def _shingles(tokens: list[str]) -> list[tuple[int, int]]:
+    """(hash, hash with the category abstracted) of every SHINGLE-token window."""
+    k = min(SHINGLE, len(tokens))
+    return [(_h64("\x1f".join(w)), _h64("\x1f".join(_any_category(w))))
+            for w in (tokens[i:i + k] for i in range(len(tokens) - k + 1))]
+
+
+# the Pre populate skeleton, with and without ArduinoLoopBegin
+_TEMPLATES = [normalize(parse(render_vcomp("N", "N", "N", "N.h", CATEGORIES[0], loop)))
+              for loop in (False, True)]
+_TEMPLATE_SHAPES   = [_any_category(t) for t in _TEMPLATES]
+_TEMPLATE_SHINGLES = {a for t in _TEMPLATES for _, a in _shingles(t)}
+
+
+def is_template(tokens: list[str]) -> bool:
+    """Still exactly what Pre populate wrote, up to names and category."""
+    return _any_category(tokens) in _TEMPLATE_SHAPES
+
+
+def minhash(tokens: list[str]) -> tuple[int, ...]:
+    pairs = _shingles(tokens)
+    # compare what was added to the skeleton, not the skeleton every file shares
+    shingles = {h for h, a in pairs if a not in _TEMPLATE_SHINGLES} or {h for h, _ in pairs}
+    return tuple(min((a * x + b) % _PRIME for x in shingles) for a, b in _PERMS)
+
+
+def signature(path: str) -> Signature | None:
+    """Worker entry point: parse, normalize and hash one file."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            tokens = normalize(parse(f.read()))
+    except (OSError, UnicodeDecodeError):
+        return None
+    if not tokens or is_template(tokens):
+        return None
+    exact = hashlib.sha1("\n".join(tokens).encode()).hexdigest()
+    return Signature(path, exact, minhash(tokens))
+
+
+# ── clustering ──────────────────────────────────────────────────────────
+def similarity(a: tuple[int, ...], b: tuple[int, ...]) -> float:
+    return sum(x == y for x, y in zip(a, b)) / len(a)
+
+
+def cluster(sigs: Iterable[Signature], threshold: float = 0.8) -> list[Cluster]:
+    sigs = list(sigs)
+    parent = list(range(len(sigs)))
+    low: dict[int, float] = {}
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(i: int, j: int, sim: float) -> None:
+        ri, rj = find(i), find(j)
+        if ri != rj:
+            parent[rj] = ri
+            low[ri] = min(sim, low.get(ri, 1.0), low.pop(rj, 1.0))
+
+    # exact duplicates first, then LSH candidates among the distinct shapes
+    by_exact: dict[str, list[int]] = defaultdict(list)
+    for i, s in enumerate(sigs):
+        by_exact[s.exact].append(i)
+    reps = []
+    for members in by_exact.values():
+        for j in members[1:]:
+            union(members[0], j, 1.0)
+        reps.append(members[0])
+
+    rows = NUM_PERM // BANDS
+    checked: set[tuple[int, int]] = set()
+    for band in range(BANDS):
+        buckets: dict[tuple[int, ...], list[int]] = defaultdict(list)
+        for i in reps:
+            buckets[sigs[i].minhash[band * rows:(band + 1) * rows]].append(i)
+        for members in buckets.values():
+            for x in range(len(members)):
+                for y in range(x + 1, len(members)):
+                    i, j = members[x], members[y]
+                    if (i, j) in checked:
+                        continue
+                    checked.add((i, j))
+                    sim = similarity(sigs[i].minhash, sigs[j].minhash)
+                    if sim >= threshold:
+                        union(i, j, sim)
+
+    groups: dict[int, list[int]] = defaultdict(list)
+    for i in range(len(sigs)):
+        groups[find(i)].append(i)
+    out = []
+    for root, members in groups.items():
+        if len(members) < 2:
+            continue
+        exact = len({sigs[i].exact for i in members}) == 1
+        out.append(Cluster(sorted(sigs[i].path for i in members), exact, low.get(root, 1.0)))
+    return sorted(out, key=lambda c: (-len(c.paths), c.paths[0]))
+
+
+# ── driver ──────────────────────────────────────────────────────────────
+def library_roots(workspace: Path) -> list[Path]:
+    """Every library under an Arduino `libraries` folder that has a Visuino/ dir."""
+    return sorted(p for p in workspace.iterdir() if (p / "Visuino").is_dir())
+
+
+def component_files(roots: Iterable[Path]) -> Iterator[str]:
+    for root in roots:
+        try:
+            with os.scandir(root / "Visuino") as it:
+                for e in it:
+                    if e.name.endswith(".vcomp"):
+                        yield e.path
+        except OSError:
+            continue
+
+
+def find_duplicates(roots: Iterable[Path], threshold: float = 0.8,
+                    workers: int | None = None) -> list[Cluster]:
+    files = list(component_files(roots))
+    if len(files) < 2:
+        return []
+    chunk = max(1, len(files) // ((workers or os.cpu_count() or 1) * 8))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        sigs = [s for s in pool.map(signature, files, chunksize=chunk) if s]
+    return cluster(sigs, threshold)
+
+
+def report(clusters: list[Cluster]) -> str:
+    if not clusters:
+        return "✅ No duplicate components found."
+    lines = [f"{len(clusters)} cluster(s) of similar components:"]
+    for c in clusters:
+        kind = "identical shape" if c.exact else f"≥{c.similarity:.0%} similar"
+        lines.append(f"\n[{len(c.paths)} files, {kind}]")
+        lines.extend(f"  {p}" for p in c.paths)
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Report near-duplicate .vcomp components.")
+    ap.add_argument("roots", nargs="*", type=Path, help="library roots")
+    ap.add_argument("--workspace", type=Path, help="scan every library in this folder")
+    ap.add_argument("--threshold", type=float, default=0.8)
+    ap.add_argument("--json", type=Path, help="also write clusters as JSON")
+    args = ap.parse_args(argv)
+
+    roots = list(args.roots) + (library_roots(args.workspace) if args.workspace else [])
+    clusters = find_duplicates(roots, args.threshold)
+    print(report(clusters))
+    if args.json:
+        args.json.write_text(json.dumps([c._asdict() for c in clusters], indent=1),
+                             encoding="utf-8")
+    return 1 if clusters else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,22 +16,21 @@ from pathlib import Path
 
 import PySimpleGUI as sg
 
+from app_cache import CACHE
+from app_vcomp import CATEGORIES, camel_to_title, render_header, render_vcomp, split_stem
+
 ######################################################################
 # helpers
 ######################################################################
 
 def _read_component_text(path: Path) -> str:
-    """Return the raw text of the component file (UTF-8)."""
+    """Return the raw text of the component file (UTF-8), via the shared cache."""
     try:
-        return path.read_text(encoding="utf-8")
+        return CACHE.text(path)
     except Exception as err:  # noqa: BLE001
         return f"⚠️  Could not read file: {err}"
 
 
-def _camel_to_title(s: str) -> str:
-    """Convert *CamelCase* → "Camel Case"."""
-    return re.sub(r"(?<!^)(?=[A-Z])", " ", s).strip()
-
 ######################################################################
 # main entry point
 ######################################################################
@@ -40,21 +39,13 @@ def open_editor(comp_path: Path) -> None:
     """Open a modal editor for a single `.vcomp` file."""
 
     # ── infer nickname/short-name from filename --------------------------------
-    stem_parts = comp_path.stem.split(".", 1)
-    if len(stem_parts) == 2:
-        nickname, short = stem_parts
-    else:
-        nickname, short = "", stem_parts[0]
+    nickname, short = split_stem(comp_path)
 
     namespace        = nickname or "MyNamespace"
-    disp_name_def    = _camel_to_title(short)
+    disp_name_def    = camel_to_title(short)
     create_name_def  = re.sub(r"\s+", "", disp_name_def)
     header_def       = f"{create_name_def}.h"
-    categories       = [
-        "TArduinoBooleanFlipFlopsToolbarCategory",
-        "TArduinoMathFunctionsToolbarCategory",
-        "TArduinoSignalSourcesToolbarCategory",
-    ]
+    categories       = CATEGORIES
 
     # ── UI layout -------------------------------------------------------------
     lhs = sg.Column(
@@ -93,24 +84,8 @@ def open_editor(comp_path: Path) -> None:
             category    = values["-CAT-"] or categories[0]
 
             # build .vcomp template
-            tmpl_lines = [
-                f"{namespace} : Namespace\n",
-                f"    [Name('{disp_name}')]\n",
-                f"    [CreateName('{create_name}')]\n",
-                f"    [ArduinoInclude( '{header_file}' )]\n",
-            ]
-            if loop_flag:
-                tmpl_lines.append("    [ArduinoLoopBegin]\n")
-            tmpl_lines.extend([
-                f"    [ArduinoClass( '{namespace}::{create_name}' )]\n",
-                f"    [Category( {category} )]\n\n",
-                f"        +TArduino{create_name}: TArduinoComponent\n\n",
-                "            InputPin : TOWArduinoDigitalSinkPin\n",
-                "            OutputPin : TOWArduinoDigitalSourcePin\n\n",
-                "        ; // TArduinoComponent\n\n\n",
-                f"; // {namespace}\n",
-            ])
-            new_text = "".join(tmpl_lines)
+            new_text = render_vcomp(namespace, disp_name, create_name,
+                                    header_file, category, loop_flag)
 
             # write .vcomp
             try:
@@ -125,29 +100,9 @@ def open_editor(comp_path: Path) -> None:
             src_dir.mkdir(parents=True, exist_ok=True)
             header_path = src_dir / header_file
             if not header_path.exists():
-                content = f"""
-#pragma once
-
-#include <Mitov.h>
-
-namespace {namespace}
-{{
-  template <typename T_OutputPin>
-  class {create_name} : public T_OutputPin
-  {{
-    _V_PIN_( OutputPin )
-
-    // Inputs and outputs will be added later via editor
-
-    inline void InputPin_o_Receive(void* _Data)
-    {{
-      // placeholder
-    }}
-  }};
-}}
-"""
+                content = render_header(namespace, create_name)
                 try:
-                    header_path.write_text(content.strip() + "\n", encoding="utf-8")
+                    header_path.write_text(content, encoding="utf-8")
                 except Exception as exc:
                     sg.popup_error(f"Failed to create header file:\n{exc}")
 
@@ -0,0 +1,177 @@
+"""
+Example sketches: `examples/<Component>/<Component>.ino` for every component.
+
+Each sketch includes the component's `ArduinoInclude` header and instantiates
+its `ArduinoClass` (output pins become template arguments, as in the headers
+Pre populate writes), so opening or compiling the examples smoke-tests the
+whole library. Sketches are rendered from the parsed component model through
+templates compiled once at import.
+
+`<library>/.vtpc/examples.json` remembers each `.vcomp`'s (size, mtime) and
+the sketches it produced. Unchanged components cost one `stat`; changed ones
+are re-rendered, but a sketch is only rewritten when its text differs, and
+sketches of deleted components are removed. Sketches are named after
+`CreateName`; when two components would write the same sketch, the first
+file (by name) keeps it and the other is reported as an error.
+
+    python app_examples.py <library> [--nick NICK]
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+import app_templates
+from app_library import CACHE_DIRNAME
+from app_vcomp import ComponentInfo, iter_components
+
+EXAMPLES_DIR = "examples"
+_VERSION = 1            # bump when the templates change
+
+
+class ExamplesResult(NamedTuple):
+    written: int
+    unchanged: int
+    removed: int
+    errors: list[str]
+
+
+# ── templates ───────────────────────────────────────────────────────────
+_SKETCH = app_templates.compile("""\
+// Smoke test for {name}, generated from {source}.
+// Regenerated whenever the component changes; edit the component, not this file.
+
+#include <Mitov.h>
+#include <{include}>
+
+{decl}
+
+void setup()
+{{
+}}
+
+void loop()
+{{
+{loop}}}
+""")
+_DECL = app_templates.compile("{cls}{args} Component;")
+_LOOP = app_templates.compile("  Component.SystemLoopBegin();\n")
+
+
+def sketch_name(c: ComponentInfo) -> str:
+    return c.create_name or c.class_name.removeprefix("TArduino")
+
+
+def render_sketch(c: ComponentInfo, source: str) -> str:
+    outs = [f"Mitov::{p.type}" for p in c.pins if p.direction == "out"]
+    cls = c.arduino_class or f"{c.namespace}::{sketch_name(c)}"
+    return _SKETCH({
+        "name": c.name or c.class_name, "source": source, "include": c.include,
+        "decl": _DECL({"cls": cls, "args": f"<{', '.join(outs)}>" if outs else ""}),
+        "loop": _LOOP({}) if c.loop_begin else "",
+    })
+
+
+# ── generation ──────────────────────────────────────────────────────────
+def _cache_path(root: Path) -> Path:
+    return root / CACHE_DIRNAME / "examples.json"
+
+
+def _load(root: Path) -> dict[str, list]:
+    try:
+        data = json.loads(_cache_path(root).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data.get("files", {}) if data.get("version") == _VERSION else {}
+
+
+def _write_if_changed(path: Path, text: str) -> bool:
+    try:
+        if path.read_text(encoding="utf-8") == text:
+            return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+    return True
+
+
+def generate_examples(root: Path, nick: str = "") -> ExamplesResult:
+    from app_cache import CACHE
+    from app_library import stat_components
+    examples = root / EXAMPLES_DIR
+    old, new = _load(root), {}
+    written = unchanged = removed = 0
+    errors: list[str] = []
+    owner: dict[str, str] = {}          # sketch → the .vcomp that generates it
+    for _, path, size, mtime in sorted(stat_components(root, nick),
+                                       key=lambda c: os.path.basename(c[1])):
+        name = os.path.basename(path)
+        prev = old.get(name)
+        if prev is not None and prev[:2] == [size, mtime] and all(
+                s not in owner and (examples / s / f"{s}.ino").exists() for s in prev[2]):
+            new[name] = prev
+            owner.update(dict.fromkeys(prev[2], name))
+            unchanged += len(prev[2])
+            continue
+        try:
+            comps = [c for c in iter_components(CACHE.model(Path(path))) if c.include]
+        except (OSError, UnicodeDecodeError) as e:
+            errors.append(f"{name}: {e}")
+            continue
+        sketches, clash = [], False
+        for c in comps:
+            s = sketch_name(c)
+            if s in owner:
+                errors.append(f"{name}: sketch {s} is already generated from {owner[s]}; "
+                              f"give {c.class_name} another CreateName")
+                clash = True
+                continue
+            owner[s] = name
+            if _write_if_changed(examples / s / f"{s}.ino", render_sketch(c, name)):
+                written += 1
+            else:
+                unchanged += 1
+            sketches.append(s)
+        # a clash is not cached, so it is reported again until it is fixed
+        new[name] = [None, None, sketches] if clash else [size, mtime, sketches]
+
+    # sketches this stage wrote earlier whose component is gone
+    keep = {s for *_, sketches in new.values() for s in sketches}
+    for *_, sketches in old.values():
+        for s in sketches:
+            if s not in keep and (examples / s).is_dir():
+                shutil.rmtree(examples / s, ignore_errors=True)
+                keep.add(s)
+                removed += 1
+
+    _cache_path(root).parent.mkdir(exist_ok=True)
+    _cache_path(root).write_text(json.dumps({"version": _VERSION, "files": new}),
+                                 encoding="utf-8")
+    return ExamplesResult(written, unchanged, removed, errors)
+
+
+def summarize(r: ExamplesResult) -> str:
+    icon = "⚠️" if r.errors else "🧪"
+    return (f"{icon} Examples: {r.written} written, {r.unchanged} up to date, "
+            f"{r.removed} removed, {len(r.errors)} error(s).")
+
+
+if __name__ == "__main__":
+    import argparse
+    ap = argparse.ArgumentParser(description="Generate one example sketch per component.")
+    ap.add_argument("root", type=Path)
+    ap.add_argument("--nick", default="")
+    args = ap.parse_args()
+    res = generate_examples(args.root.expanduser(), args.nick)
+    for err in res.errors:
+        print(err)
+    print(summarize(res))
+    sys.exit(1 if res.errors else 0)
@@ -0,0 +1,160 @@
+"""
+Catalog export: one row per component of a library or a whole workspace.
+
+Rows are streamed from the component index (`app_index.walk`) straight into a
+JSON Lines or CSV file as folders are walked, so memory stays flat whatever
+the size of the library. With several workers, files are parsed on a process
+pool in fixed-size batches, and only a bounded window of batches is in flight;
+rows still come out in folder order.
+
+    python app_export.py <library or workspace>... -o catalog.jsonl|.csv|-
+                         [--format jsonl|csv] [--nick NICK] [--workers N]
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple
+
+from app_index import Entry, entries_for, walk
+from app_library import header_files, stat_components
+
+FIELDS = ("library", "comp", "namespace", "class_name", "name", "category", "include",
+          "has_header", "pins", "size", "mtime_ns", "path")
+FORMATS = ("jsonl", "csv")
+BATCH   = 256           # files per pool task
+AHEAD   = 4             # batches in flight per worker
+
+
+class ExportResult(NamedTuple):
+    path: str
+    rows: int
+    libraries: int
+    seconds: float
+
+
+def libraries(target: Path) -> list[Path]:
+    """`target` itself if it is a library, else the libraries directly inside it."""
+    if (target / "Visuino").is_dir():
+        return [target]
+    try:
+        with os.scandir(target) as it:
+            return sorted(Path(e.path) for e in it
+                          if e.is_dir() and os.path.isdir(os.path.join(e.path, "Visuino")))
+    except OSError:
+        return []
+
+
+# ── rows ────────────────────────────────────────────────────────────────
+def _parse_batch(batch: list[tuple[str, str, int, int]]) -> list[Entry]:
+    """Pool worker: index rows of a few files; `has_header` is set by the caller."""
+    return [e for item in batch for e in entries_for(*item, None)]
+
+
+def _pooled(root: Path, nick: str, pool: ProcessPoolExecutor, window: int) -> Iterator[Entry]:
+    headers = header_files(root)
+    files = stat_components(root, nick)
+    batches = iter(lambda: list(islice(files, BATCH)), [])
+    q = deque(pool.submit(_parse_batch, b) for b in islice(batches, window))
+    while q:
+        rows = q.popleft().result()
+        q.extend(pool.submit(_parse_batch, b) for b in islice(batches, 1))
+        for e in rows:
+            yield e._replace(has_header=bool(e.include) and e.include in headers)
+
+
+def rows(targets: Iterable[Path], nick: str = "", workers: int = 1) -> Iterator[dict]:
+    """Catalog rows of every library under `targets`, in folder order."""
+    pool = ProcessPoolExecutor(workers) if workers > 1 else None
+    try:
+        for target in targets:
+            for lib in libraries(target):
+                entries = walk(lib, nick) if pool is None else _pooled(lib, nick, pool,
+                                                                       workers * AHEAD)
+                for e in entries:
+                    yield {"library": lib.name, "comp": e.comp, "namespace": e.namespace,
+                           "class_name": e.class_name, "name": e.name, "category": e.category,
+                           "include": e.include, "has_header": e.has_header,
+                           "pins": [p._asdict() for p in e.pins],
+                           "size": e.size, "mtime_ns": e.mtime_ns, "path": e.path}
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+
+# ── writers ─────────────────────────────────────────────────────────────
+def _write_jsonl(f, it: Iterable[dict]) -> int:
+    n = 0
+    for row in it:
+        f.write(json.dumps(row, ensure_ascii=False))
+        f.write("\n")
+        n += 1
+    return n
+
+
+def _write_csv(f, it: Iterable[dict]) -> int:
+    w = csv.DictWriter(f, FIELDS)
+    w.writeheader()
+    n = 0
+    for row in it:
+        row["pins"] = ";".join(f"{p['name']}:{p['type']}:{p['direction']}" for p in row["pins"])
+        w.writerow(row)
+        n += 1
+    return n
+
+
+def guess_format(out: str) -> str:
+    return "csv" if out.lower().endswith(".csv") else "jsonl"
+
+
+def export(targets: Iterable[Path], out: str, fmt: str | None = None, nick: str = "",
+           workers: int = 1) -> ExportResult:
+    """Stream the catalog to `out` ("-" for stdout); files are replaced atomically."""
+    t0 = time.perf_counter()
+    targets = list(targets)
+    fmt = fmt or guess_format(out)
+    write = _write_csv if fmt == "csv" else _write_jsonl
+    it = rows(targets, nick, workers)
+    if out == "-":
+        n = write(sys.stdout, it)
+    else:
+        tmp = f"{out}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8", newline="",
+                      buffering=io.DEFAULT_BUFFER_SIZE * 16) as f:
+                n = write(f, it)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+        os.replace(tmp, out)
+    libs = sum(len(libraries(t)) for t in targets)
+    return ExportResult(out, n, libs, time.perf_counter() - t0)
+
+
+def summarize(r: ExportResult) -> str:
+    return (f"🗂 Exported {r.rows} component(s) from {r.libraries} librar"
+            f"{'y' if r.libraries == 1 else 'ies'} to {Path(r.path).name} in {r.seconds:.1f} s.")
+
+
+if __name__ == "__main__":
+    import argparse
+    ap = argparse.ArgumentParser(description="Export a component catalog as JSON Lines or CSV.")
+    ap.add_argument("targets", nargs="+", type=Path, help="libraries or folders of libraries")
+    ap.add_argument("-o", "--out", default="-", help="output file, or - for stdout")
+    ap.add_argument("--format", choices=FORMATS)
+    ap.add_argument("--nick", default="")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = ap.parse_args()
+    res = export([t.expanduser() for t in args.targets], args.out, args.format, args.nick,
+                 args.workers)
+    print(summarize(res), file=sys.stderr)
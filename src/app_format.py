@@ -0,0 +1,293 @@
+"""
+Canonical `.vcomp` formatter.
+
+Works on the token stream one source line at a time, so memory does not grow
+with the file. The canonical layout is the one the Pre populate template
+writes:
+
+* namespaces and their closing `;` at column 0; attributes one level (4
+  spaces) in from their enclosing block, declarations below namespace level
+  one more level in (class at 8, pins at 12);
+* one attribute or declaration per line, `+Name: Type` for classes and
+  `Name : Type [= value]` otherwise;
+* runs of spaces inside a line collapse to one, `,` is followed by a space,
+  comments are kept and trailing whitespace is dropped;
+* at most two consecutive blank lines, none at the start or end, `\\n` line
+  endings and a final newline.
+
+A file is only rewritten when its formatted text differs, which is checked by
+comparing the formatted stream against the file as it is produced. Files that
+do not tokenize into declarations are reported and left alone. For library
+roots, `.vtpc/format.json` remembers the (size, mtime) of files already in
+canonical form, so a rerun only tokenizes files touched since.
+
+    python app_format.py <library or file>... [--check] [--workers N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple
+
+from app_library import CACHE_DIRNAME
+from app_vcomp import COMMENT, ERROR, NAME, NEWLINE, PUNCT, Token, tokenize_lines
+
+INDENT    = 4
+MAX_BLANK = 2
+_VERSION  = 1           # bump when the canonical form changes
+
+
+class FormatError(ValueError):
+    def __init__(self, line: int, message: str) -> None:
+        super().__init__(f"line {line + 1}: {message}")
+        self.line = line
+
+
+class FormatResult(NamedTuple):
+    path: str
+    changed: bool
+    error: str = ""
+    stamp: tuple[int, int] | None = None    # (size, mtime_ns) once known canonical
+
+
+# ── formatting ──────────────────────────────────────────────────────────
+def _join(toks: list[Token]) -> str:
+    """Token text with any whitespace run between tokens collapsed to one space."""
+    out, end = [], None
+    for t in toks:
+        if out and t.value != "," and (t.col > end or out[-1] == ","):
+            out.append(" ")
+        out.append(t.value)
+        end = t.col + len(t.value)
+    return "".join(out)
+
+
+def _lines(tokens: Iterable[Token]) -> Iterator[list[Token]]:
+    line: list[Token] = []
+    for t in tokens:
+        if t.kind == NEWLINE:
+            yield line
+            line = []
+        else:
+            line.append(t)
+    if line:
+        yield line
+
+
+def _decl_indent(depth: int) -> str:
+    return " " * (0 if depth == 0 else INDENT * (depth + 1))
+
+
+def format_lines(lines: Iterable[str]) -> Iterator[str]:
+    """Yield the canonical form of `.vcomp` source, line by line."""
+    stack: list[bool] = []              # open blocks: is it a namespace?
+    blanks, started = 0, False
+
+    def emit(indent: str, text: str) -> str:
+        nonlocal blanks, started
+        head = "\n" * min(blanks, MAX_BLANK) if started else ""
+        blanks, started = 0, True
+        return f"{head}{indent}{text}\n"
+
+    for toks in _lines(tokenize_lines(lines)):
+        if not toks:
+            blanks += 1
+            continue
+        while toks:
+            t = toks[0]
+            if t.kind == ERROR:
+                raise FormatError(t.line, f"unexpected character {t.value!r}")
+            if t.kind == COMMENT:
+                yield emit(_decl_indent(len(stack)), t.value.rstrip())
+                break
+            if t.value == "[" and t.kind == PUNCT:
+                depth, end = 0, None
+                for i, u in enumerate(toks):
+                    if u.kind == PUNCT and u.value == "[":
+                        depth += 1
+                    elif u.kind == PUNCT and u.value == "]":
+                        depth -= 1
+                        if depth == 0:
+                            end = i
+                            break
+                if end is None:
+                    raise FormatError(t.line, "unclosed '['")
+                text, toks = _join(toks[:end + 1]), toks[end + 1:]
+            elif t.value == ";" and t.kind == PUNCT:
+                if not stack:
+                    raise FormatError(t.line, "';' without an open block")
+                stack.pop()
+                indent = _decl_indent(len(stack))
+                text, toks = ";", toks[1:]
+                if toks and toks[0].kind == COMMENT:
+                    text, toks = f"; {toks[0].value.rstrip()}", toks[1:]
+                yield emit(indent, text)
+                continue
+            elif t.kind == NAME or (t.value == "+" and t.kind == PUNCT):
+                plus = t.value == "+"
+                i = 1 if plus else 0
+                if (len(toks) < i + 3 or toks[i].kind != NAME or toks[i + 1].value != ":"
+                        or toks[i + 2].kind != NAME):
+                    raise FormatError(t.line, "expected 'Name : Type'")
+                name, typ = toks[i].value, toks[i + 2].value
+                text = f"+{name}: {typ}" if plus else f"{name} : {typ}"
+                toks = toks[i + 3:]
+                if toks and toks[0].value == "=":
+                    value = []
+                    toks = toks[1:]
+                    while toks and toks[0].kind != COMMENT:
+                        value.append(toks.pop(0))
+                    text += f" = {_join(value)}"
+                indent = _decl_indent(len(stack))
+                if plus or typ == "Namespace" or (stack and stack[-1]):
+                    stack.append(typ == "Namespace")
+                if toks and toks[0].kind == COMMENT:
+                    text, toks = f"{text} {toks[0].value.rstrip()}", toks[1:]
+                yield emit(indent, text)
+                continue
+            else:
+                raise FormatError(t.line, f"unexpected {t.value!r}")
+            # attribute: sits one level in from the enclosing block
+            if toks and toks[0].kind == COMMENT:
+                text, toks = f"{text} {toks[0].value.rstrip()}", toks[1:]
+            yield emit(" " * (INDENT * len(stack)), text)
+
+
+def format_text(text: str) -> str:
+    return "".join(format_lines(text.splitlines(keepends=True)))
+
+
+# ── files ───────────────────────────────────────────────────────────────
+def _matches(formatted: Iterator[str], f) -> bool:
+    """Compare a formatted stream with an open file without buffering either."""
+    for chunk in formatted:
+        if f.read(len(chunk)) != chunk:
+            return False
+    return f.read(1) == ""
+
+
+def _stamp(path: str) -> tuple[int, int]:
+    st = os.stat(path)
+    return st.st_size, st.st_mtime_ns
+
+
+def format_file(path: str, check: bool = False) -> FormatResult:
+    """Format one file in place (or only report with `check`)."""
+    tmp = os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.fmt")
+    try:
+        with open(path, encoding="utf-8", newline="") as src, \
+                open(path, encoding="utf-8", newline="") as cmp:
+            if _matches(format_lines(src), cmp):
+                return FormatResult(path, False, stamp=_stamp(path))
+        if check:
+            return FormatResult(path, True)
+        with open(path, encoding="utf-8", newline="") as src, \
+                open(tmp, "w", encoding="utf-8", newline="") as out:
+            out.writelines(format_lines(src))
+        os.replace(tmp, path)
+        return FormatResult(path, True, stamp=_stamp(path))
+    except (OSError, UnicodeDecodeError, FormatError) as e:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        return FormatResult(path, False, str(e))
+
+
+def vcomp_files(targets: Iterable[Path]) -> Iterator[str]:
+    """`.vcomp` files named directly or found under the given directories."""
+    for t in targets:
+        if t.is_file():
+            yield os.fspath(t)
+            continue
+        for dirpath, dirnames, filenames in os.walk(t):
+            dirnames[:] = [d for d in dirnames if d != CACHE_DIRNAME]
+            for name in filenames:
+                if name.endswith(".vcomp"):
+                    yield os.path.join(dirpath, name)
+
+
+def _format_check(path: str) -> FormatResult:
+    return format_file(path, check=True)
+
+
+def _load_stamps(path: Path) -> dict[str, list[int]]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data.get("files", {}) if data.get("version") == _VERSION else {}
+
+
+def format_tree(targets: Iterable[Path], check: bool = False,
+                workers: int | None = None) -> list[FormatResult]:
+    """Format every `.vcomp` under `targets` on a process pool."""
+    results: list[FormatResult] = []
+    todo: list[str] = []
+    stamps: list[tuple[Path, str, dict]] = []       # (cache file, path prefix, stamps)
+    for t in targets:
+        if t.is_file() or not (t / "Visuino").is_dir():
+            todo.extend(vcomp_files([t]))
+            continue
+        cache = t / CACHE_DIRNAME / "format.json"
+        known, fresh, prefix = _load_stamps(cache), {}, os.fspath(t) + os.sep
+        stamps.append((cache, prefix, fresh))
+        for path in vcomp_files([t]):
+            rel = path[len(prefix):]
+            try:
+                stamp = list(_stamp(path))
+            except OSError:
+                continue
+            if known.get(rel) == stamp:
+                fresh[rel] = stamp
+                results.append(FormatResult(path, False, stamp=tuple(stamp)))
+            else:
+                todo.append(path)
+
+    if todo:
+        chunk = max(1, len(todo) // ((workers or os.cpu_count() or 1) * 8))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            done = list(pool.map(_format_check if check else format_file, todo,
+                                 chunksize=chunk))
+        results.extend(done)
+        for r in done:
+            for _, prefix, fresh in stamps:
+                if r.stamp and r.path.startswith(prefix):
+                    fresh[r.path[len(prefix):]] = list(r.stamp)
+    for cache, _, fresh in stamps:
+        cache.parent.mkdir(exist_ok=True)
+        cache.write_text(json.dumps({"version": _VERSION, "files": fresh}), encoding="utf-8")
+    return results
+
+
+def summarize(results: list[FormatResult], check: bool = False) -> str:
+    changed = sum(r.changed for r in results)
+    errors = sum(bool(r.error) for r in results)
+    verb = "would be reformatted" if check else "reformatted"
+    icon = "⚠️" if errors else "✅"
+    return (f"{icon} {len(results)} file(s): {changed} {verb}, "
+            f"{len(results) - changed - errors} unchanged, {errors} skipped (errors).")
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Format .vcomp files canonically.")
+    ap.add_argument("targets", nargs="+", type=Path, help="libraries, folders or files")
+    ap.add_argument("--check", action="store_true", help="only report files that would change")
+    ap.add_argument("--workers", type=int)
+    args = ap.parse_args(argv)
+
+    results = format_tree(args.targets, args.check, args.workers)
+    for r in results:
+        if r.error:
+            print(f"{r.path}: {r.error}")
+        elif r.changed and args.check:
+            print(f"would reformat {r.path}")
+    print(summarize(results, args.check))
+    return 1 if any(r.error for r in results) or (args.check and any(r.changed for r in results)) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
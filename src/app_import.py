@@ -0,0 +1,278 @@
+"""
+Import an existing Arduino C++ library as draft Visuino components.
+
+The upstream library's headers (`src/` or its root) are scanned for public
+classes and their public methods. Each class becomes
+`Visuino/<nick>.<Class>.vcomp`, created and pre-populated exactly like the
+editor's Pre populate does (`app_bulk.prepopulate`), and its generated
+`SRC/` header is turned into a wrapper: it includes the upstream header, holds
+an instance of the class and lists the upstream methods to be mapped to pins.
+Components that already exist are left alone. A wrapper whose header name would
+shadow an upstream header (class `Servo` in `Servo.h`) is written as
+`<Namespace>_<Class>.h` instead. When two namespaces declare a
+class of the same name, the later one is named after its namespace as well
+(`ns2::Foo` → `Ns2Foo`).
+
+Header scanning runs on a process pool; findings are cached per header
+content hash in `<library>/.vtpc/import.json`, so re-importing an updated
+upstream library only re-scans headers that changed.
+
+    python app_import.py <arduino library> <visuino library> [--nick NICK]
+                         [--classes A,B] [--workers N]
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+
+from app_library import CACHE_DIRNAME, matching_brace
+from app_vcomp import component_path, default_fields
+
+HEADER_EXTS = (".h", ".hpp")
+_VERSION = 1            # bump when the scanner changes, invalidates cached scans
+
+
+class UpstreamClass(NamedTuple):
+    name: str               # qualified, e.g. `sensors::BMP280`
+    header: str             # include path relative to the upstream source folder
+    methods: list[str]      # public method signatures, constructors excluded
+    template: bool = False  # needs template arguments before it can be instantiated
+
+
+class ImportResult(NamedTuple):
+    created: list[str]
+    skipped: list[str]      # classes whose component already exists
+    scanned: int
+    cached: int
+    errors: list[str]
+
+
+# ── C++ scanning (process pool workers) ─────────────────────────────────
+_NOISE_RE  = re.compile(r'//[^\n]*|/\*.*?\*/|"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'|^\s*#[^\n]*',
+                        re.DOTALL | re.MULTILINE)
+_SCOPE_RE  = re.compile(r"\b(?:(namespace)\s+(\w+)|(class|struct)\s+(?:\w+\s+)*?(\w+)"
+                        r"(?:\s+final)?\s*(?::[^{;()]*)?)\s*\{")
+_ACCESS_RE = re.compile(r"\b(public|protected|private)\s*:(?!:)")
+_METHOD_RE = re.compile(r"^(?:template\s*<[^>]*>\s*)?(?P<ret>[\w:<>,\s*&]*?[\w>*&])\s+"
+                        r"(?P<name>~?\w+)\s*\((?P<args>[^()]*)\)\s*(?P<tail>[\w\s]*)$")
+_SKIP_RET  = {"return", "typedef", "using", "friend", "else", "delete", "new"}
+
+
+def _strip(text: str) -> str:
+    """Blank out comments, literals and preprocessor lines, keeping offsets."""
+    return _NOISE_RE.sub(lambda m: re.sub(r"[^\n]", " ", m.group(0)), text)
+
+
+def _flatten(body: str) -> str:
+    """`body` with nested `{...}` emptied, so only its own declarations remain."""
+    out, depth = [], 0
+    for c in body:
+        if c == "{":
+            if depth == 0:
+                out.append("{}")
+            depth += 1
+        elif c == "}":
+            depth -= 1
+        elif depth == 0:
+            out.append(c)
+    return "".join(out)
+
+
+def _public_methods(cls: str, body: str, is_struct: bool) -> list[str]:
+    flat, access, start, methods = _flatten(body), "public" if is_struct else "private", 0, []
+    sections = []
+    for m in _ACCESS_RE.finditer(flat):
+        sections.append((access, flat[start:m.start()]))
+        access, start = m.group(1), m.end()
+    sections.append((access, flat[start:]))
+    for access, text in sections:
+        if access != "public":
+            continue
+        for stmt in re.split(r";|\{\}", text):
+            stmt = " ".join(stmt.split())
+            stmt = re.sub(r"\s*=\s*(?:0|default|delete)$", "", stmt)
+            m = _METHOD_RE.match(stmt)
+            if not m or m.group("name") in (cls, f"~{cls}") or m.group("name").startswith("operator"):
+                continue
+            ret = re.sub(r"^(?:(?:static|virtual|inline|explicit|constexpr)\s+)+", "", m.group("ret"))
+            if ret in _SKIP_RET or ret.split()[0] in _SKIP_RET:
+                continue
+            tail = " const" if "const" in m.group("tail").split() else ""
+            methods.append(f"{ret} {m.group('name')}({m.group('args').strip()}){tail}")
+    return methods
+
+
+def scan_header(path: str, rel: str) -> list[UpstreamClass]:
+    """Classes with a body and at least one public method, declared in one header."""
+    with open(path, encoding="utf-8", errors="replace") as f:
+        text = _strip(f.read())
+    found: list[UpstreamClass] = []
+
+    def walk(lo: int, hi: int, scope: list[str]) -> None:
+        pos = lo
+        while (m := _SCOPE_RE.search(text, pos, hi)) is not None:
+            close = matching_brace(text, m.end() - 1)
+            if close < 0 or close > hi:
+                return
+            if m.group(1):
+                walk(m.end(), close, [*scope, m.group(2)])
+            elif not text[:m.start()].rstrip().endswith("enum"):
+                name = m.group(4)
+                methods = _public_methods(name, text[m.end():close], m.group(3) == "struct")
+                if methods:             # plain data structs make no component
+                    found.append(UpstreamClass("::".join([*scope, name]), rel, methods,
+                                               text[:m.start()].rstrip().endswith(">")))
+            pos = close + 1
+
+    walk(0, len(text), [])
+    return found
+
+
+# ── discovery and cache ─────────────────────────────────────────────────
+def upstream_headers(lib: Path) -> tuple[Path, list[Path]]:
+    """(include root, headers): Arduino 1.5 layout keeps sources under `src/`."""
+    base = lib / "src" if (lib / "src").is_dir() else lib
+    headers = sorted(p for p in base.rglob("*") if p.suffix in HEADER_EXTS and p.is_file()
+                     and not {"examples", "extras", "test", "tests"} & set(p.relative_to(base).parts))
+    return base, headers
+
+
+def _cache_path(root: Path) -> Path:
+    return root / CACHE_DIRNAME / "import.json"
+
+
+def _load_cache(root: Path) -> dict:
+    try:
+        data = json.loads(_cache_path(root).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data.get("headers", {}) if data.get("version") == _VERSION else {}
+
+
+def scan_library(lib: Path, root: Path,
+                 workers: int | None = None) -> tuple[list[UpstreamClass], int, list[str]]:
+    """Classes of every upstream header; returns (classes, cached count, errors)."""
+    base, headers = upstream_headers(lib)
+    cache, fresh, errors = _load_cache(root), {}, []
+    keys, todo = {}, []
+    for h in headers:
+        rel = h.relative_to(base).as_posix()
+        keys[rel] = hashlib.sha256(rel.encode() + b"\0" + h.read_bytes()).hexdigest()
+        if keys[rel] in cache:
+            fresh[keys[rel]] = cache[keys[rel]]
+        else:
+            todo.append((os.fspath(h), rel))
+    if todo:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futs = [(rel, pool.submit(scan_header, path, rel)) for path, rel in todo]
+            for rel, fut in futs:
+                try:
+                    fresh[keys[rel]] = [list(c) for c in fut.result()]
+                except (OSError, ValueError, RecursionError) as e:
+                    errors.append(f"{rel}: {e}")
+    _cache_path(root).parent.mkdir(parents=True, exist_ok=True)
+    _cache_path(root).write_text(json.dumps({"version": _VERSION, "headers": fresh}),
+                                 encoding="utf-8")
+    classes = [UpstreamClass(*c) for rel in keys if keys[rel] in fresh for c in fresh[keys[rel]]]
+    return classes, len(headers) - len(todo), errors
+
+
+# ── component generation ────────────────────────────────────────────────
+def wrap_header(text: str, create_name: str, cls: UpstreamClass) -> str:
+    """Turn a Pre populate header skeleton into a wrapper around `cls`."""
+    text = text.replace("#include <Mitov.h>\n", f"#include <Mitov.h>\n#include <{cls.header}>\n", 1)
+    m = re.search(rf"\b(class|struct)\s+{re.escape(create_name)}\b[^{{;]*\{{", text)
+    if not m:
+        return text
+    member = f"::{cls.name} FInstance;"
+    if cls.template:
+        member = f"// ::{cls.name}<...> FInstance;  (fill in the template arguments)"
+    lines = [f"\n  public:\n    {member}\n"]
+    if cls.methods:
+        lines.append("\n    // Upstream methods to map to pins:\n")
+        lines.extend(f"    //   {sig}\n" for sig in cls.methods)
+    # the skeleton's own members keep the access they had before the insert
+    lines.append("\n  private:" if m.group(1) == "class" else "\n  public:")
+    return text[:m.end()] + "".join(lines) + text[m.end():]
+
+
+def import_class(root: Path, nick: str, cls: UpstreamClass, comp: str | None = None,
+                 upstream: set[str] = frozenset()) -> bool:
+    """
+    Create and pre-populate one component; False if it already exists.
+    `upstream` holds the lower-cased include paths of the upstream headers,
+    which the wrapper's own header name must not shadow.
+    """
+    import app_bulk
+    comp = comp or cls.name.rsplit("::", 1)[-1]
+    path = component_path(root, nick, comp)
+    try:
+        path.touch(exist_ok=False)
+    except FileExistsError:
+        return False
+    f = default_fields(path)
+    if f["header_file"].lower() in upstream:
+        f["header_file"] = f"{f['namespace']}_{f['header_file']}"
+    header = root / "SRC" / f["header_file"]
+    fresh_header = not header.exists()
+    app_bulk.prepopulate(root, nick, comp, f["header_file"])
+    if fresh_header:
+        header.write_text(wrap_header(header.read_text(encoding="utf-8"), f["create_name"], cls),
+                          encoding="utf-8")
+    return True
+
+
+def import_library(lib: Path, root: Path, nick: str = "", classes: list[str] | None = None,
+                   workers: int | None = None) -> ImportResult:
+    found, cached, errors = scan_library(lib, root, workers)
+    base, headers = upstream_headers(lib)
+    upstream = {h.relative_to(base).as_posix().lower() for h in headers}
+    (root / "Visuino").mkdir(parents=True, exist_ok=True)
+    created, skipped, names = [], [], {}        # component name → qualified class
+    for cls in found:
+        short = cls.name.rsplit("::", 1)[-1]
+        if cls.name in names.values() or (classes and short not in classes
+                                          and cls.name not in classes):
+            continue
+        comp = short
+        if comp in names:                       # `ns1::Foo` took it: `ns2::Foo` → `Ns2Foo`
+            comp = "".join(p[:1].upper() + p[1:] for p in cls.name.split("::"))
+        if comp in names:
+            errors.append(f"{cls.name}: component name {comp} is taken by {names[comp]}")
+            continue
+        names[comp] = cls.name
+        try:
+            (created if import_class(root, nick, cls, comp, upstream) else skipped).append(comp)
+        except OSError as e:
+            errors.append(f"{comp}: {e}")
+    return ImportResult(created, skipped, len(headers), cached, errors)
+
+
+def summarize(r: ImportResult) -> str:
+    icon = "⚠️" if r.errors else "📥"
+    return (f"{icon} Imported {len(r.created)} component(s), {len(r.skipped)} already present; "
+            f"{r.scanned} header(s) ({r.cached} cached), {len(r.errors)} error(s).")
+
+
+if __name__ == "__main__":
+    import argparse
+    ap = argparse.ArgumentParser(description="Wrap an Arduino library's classes as Visuino components.")
+    ap.add_argument("lib", type=Path, help="upstream Arduino library folder")
+    ap.add_argument("root", type=Path, help="Visuino library root (contains Visuino/ and SRC/)")
+    ap.add_argument("--nick", default="")
+    ap.add_argument("--classes", default="", help="comma-separated class names to import")
+    ap.add_argument("--workers", type=int)
+    args = ap.parse_args()
+    res = import_library(args.lib.expanduser(), args.root.expanduser(), args.nick,
+                         [c for c in args.classes.split(",") if c], args.workers)
+    for err in res.errors:
+        print(err)
+    print(summarize(res))
+    sys.exit(1 if res.errors else 0)
@@ -0,0 +1,107 @@
+"""
+Component index of one library: a flat row per component, refreshed by delta.
+
+`walk()` streams rows straight from the folder (constant memory, for exports).
+`ComponentIndex.refresh()` re-stats the folder, re-parses only files whose
+size/mtime changed (through the shared parse cache) and returns a `Delta`
+that consumers such as the statistics dashboard fold into their aggregates
+instead of rescanning.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterator, NamedTuple
+
+from app_cache import CACHE
+from app_library import header_files, stat_components
+from app_vcomp import Pin, iter_components
+
+
+class Entry(NamedTuple):
+    comp: str               # short name as listed in -COMPLIST-
+    path: str
+    size: int
+    mtime_ns: int
+    namespace: str = ""
+    class_name: str = ""    # "" for files that declare no component yet
+    name: str = ""
+    category: str = ""
+    include: str = ""
+    pins: tuple[Pin, ...] = ()
+    has_header: bool = False
+
+
+class Delta(NamedTuple):
+    added: list[Entry]
+    removed: list[Entry]
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed)
+
+
+# ── scanning ────────────────────────────────────────────────────────────
+def entries_for(comp: str, path: str, size: int, mtime_ns: int,
+                headers: set[str] | None) -> list[Entry]:
+    """Parse one file into its index rows (one per component)."""
+    base = Entry(comp, path, size, mtime_ns)
+    try:
+        doc = CACHE.model(Path(path))
+    except (OSError, UnicodeDecodeError):
+        return [base]
+    rows = [base._replace(namespace=c.namespace, class_name=c.class_name, name=c.name,
+                          category=c.category, include=c.include, pins=tuple(c.pins),
+                          has_header=headers is not None and c.include in headers)
+            for c in iter_components(doc)]
+    return rows or [base]
+
+
+def walk(root: Path, nick: str) -> Iterator[Entry]:
+    """Stream index rows without building the whole index."""
+    headers = header_files(root)
+    for comp, path, size, mtime in stat_components(root, nick):
+        yield from entries_for(comp, path, size, mtime, headers)
+
+
+# ── incremental index ───────────────────────────────────────────────────
+class ComponentIndex:
+    def __init__(self, root: Path, nick: str) -> None:
+        self.root, self.nick = root, nick
+        self._files: dict[str, tuple[int, int, list[Entry]]] = {}   # path → (size, mtime, rows)
+        self._headers: set[str] = set()
+
+    def __len__(self) -> int:
+        return sum(len(rows) for *_, rows in self._files.values())
+
+    def entries(self) -> Iterator[Entry]:
+        for *_, rows in self._files.values():
+            yield from rows
+
+    def refresh(self) -> Delta:
+        added: list[Entry] = []
+        removed: list[Entry] = []
+        headers = header_files(self.root)
+        headers_changed = headers != self._headers
+        self._headers = headers
+
+        seen = set()
+        for comp, path, size, mtime in stat_components(self.root, self.nick):
+            seen.add(path)
+            old = self._files.get(path)
+            if old is not None and old[0] == size and old[1] == mtime:
+                if not headers_changed:
+                    continue
+                rows = [r._replace(has_header=bool(r.include) and r.include in headers)
+                        for r in old[2]]
+                if rows == old[2]:
+                    continue
+            else:
+                rows = entries_for(comp, path, size, mtime, headers)
+            if old is not None:
+                removed.extend(old[2])
+            added.extend(rows)
+            self._files[path] = (size, mtime, rows)
+
+        for path in self._files.keys() - seen:
+            removed.extend(self._files.pop(path)[2])
+        return Delta(added, removed)
@@ -0,0 +1,142 @@
+"""
+Install a library into the Arduino libraries folder, rsync style.
+
+The files that make up a library (the same set `app_package` zips: `SRC/`,
+`Visuino/`, `examples/`, `library.properties`, `visuino.library`) are synced
+into `<libraries>/<Library>/`:
+
+* a file whose size and mtime match the installed copy is skipped;
+* same size but a different mtime is ambiguous, both sides are hashed and
+  only a real difference is copied (otherwise the mtime is just carried over,
+  so the next run decides by `stat` alone);
+* everything else is copied on a thread pool to a temporary name next to its
+  target and renamed over it, so Visuino never sees a half-written file;
+* installed files that no longer exist in the source are deleted.
+
+    python app_install.py <library> [--to <libraries folder>] [--workers N]
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+
+from app_package import CHUNK, PACKAGE_DIRS, collect
+
+
+class InstallResult(NamedTuple):
+    dest: Path
+    copied: int
+    deleted: int
+    unchanged: int
+    hashed: int         # ambiguous files that had to be compared by content
+    bytes_copied: int
+    seconds: float
+
+
+def default_libraries() -> Path:
+    from app_workdir import _default_arduino_lib_dir
+    return _default_arduino_lib_dir()
+
+
+def _sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(CHUNK):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _installed(dest: Path) -> dict[str, tuple[str, os.stat_result]]:
+    """rel path → (path, stat) of what is installed now."""
+    return {arc.split("/", 1)[1]: (p, st) for arc, p, st in collect(dest)}
+
+
+def _copy(src: str, dst: str, st: os.stat_result) -> int:
+    """Copy with a temp name + rename; the copy keeps the source's mtime."""
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    tmp = os.path.join(os.path.dirname(dst), f".{os.path.basename(dst)}.install")
+    try:
+        shutil.copyfile(src, tmp)
+        os.utime(tmp, ns=(st.st_atime_ns, st.st_mtime_ns))
+        os.replace(tmp, dst)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+    return st.st_size
+
+
+def _same_content(src: str, dst: str, st: os.stat_result) -> bool:
+    if _sha256(src) != _sha256(dst):
+        return False
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+    return True
+
+
+def _prune(dest: Path) -> None:
+    """Remove folders the deletions left empty."""
+    for sub in PACKAGE_DIRS:
+        for dirpath, dirnames, filenames in os.walk(dest / sub, topdown=False):
+            if not dirnames and not filenames and Path(dirpath) != dest / sub:
+                try:
+                    os.rmdir(dirpath)
+                except OSError:
+                    pass
+
+
+def install_library(root: Path, libraries: Path | None = None,
+                    workers: int | None = None) -> InstallResult:
+    t0 = time.perf_counter()
+    root = Path(root)
+    libraries = Path(libraries) if libraries else default_libraries()
+    dest = libraries / root.name
+    if dest.resolve() == root.resolve():
+        raise ValueError(f"{root.name} already lives in {libraries}; nothing to install.")
+
+    source = {arc.split("/", 1)[1]: (p, st) for arc, p, st in collect(root)}
+    installed = _installed(dest)
+    copy, ambiguous, unchanged = [], [], 0
+    for rel, (path, st) in source.items():
+        have = installed.get(rel)
+        if have is None or have[1].st_size != st.st_size:
+            copy.append((path, os.path.join(dest, rel), st))
+        elif have[1].st_mtime_ns == st.st_mtime_ns:
+            unchanged += 1
+        else:
+            ambiguous.append((path, have[0], st))
+    stale = [p for rel, (p, _) in installed.items() if rel not in source]
+
+    copied_bytes = 0
+    with ThreadPoolExecutor(max_workers=workers or min(32, (os.cpu_count() or 1) + 4)) as pool:
+        same = list(pool.map(lambda a: _same_content(*a), ambiguous))
+        unchanged += sum(same)
+        copy.extend(a for a, s in zip(ambiguous, same) if not s)
+        copied_bytes = sum(pool.map(lambda a: _copy(*a), copy))
+    for p in stale:
+        os.unlink(p)
+    if stale:
+        _prune(dest)
+    return InstallResult(dest, len(copy), len(stale), unchanged, len(ambiguous),
+                         copied_bytes, time.perf_counter() - t0)
+
+
+def summarize(r: InstallResult) -> str:
+    return (f"📲 Installed to {r.dest}: {r.copied} copied ({r.bytes_copied / 1e6:.1f} MB), "
+            f"{r.deleted} deleted, {r.unchanged} unchanged ({r.hashed} hashed) "
+            f"in {r.seconds:.2f} s.")
+
+
+if __name__ == "__main__":
+    import argparse
+    ap = argparse.ArgumentParser(description="Sync a library into the Arduino libraries folder.")
+    ap.add_argument("root", type=Path)
+    ap.add_argument("--to", type=Path, help="libraries folder (default: the Arduino one)")
+    ap.add_argument("--workers", type=int)
+    args = ap.parse_args()
+    print(summarize(install_library(args.root.expanduser(), args.to, args.workers)))
@@ -0,0 +1,62 @@
+"""
+Layout of a library folder, shared by every module that walks one.
+
+`CACHE_DIRNAME` is the per-library folder the incremental stages keep their
+state in. `stat_components()` lists the `.vcomp` files under `Visuino/` with
+their (size, mtime) stamps, `header_files()` the headers under `SRC/`, and
+`matching_brace()` finds the end of a class or namespace body in one.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Iterator
+
+CACHE_DIRNAME = ".vtpc"
+
+
+def _short(stem: str, nick: str) -> str:
+    return stem[len(nick) + 1:] if nick and stem.startswith(nick + ".") else stem
+
+
+def stat_components(root: Path, nick: str) -> Iterator[tuple[str, str, int, int]]:
+    """(short name, path, size, mtime_ns) for each `.vcomp` of the library."""
+    try:
+        it = os.scandir(root / "Visuino")
+    except OSError:
+        return
+    with it:
+        for e in it:
+            if not e.name.endswith(".vcomp") or (nick and not e.name.startswith(nick)):
+                continue
+            try:
+                st = e.stat()
+            except OSError:
+                continue
+            yield _short(e.name[:-len(".vcomp")], nick), e.path, st.st_size, st.st_mtime_ns
+
+
+def header_files(root: Path) -> set[str]:
+    """SRC-relative paths of every header, with `/` separators."""
+    src = os.path.join(root, "SRC")
+    cut, out = len(src) + 1, set()
+    for dirpath, _, filenames in os.walk(src):
+        rel = dirpath[cut:].replace(os.sep, "/")
+        prefix = f"{rel}/" if rel else ""
+        out.update(prefix + n for n in filenames if n.endswith(".h"))
+    return out
+
+
+def matching_brace(text: str, open_at: int) -> int:
+    """Index of the `}` closing the `{` at `open_at`, or -1 if it is unbalanced."""
+    depth = 0
+    for i in range(open_at, len(text)):
+        c = text[i]
+        if c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth == 0:
+                return i
+    return -1
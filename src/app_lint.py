@@ -0,0 +1,318 @@
+"""
+Configurable lint rules for `.vcomp` components.
+
+Rules are plain functions `(LintContext) -> Iterable[Diagnostic]` registered
+with `@rule(name, version)`; more can come from modules listed under
+`"plugins"` in `<library>/vcomp-lint.json`, which register theirs the same way
+on import. Every file is parsed once (through the shared parse cache) and all
+enabled rules run over that one `Document`; headers a rule needs are read at
+most once per file through `LintContext.header()`.
+
+Results are cached in `<library>/.vtpc/lint.json` under a key of (file hash,
+ruleset version). The ruleset version covers the configuration and every
+enabled rule's version, and each entry also records the hashes of the headers
+it looked at, so re-linting after one edit only re-runs that file. Header
+hashes are stamped with (size, mtime), so checking them costs a `stat` per
+distinct header per run and only changed headers are read again.
+
+    python app_lint.py <library> [--nick NICK] [--workers N]
+
+Configuration (all keys optional):
+
+    {"disable": ["loop-begin"],
+     "create_name": "^[A-Z][A-Za-z0-9]*$",
+     "required": ["Name", "CreateName", "ArduinoInclude", "ArduinoClass", "Category"],
+     "forbidden_categories": ["TArduinoMathFunctionsToolbarCategory"],
+     "plugins": ["my_lint_rules"]}
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import json
+import os
+import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, NamedTuple
+
+from app_cache import CACHE
+from app_library import CACHE_DIRNAME, matching_brace
+from app_vcomp import ComponentInfo, Diagnostic, Document, Node, iter_components
+
+CONFIG_NAME = "vcomp-lint.json"
+DEFAULTS = {
+    "disable": [],
+    "create_name": r"^[A-Z][A-Za-z0-9]*$",
+    "required": ["Name", "CreateName", "ArduinoInclude", "ArduinoClass", "Category"],
+    "forbidden_categories": [],
+    "plugins": [],
+}
+_VERSION = 1            # bump when the runner or cache layout changes
+
+
+class LintResult(NamedTuple):
+    path: str
+    diagnostics: list[tuple[Diagnostic, str]]   # (diagnostic, rule name)
+    cached: bool
+    error: str = ""
+
+
+class LintContext:
+    """What a rule sees: one parsed file plus lazily read headers."""
+
+    def __init__(self, root: Path, path: Path, doc: Document, config: dict) -> None:
+        self.root, self.path, self.doc, self.config = root, path, doc, config
+        self.components: list[ComponentInfo] = list(iter_components(doc))
+        self.deps: dict[str, str | None] = {}       # SRC-relative header → sha256
+        self._headers: dict[str, str | None] = {}
+
+    def node(self, comp: ComponentInfo) -> Node:
+        return next(n for ns in self.doc.nodes for n in ns.children
+                    if n.line == comp.line and n.name == comp.class_name)
+
+    def header(self, include: str) -> str | None:
+        """Text of `SRC/<include>` (None if missing); recorded as a cache dependency."""
+        if include not in self._headers:
+            try:
+                data = (self.root / "SRC" / include).read_bytes()
+            except OSError:
+                data = None
+            self.deps[include] = hashlib.sha256(data).hexdigest() if data is not None else None
+            self._headers[include] = data.decode("utf-8", "replace") if data is not None else None
+        return self._headers[include]
+
+
+Rule = Callable[[LintContext], Iterable[Diagnostic]]
+RULES: dict[str, tuple[Rule, int]] = {}     # name → (rule, version)
+
+
+def rule(name: str, version: int = 1) -> Callable[[Rule], Rule]:
+    """Register a lint rule; bump `version` whenever its verdicts change."""
+    def register(fn: Rule) -> Rule:
+        RULES[name] = (fn, version)
+        return fn
+    return register
+
+
+# ── built-in rules ──────────────────────────────────────────────────────
+@rule("create-name")
+def create_name(ctx: LintContext) -> Iterable[Diagnostic]:
+    pattern = re.compile(ctx.config["create_name"])
+    for c in ctx.components:
+        if c.create_name and not pattern.search(c.create_name):
+            a = ctx.node(c).attr("CreateName")
+            yield Diagnostic(a.line, 0, f"CreateName {c.create_name!r} does not match "
+                                        f"{pattern.pattern!r}", "warning")
+
+
+@rule("required-attrs")
+def required_attrs(ctx: LintContext) -> Iterable[Diagnostic]:
+    for c in ctx.components:
+        cls = ctx.node(c)
+        for name in ctx.config["required"]:
+            if cls.attr(name) is None:
+                yield Diagnostic(c.line, 0, f"{c.class_name}: missing [{name}]", "warning")
+
+
+@rule("forbidden-category")
+def forbidden_category(ctx: LintContext) -> Iterable[Diagnostic]:
+    banned = set(ctx.config["forbidden_categories"])
+    for c in ctx.components:
+        if c.category in banned:
+            yield Diagnostic(ctx.node(c).attr("Category").line, 0,
+                             f"Category {c.category} is not allowed here")
+
+
+_LOOP_RE = re.compile(r"\bSystemLoopBegin\s*\(")
+
+
+def _class_body(text: str, create_name: str) -> str | None:
+    m = re.search(rf"\bclass\s+{re.escape(create_name)}\b[^{{;]*\{{", text)
+    if not m:
+        return None
+    close = matching_brace(text, m.end() - 1)
+    return text[m.end():close] if close >= 0 else None
+
+
+@rule("loop-begin")
+def loop_begin(ctx: LintContext) -> Iterable[Diagnostic]:
+    """`[ArduinoLoopBegin]` iff the header class defines `SystemLoopBegin()`."""
+    for c in ctx.components:
+        if not c.include or not c.create_name:
+            continue
+        text = ctx.header(c.include)
+        body = _class_body(text, c.create_name) if text is not None else None
+        if body is None:
+            continue                    # missing header/class is validate()'s business
+        has_loop = bool(_LOOP_RE.search(body))
+        if c.loop_begin and not has_loop:
+            a = ctx.node(c).attr("ArduinoLoopBegin")
+            yield Diagnostic(a.line, 0, f"[ArduinoLoopBegin] but {c.include} has no "
+                                        f"SystemLoopBegin() in {c.create_name}", "warning")
+        elif has_loop and not c.loop_begin:
+            yield Diagnostic(c.line, 0, f"{c.create_name}::SystemLoopBegin() is never called: "
+                                        f"add [ArduinoLoopBegin]", "warning")
+
+
+# ── configuration ───────────────────────────────────────────────────────
+def load_config(root: Path, problems: list[str] | None = None) -> dict:
+    """
+    `vcomp-lint.json` merged over `DEFAULTS`; plugins are imported here.
+    An unreadable file or plugin is skipped and described in `problems`.
+    """
+    problems = [] if problems is None else problems
+    config = dict(DEFAULTS)
+    try:
+        data = json.loads((root / CONFIG_NAME).read_text(encoding="utf-8"))
+        if not isinstance(data, dict):
+            raise ValueError("expected a JSON object")
+        config.update(data)
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        problems.append(f"{CONFIG_NAME} ignored, using the defaults: {e}")
+    for name in config["plugins"]:
+        try:
+            importlib.import_module(name)
+        except ImportError as e:
+            problems.append(f"plugin {name} not loaded: {e}")
+    return config
+
+
+def ruleset_version(config: dict) -> str:
+    enabled = sorted((n, v) for n, (_, v) in RULES.items() if n not in config["disable"])
+    blob = json.dumps([_VERSION, enabled, config], sort_keys=True).encode()
+    return hashlib.sha256(blob).hexdigest()[:16]
+
+
+# ── running ─────────────────────────────────────────────────────────────
+class Linter:
+    """Lint files of one library against its configuration, reusing cached verdicts."""
+
+    def __init__(self, root: Path, config: dict | None = None) -> None:
+        self.root = root
+        self.config_problems: list[str] = []
+        self.config = config if config is not None else load_config(root, self.config_problems)
+        self.version = ruleset_version(self.config)
+        self.rules = [(n, fn) for n, (fn, _) in RULES.items() if n not in self.config["disable"]]
+        self.cache_path = root / CACHE_DIRNAME / "lint.json"
+        data = self._load()
+        self._old: dict[str, dict] = data.get("files", {}) if data.get("ruleset") == self.version else {}
+        self._new: dict[str, dict] = {}
+        self._stamps: dict[str, list] = data.get("headers", {})   # include → [size, mtime, sha]
+        self._shas: dict[str, str | None] = {}                     # this run's header hashes
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict:
+        try:
+            return json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _header_sha(self, include: str) -> str | None:
+        """sha256 of `SRC/<include>`, hashed at most once per run and only when its stamp moved."""
+        with self._lock:
+            if include in self._shas:
+                return self._shas[include]
+        path = self.root / "SRC" / include
+        try:
+            st = path.stat()
+            old = self._stamps.get(include)
+            if old is not None and old[:2] == [st.st_size, st.st_mtime_ns]:
+                sha = old[2]
+            else:
+                sha = hashlib.sha256(path.read_bytes()).hexdigest()
+                with self._lock:
+                    self._stamps[include] = [st.st_size, st.st_mtime_ns, sha]
+        except OSError:
+            sha = None
+        with self._lock:
+            self._shas[include] = sha
+        return sha
+
+    def _deps_current(self, deps: dict[str, str | None]) -> bool:
+        return all(self._header_sha(include) == sha for include, sha in deps.items())
+
+    def lint(self, path: Path) -> LintResult:
+        try:
+            text = CACHE.text(path)
+        except (OSError, UnicodeDecodeError) as e:
+            return LintResult(os.fspath(path), [], False, str(e))
+        key = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        entry = self._old.get(key)
+        cached = entry is not None and self._deps_current(entry["deps"])
+        if not cached:
+            ctx = LintContext(self.root, path, CACHE.model(path), self.config)
+            diags = []
+            for name, fn in self.rules:
+                try:
+                    diags.extend([*d, name] for d in fn(ctx))
+                except Exception as e:  # noqa: BLE001 - a broken plugin must not stop the run
+                    diags.append([0, 0, f"rule crashed: {e}", "error", name])
+            entry = {"deps": ctx.deps, "diags": sorted(diags)}
+            for include in ctx.deps:        # stamp them, so the next run only stats
+                self._header_sha(include)
+        with self._lock:
+            self._new[key] = entry
+        return LintResult(os.fspath(path),
+                          [(Diagnostic(*d[:4]), d[4]) for d in entry["diags"]], cached)
+
+    def save(self) -> None:
+        """Write the verdicts of this run; entries for files not linted are dropped."""
+        try:
+            self.cache_path.parent.mkdir(exist_ok=True)
+            headers = {h: s for h, s in self._stamps.items() if h in self._shas}
+            self.cache_path.write_text(json.dumps({"ruleset": self.version, "files": self._new,
+                                                   "headers": headers}), encoding="utf-8")
+        except OSError:
+            pass
+
+
+def lint_library(root: Path, nick: str = "", workers: int | None = None,
+                 config: dict | None = None) -> list[LintResult]:
+    """Lint every component of the library on a thread pool."""
+    from app_library import stat_components
+    linter = Linter(root, config)
+    paths = sorted(Path(p) for _, p, *_ in stat_components(root, nick))
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+        results = list(pool.map(linter.lint, paths))
+    linter.save()
+    if linter.config_problems:
+        results.insert(0, LintResult(os.fspath(root / CONFIG_NAME),
+                                     [(Diagnostic(0, 0, p, "error"), "config")
+                                      for p in linter.config_problems], False))
+    return results
+
+
+def summarize(results: list[LintResult]) -> str:
+    if not results:
+        return "ℹ️ No components to lint."
+    findings = sum(len(r.diagnostics) for r in results)
+    files = sum(bool(r.diagnostics or r.error) for r in results)
+    cached = sum(r.cached for r in results)
+    if findings or files:
+        return (f"⚠️ {findings} finding(s) in {files} of {len(results)} file(s) "
+                f"({cached} cached).")
+    return f"✅ {len(results)} file(s) clean ({cached} cached)."
+
+
+if __name__ == "__main__":
+    import argparse
+    ap = argparse.ArgumentParser(description="Lint Visuino components.")
+    ap.add_argument("root", type=Path)
+    ap.add_argument("--nick", default="")
+    ap.add_argument("--workers", type=int)
+    args = ap.parse_args()
+    res = lint_library(args.root.expanduser(), args.nick, args.workers)
+    for r in res:
+        name = Path(r.path).name
+        if r.error:
+            print(f"{name}: error: {r.error}")
+        for d, rule_name in r.diagnostics:
+            print(f"{name}:{d.line + 1}: {d.severity}: {d.message} [{rule_name}]")
+    print(summarize(res))
+    sys.exit(1 if any(r.error or r.diagnostics for r in res) else 0)
@@ -0,0 +1,103 @@
+"""
+Bounded in-memory log for the GUI console, mirrored to a rotating file.
+
+`LogModel.append` is cheap and thread-safe: it stores the line in a fixed-size
+ring buffer and hands it to a background `QueueListener` that owns the file.
+The GUI polls `dirty` and renders only the tail, at most every `RENDER_EVERY`
+seconds, so a burst of thousands of messages costs one redraw.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+
+LOG_FILE     = Path.home() / ".vtpc" / "app.log"
+RENDER_EVERY = 0.1      # seconds between console redraws
+TAIL_LINES   = 200      # lines pushed to the widget per redraw
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """Drop records instead of blocking (or raising) when the writer lags."""
+
+    def __init__(self, q: queue.Queue) -> None:
+        super().__init__(q)
+        self.dropped = 0
+
+    def enqueue(self, record) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class LogModel:
+    def __init__(self, capacity: int = 5000, log_file: Path | None = LOG_FILE,
+                 max_bytes: int = 1 << 20, backups: int = 3, queue_size: int = 10000) -> None:
+        self._lines: deque[str] = deque(maxlen=capacity)
+        self._lock     = threading.Lock()
+        self._seq      = 0          # bumped on every append
+        self._rendered = 0          # _seq at the last render
+        self._last     = 0.0
+        self._listener = None
+        self._handler  = None
+        self._logger   = logging.getLogger(f"vtpc.console.{id(self)}")
+        self._logger.propagate = False
+        self._logger.setLevel(logging.INFO)
+        if log_file is not None:
+            try:
+                log_file.parent.mkdir(parents=True, exist_ok=True)
+                fh = RotatingFileHandler(log_file, maxBytes=max_bytes,
+                                         backupCount=backups, encoding="utf-8")
+            except OSError:
+                return              # console still works without a file
+            fh.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+            self._handler  = _DroppingQueueHandler(queue.Queue(maxsize=queue_size))
+            self._listener = QueueListener(self._handler.queue, fh)
+            self._logger.addHandler(self._handler)
+            self._listener.start()
+
+    # ── producers (any thread) ───────────────────────────────────────
+    def append(self, msg: str) -> None:
+        with self._lock:
+            for line in str(msg).splitlines() or [""]:
+                self._lines.append(line)
+            self._seq += 1
+        if self._handler is not None:
+            self._logger.info(msg)
+
+    # ── consumer (GUI thread) ────────────────────────────────────────
+    @property
+    def dirty(self) -> bool:
+        return self._seq != self._rendered
+
+    @property
+    def dropped(self) -> int:
+        """Records that never reached the log file because the writer lagged."""
+        return self._handler.dropped if self._handler is not None else 0
+
+    def tail(self, n: int = TAIL_LINES) -> list[str]:
+        with self._lock:
+            k = min(n, len(self._lines))
+            return [self._lines[i] for i in range(len(self._lines) - k, len(self._lines))]
+
+    def render(self, element, force: bool = False) -> bool:
+        """Push the tail into a Multiline if dirty and the rate limit allows."""
+        now = time.monotonic()
+        if not self.dirty or (not force and now - self._last < RENDER_EVERY):
+            return False
+        self._rendered, self._last = self._seq, now
+        element.update("\n".join(self.tail()))
+        return True
+
+    def close(self) -> None:
+        if self._listener is not None:
+            self._listener.stop()
+            for h in self._listener.handlers:
+                h.close()
+            self._listener = None
@@ -0,0 +1,166 @@
+"""
+Merkle fingerprint of a library's `SRC/` and `Visuino/` trees.
+
+Each file is hashed (SHA-256) and each folder's hash covers its children's
+names and hashes, so two copies of a library are equal exactly when their root
+hashes are. The tree is stored as `visuino.manifest` next to
+`visuino.library`; rebuilding it re-hashes only files whose size or mtime
+changed, everything else comes from the previous manifest.
+
+`compare()` refreshes both manifests and walks them together, descending only
+into folders whose hashes differ, so two large copies that differ in one file
+cost two stats per file and one comparison per folder on the changed path.
+
+    python app_merkle.py <library>              # refresh, print the root hash
+    python app_merkle.py <library> <other copy> # list what differs
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Iterator, NamedTuple
+
+from app_library import CACHE_DIRNAME
+
+MANIFEST = "visuino.manifest"
+TREES    = ("SRC", "Visuino")
+_FORMAT  = 1
+_BLOCK   = 1 << 20
+
+
+class Change(NamedTuple):
+    path: str           # relative to the library root, posix separators
+    kind: str           # "added" | "removed" | "changed" (seen from `a` to `b`)
+
+
+# ── building ────────────────────────────────────────────────────────────
+def _file_hash(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(_BLOCK):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _dir_hash(children: dict[str, dict]) -> str:
+    h = hashlib.sha256()
+    for name in sorted(children):
+        c = children[name]
+        h.update(f"{name}\0{'d' if 'c' in c else 'f'}\0{c['h']}\n".encode())
+    return h.hexdigest()
+
+
+def _build_dir(path: str, old: dict | None, stats: list[int]) -> dict:
+    """Node for one folder; `stats` counts [files, rehashed]."""
+    old_children = (old or {}).get("c", {})
+    children: dict[str, dict] = {}
+    try:
+        it = os.scandir(path)
+    except OSError:
+        return {"h": _dir_hash({}), "c": {}}
+    with it:
+        for e in it:
+            if e.name == CACHE_DIRNAME:
+                continue
+            prev = old_children.get(e.name)
+            if e.is_dir(follow_symlinks=False):
+                sub = prev if prev and "c" in prev else None
+                children[e.name] = _build_dir(e.path, sub, stats)
+                continue
+            if not e.is_file():
+                continue
+            try:
+                st = e.stat()
+                stats[0] += 1
+                if prev and "c" not in prev and prev["s"] == st.st_size \
+                        and prev["m"] == st.st_mtime_ns:
+                    children[e.name] = prev
+                    continue
+                digest = _file_hash(e.path)
+            except OSError:
+                continue
+            stats[1] += 1
+            children[e.name] = {"h": digest, "s": st.st_size, "m": st.st_mtime_ns}
+    return {"h": _dir_hash(children), "c": children}
+
+
+def load(root: Path) -> dict | None:
+    try:
+        data = json.loads((root / MANIFEST).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return data if data.get("format") == _FORMAT else None
+
+
+def update(root: Path) -> tuple[dict, int]:
+    """Refresh and save `visuino.manifest`; returns (tree, files re-hashed)."""
+    prev = (load(root) or {}).get("tree", {})
+    stats = [0, 0]
+    children = {t: _build_dir(os.path.join(root, t), prev.get("c", {}).get(t), stats)
+                for t in TREES if (root / t).is_dir()}
+    tree = {"h": _dir_hash(children), "c": children}
+    if stats[1] or tree["h"] != prev.get("h"):     # new hashes or new mtimes to remember
+        tmp = root / f"{MANIFEST}.tmp"
+        tmp.write_text(json.dumps({"format": _FORMAT, "tree": tree}, separators=(",", ":")),
+                       encoding="utf-8")
+        os.replace(tmp, root / MANIFEST)
+    return tree, stats[1]
+
+
+def fingerprint(root: Path) -> str:
+    """Root hash of the library, refreshing the manifest first."""
+    return update(root)[0]["h"]
+
+
+# ── comparing ───────────────────────────────────────────────────────────
+def diff_trees(a: dict, b: dict, prefix: str = "") -> Iterator[Change]:
+    """Differences between two manifest trees, skipping subtrees with equal hashes."""
+    if a["h"] == b["h"]:
+        return
+    ac, bc = a.get("c", {}), b.get("c", {})
+    for name in sorted(ac.keys() | bc.keys()):
+        path = f"{prefix}{name}"
+        x, y = ac.get(name), bc.get(name)
+        if y is None:
+            yield from _every(x, path, "removed")
+        elif x is None:
+            yield from _every(y, path, "added")
+        elif ("c" in x) != ("c" in y):
+            yield from _every(x, path, "removed")
+            yield from _every(y, path, "added")
+        elif "c" in x:
+            yield from diff_trees(x, y, f"{path}/")
+        elif x["h"] != y["h"]:
+            yield Change(path, "changed")
+
+
+def _every(node: dict, path: str, kind: str) -> Iterator[Change]:
+    if "c" not in node:
+        yield Change(path, kind)
+        return
+    for name in sorted(node["c"]):
+        yield from _every(node["c"][name], f"{path}/{name}", kind)
+
+
+def compare(a: Path, b: Path) -> list[Change]:
+    """What changed going from copy `a` to copy `b`."""
+    return list(diff_trees(update(a)[0], update(b)[0]))
+
+
+if __name__ == "__main__":
+    args = [Path(p).expanduser() for p in sys.argv[1:]]
+    if len(args) == 1:
+        tree, rehashed = update(args[0])
+        print(f"🔑 {tree['h']} ({rehashed} file(s) re-hashed)")
+        sys.exit(0)
+    if len(args) != 2:
+        sys.exit("usage: app_merkle.py <library> [<other copy>]")
+    changes = compare(*args)
+    for c in changes:
+        print(f"{c.kind:8} {c.path}")
+    print(f"{'✅ Identical' if not changes else f'⚠️ {len(changes)} difference(s)'}.")
+    sys.exit(1 if changes else 0)
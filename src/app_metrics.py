@@ -0,0 +1,162 @@
+"""
+Event-loop latency instrumentation for `canvas_app.run_app`.
+
+Per event we record the time spent in `window.read()`, the part of that spent
+building the values dict (`PySimpleGUI._BuildResults`) and the time spent in
+`WorkdirWidget.handle_event`, per event key. Samples go into HDR-style
+log-linear histograms (about 1 % relative precision, fixed memory per decade)
+that can be dumped to JSON or shown in a small live overlay.
+
+Disabled profilers cost one attribute test per event, so the hooks stay in
+production builds. Enable with `VTPC_PROFILE=1` (and `VTPC_PROFILE_OVERLAY=1`
+for the overlay).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+
+_SUB_BITS = 7                   # 2**7 sub-buckets per power of two
+
+PROFILE_DIR = Path.home() / ".vtpc"
+
+
+class Histogram:
+    """Log-linear histogram of non-negative integer samples (microseconds)."""
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self.counts: dict[int, int] = {}
+        self.count = self.total = 0
+        self.min = self.max = 0
+
+    @staticmethod
+    def _index(v: int) -> int:
+        if v < (1 << _SUB_BITS):
+            return v
+        shift = v.bit_length() - _SUB_BITS
+        return (shift << (_SUB_BITS - 1)) + (v >> shift)
+
+    @staticmethod
+    def _bounds(idx: int) -> tuple[int, int]:
+        if idx < (1 << _SUB_BITS):
+            return idx, idx
+        shift = (idx >> (_SUB_BITS - 1)) - 1
+        m = idx - (shift << (_SUB_BITS - 1))
+        return m << shift, ((m + 1) << shift) - 1
+
+    def record(self, v: int) -> None:
+        i = self._index(v)
+        self.counts[i] = self.counts.get(i, 0) + 1
+        if not self.count or v < self.min:
+            self.min = v
+        if v > self.max:
+            self.max = v
+        self.count += 1
+        self.total += v
+
+    def percentile(self, p: float) -> int:
+        if not self.count:
+            return 0
+        rank, seen = max(1, round(self.count * p / 100)), 0
+        for i in sorted(self.counts):
+            seen += self.counts[i]
+            if seen >= rank:
+                lo, hi = self._bounds(i)
+                return min(max((lo + hi) // 2, self.min), self.max)
+        return self.max
+
+    def to_dict(self) -> dict:
+        return {
+            "unit": "us", "count": self.count, "min": self.min, "max": self.max,
+            "mean": round(self.total / self.count, 1) if self.count else 0,
+            **{f"p{str(p).replace('.', '')}": self.percentile(p) for p in (50, 90, 99, 99.9)},
+            "buckets": [[self._bounds(i)[0], self.counts[i]] for i in sorted(self.counts)],
+        }
+
+
+class EventProfiler:
+    """Collects read / build / handle timings for the main event loop."""
+
+    def __init__(self, enabled: bool | None = None) -> None:
+        if enabled is None:
+            enabled = os.environ.get("VTPC_PROFILE", "") not in ("", "0")
+        self.enabled = enabled
+        self.overlay = enabled and os.environ.get("VTPC_PROFILE_OVERLAY", "") not in ("", "0")
+        self.read    = Histogram()
+        self.idle    = Histogram()      # reads that ended in a timeout, no event
+        self.build   = Histogram()
+        self.handle: dict[str, Histogram] = {}
+        self._build_ns = 0
+        self._orig     = None
+
+    # ── hooks ────────────────────────────────────────────────────────
+    def install(self, sg_module) -> None:
+        """Wrap `_BuildResults` so the values-dict time can be split out."""
+        if not self.enabled or self._orig is not None:
+            return
+        self._orig = orig = sg_module._BuildResults
+        clock = time.perf_counter_ns
+
+        def timed(*args, **kwargs):
+            t = clock()
+            try:
+                return orig(*args, **kwargs)
+            finally:
+                self._build_ns += clock() - t
+
+        sg_module._BuildResults = timed
+
+    def uninstall(self, sg_module) -> None:
+        if self._orig is not None:
+            sg_module._BuildResults = self._orig
+            self._orig = None
+
+    def record(self, event, t_read: int, t_handle: int, t_end: int,
+               idle: bool = False) -> None:
+        """
+        Timestamps (perf_counter_ns) around `read()` and `handle_event()`.
+        `idle` reads timed out without an event; they go to their own
+        histogram so the wait does not swamp the read latency.
+        """
+        read_ns = t_handle - t_read
+        build_ns, self._build_ns = self._build_ns, 0
+        if idle:
+            self.idle.record(read_ns // 1000)
+            return
+        self.read.record(read_ns // 1000)
+        self.build.record(build_ns // 1000)
+        if t_end > t_handle:
+            key = str(event)
+            h = self.handle.get(key)
+            if h is None:
+                h = self.handle[key] = Histogram()
+            h.record((t_end - t_handle) // 1000)
+
+    # ── output ───────────────────────────────────────────────────────
+    def to_dict(self) -> dict:
+        return {
+            "read":   self.read.to_dict(),
+            "idle":   self.idle.to_dict(),
+            "build":  self.build.to_dict(),
+            "handle": {k: h.to_dict() for k, h in sorted(self.handle.items())},
+        }
+
+    def dump(self, path: Path | None = None) -> Path:
+        if path is None:
+            path = PROFILE_DIR / time.strftime("profile-%Y%m%d-%H%M%S.json")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=1), encoding="utf-8")
+        return path
+
+    def summary(self, top: int = 3) -> str:
+        """Short text for the live overlay."""
+        worst = sorted(self.handle.items(), key=lambda kv: kv[1].percentile(99), reverse=True)
+        parts = [f"read p99 {self.read.percentile(99) / 1000:.1f} ms",
+                 f"build p99 {self.build.percentile(99) / 1000:.2f} ms"]
+        parts += [f"{k} p99 {h.percentile(99) / 1000:.1f} ms" for k, h in worst[:top]]
+        return " │ ".join(parts)
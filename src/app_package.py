@@ -0,0 +1,289 @@
+"""
+Package a library into a distributable zip.
+
+`SRC/`, `Visuino/`, `examples/`, `library.properties` and `visuino.library`
+are streamed into `<libraries>/<Library>.zip` under a top-level `<Library>/`
+folder. Files are read in fixed-size chunks that are deflated in parallel
+(each chunk is an independent raw-deflate segment ending on a byte boundary,
+so the segments simply concatenate), and the writer keeps only a bounded
+window of chunks in memory.
+
+A manifest in `<library>/.vtpc/package.json` remembers, per entry, the file's
+size, mtime, SHA-256 and where its compressed bytes sit in the previous zip.
+Unchanged files are copied over from there raw, without recompressing, so a
+repackage costs roughly one sequential copy plus the changed files.
+
+    python app_package.py <library> [-o out.zip] [--level 6]
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import struct
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Iterator, NamedTuple
+
+from app_library import CACHE_DIRNAME
+
+PACKAGE_DIRS = ("SRC", "Visuino", "examples")
+CHUNK    = 1 << 20          # bytes per deflate job
+AHEAD    = 4                # chunks in flight per worker
+_FORMAT  = 1
+_ZIP64   = (1 << 31) - 1    # same threshold as zipfile.ZIP64_LIMIT
+_MAX32   = 0xFFFFFFFF
+_UTF8    = 0x0800
+_DEFLATE = 8
+
+
+class PackageResult(NamedTuple):
+    path: Path
+    files: int
+    reused: int
+    bytes_in: int
+    bytes_out: int
+    seconds: float
+
+
+def default_output(root: Path) -> Path:
+    return root.parent / f"{root.name}.zip"
+
+
+def _manifest_path(root: Path) -> Path:
+    return root / CACHE_DIRNAME / "package.json"
+
+
+# ── input ───────────────────────────────────────────────────────────────
+def collect(root: Path) -> list[tuple[str, str, os.stat_result]]:
+    """(arcname, path, stat) for every file that goes into the package."""
+    out, base = [], os.fspath(root)
+    for sub in PACKAGE_DIRS:
+        for dirpath, dirnames, filenames in os.walk(os.path.join(base, sub)):
+            dirnames[:] = sorted(d for d in dirnames if d != CACHE_DIRNAME)
+            for name in sorted(filenames):
+                p = os.path.join(dirpath, name)
+                out.append((p, os.stat(p)))
+    for name in ("library.properties", "visuino.library"):
+        p = os.path.join(base, name)
+        if os.path.isfile(p):
+            out.append((p, os.stat(p)))
+    cut, top = len(base) + 1, root.name
+    return [(f"{top}/{p[cut:].replace(os.sep, '/')}", p, st) for p, st in out]
+
+
+def _sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(CHUNK):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _deflate(data: bytes, last: bool, level: int) -> bytes:
+    c = zlib.compressobj(level, zlib.DEFLATED, -15)
+    return c.compress(data) + c.flush(zlib.Z_FINISH if last else zlib.Z_FULL_FLUSH)
+
+
+def _dos_time(mtime: float) -> tuple[int, int]:
+    t = time.localtime(mtime)
+    if t.tm_year < 1980:
+        return 0, (1 << 5) | 1
+    return ((t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2),
+            ((t.tm_year - 1980) << 9) | (t.tm_mon << 5) | t.tm_mday)
+
+
+def _load_manifest(root: Path, out: Path, level: int) -> dict:
+    """Entries of the previous package, if that zip is still the one we wrote."""
+    try:
+        m = json.loads(_manifest_path(root).read_text(encoding="utf-8"))
+        st = out.stat()
+    except (OSError, ValueError):
+        return {}
+    if (m.get("format") != _FORMAT or m.get("level") != level
+            or m.get("package") != os.fspath(out)
+            or [m.get("size"), m.get("mtime_ns")] != [st.st_size, st.st_mtime_ns]):
+        return {}
+    return m.get("entries", {})
+
+
+# ── zip writer ──────────────────────────────────────────────────────────
+class _ZipWriter:
+    """Minimal streaming zip writer (deflate only, ZIP64 when needed)."""
+
+    def __init__(self, f) -> None:
+        self.f = f
+        self.central: list[tuple] = []    # (arc, crc, csize, usize, offset, dostime, dosdate)
+
+    def _local(self, arc: bytes, crc: int, csize: int, usize: int, big: bool,
+               dostime: int, dosdate: int) -> None:
+        extra = struct.pack("<HHQQ", 1, 16, usize, csize) if big else b""
+        self.f.write(struct.pack("<IHHHHHIIIHH", 0x04034b50, 45 if big else 20, _UTF8,
+                                 _DEFLATE, dostime, dosdate, crc,
+                                 _MAX32 if big else csize, _MAX32 if big else usize,
+                                 len(arc), len(extra)))
+        self.f.write(arc)
+        self.f.write(extra)
+
+    def begin(self, arc: str, st: os.stat_result) -> tuple:
+        """Write a placeholder header; returns the state `end()` patches."""
+        name, big = arc.encode(), st.st_size > _ZIP64
+        offset = self.f.tell()
+        dt = _dos_time(st.st_mtime)
+        self._local(name, 0, 0, st.st_size, big, *dt)
+        return name, big, offset, self.f.tell(), dt
+
+    def end(self, state: tuple, crc: int, usize: int) -> tuple[int, int]:
+        """Patch sizes/CRC into the header; returns (csize, data offset)."""
+        name, big, offset, data, dt = state
+        pos = self.f.tell()
+        csize = pos - data
+        self.f.seek(offset)
+        self._local(name, crc, csize, usize, big, *dt)
+        self.f.seek(pos)
+        self.central.append((name, crc, csize, usize, offset, *dt))
+        return csize, data
+
+    def copy(self, arc: str, st: os.stat_result, crc: int, csize: int,
+             src, src_offset: int) -> int:
+        """Append an entry whose compressed bytes are copied raw from `src`."""
+        name, big = arc.encode(), st.st_size > _ZIP64
+        offset = self.f.tell()
+        dt = _dos_time(st.st_mtime)
+        self._local(name, crc, csize, st.st_size, big, *dt)
+        data = self.f.tell()
+        src.seek(src_offset)
+        left = csize
+        while left:
+            block = src.read(min(left, CHUNK))
+            if not block:
+                raise OSError("previous package is truncated")
+            self.f.write(block)
+            left -= len(block)
+        self.central.append((name, crc, csize, st.st_size, offset, *dt))
+        return data
+
+    def close(self) -> None:
+        start = self.f.tell()
+        for name, crc, csize, usize, offset, dostime, dosdate in self.central:
+            z64 = [v for v in (usize, csize, offset) if v > _ZIP64]
+            extra = struct.pack(f"<HH{len(z64)}Q", 1, 8 * len(z64), *z64) if z64 else b""
+            self.f.write(struct.pack("<IHHHHHHIIIHHHHHII", 0x02014b50, 45, 45 if z64 else 20,
+                                     _UTF8, _DEFLATE, dostime, dosdate, crc,
+                                     _MAX32 if csize > _ZIP64 else csize,
+                                     _MAX32 if usize > _ZIP64 else usize,
+                                     len(name), len(extra), 0, 0, 0, 0,
+                                     _MAX32 if offset > _ZIP64 else offset))
+            self.f.write(name)
+            self.f.write(extra)
+        end = self.f.tell()
+        n, size = len(self.central), end - start
+        if n >= 0xFFFF or start > _ZIP64 or size > _ZIP64:
+            self.f.write(struct.pack("<IQHHIIQQQQ", 0x06064b50, 44, 45, 45, 0, 0,
+                                     n, n, size, start))
+            self.f.write(struct.pack("<IIQI", 0x07064b50, 0, end, 1))
+        self.f.write(struct.pack("<IHHHHIIH", 0x06054b50, 0, 0, min(n, 0xFFFF),
+                                 min(n, 0xFFFF), min(size, _MAX32), min(start, _MAX32), 0))
+
+
+# ── packaging ───────────────────────────────────────────────────────────
+def _ahead(it: Iterator, n: int) -> Iterator:
+    """Pull up to `n` items ahead of the consumer (that is what schedules work)."""
+    q = deque(islice(it, n))
+    while q:
+        yield q.popleft()
+        q.extend(islice(it, 1))
+
+
+def package_library(root: Path, out: Path | None = None, level: int = 6,
+                    workers: int | None = None) -> PackageResult:
+    t0 = time.perf_counter()
+    root = Path(root)
+    out = Path(out) if out else default_output(root)
+    files = collect(root)
+    old = _load_manifest(root, out, level)
+    workers = workers or min(32, (os.cpu_count() or 1) + 4)
+    entries: dict[str, list] = {}
+    reused = bytes_in = 0
+
+    def plan(pool) -> Iterator[tuple]:
+        for arc, path, st in files:
+            prev = old.get(arc)
+            if prev is not None and prev[0] == st.st_size and (
+                    prev[1] == st.st_mtime_ns or prev[2] == _sha256(path)):
+                yield "copy", arc, st, prev
+                continue
+            yield "begin", arc, st
+            crc, sha, n = 0, hashlib.sha256(), 0
+            with open(path, "rb") as f:
+                data = f.read(CHUNK)
+                while True:
+                    nxt = f.read(CHUNK)
+                    crc, n = zlib.crc32(data, crc), n + len(data)
+                    sha.update(data)
+                    yield "chunk", pool.submit(_deflate, data, not nxt, level)
+                    if not nxt:
+                        break
+                    data = nxt
+            yield "end", arc, st, crc, sha.hexdigest(), n
+
+    tmp = out.with_name(out.name + ".tmp")
+    src = open(out, "rb") if old else None
+    try:
+        with ThreadPoolExecutor(workers) as pool, open(tmp, "wb") as f:
+            w, state = _ZipWriter(f), None
+            for item in _ahead(plan(pool), workers * AHEAD):
+                kind = item[0]
+                if kind == "chunk":
+                    f.write(item[1].result())
+                elif kind == "begin":
+                    state = w.begin(item[1], item[2])
+                elif kind == "end":
+                    _, arc, st, crc, sha, n = item
+                    csize, data = w.end(state, crc, n)
+                    entries[arc] = [n, st.st_mtime_ns, sha, crc, csize, data]
+                    bytes_in += n
+                else:
+                    _, arc, st, (size, _, sha, crc, csize, offset) = item
+                    data = w.copy(arc, st, crc, csize, src, offset)
+                    entries[arc] = [size, st.st_mtime_ns, sha, crc, csize, data]
+                    reused += 1
+            w.close()
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    finally:
+        if src is not None:
+            src.close()
+    os.replace(tmp, out)
+
+    st = out.stat()
+    mp = _manifest_path(root)
+    mp.parent.mkdir(exist_ok=True)
+    mp.write_text(json.dumps({"format": _FORMAT, "level": level, "package": os.fspath(out),
+                              "size": st.st_size, "mtime_ns": st.st_mtime_ns,
+                              "entries": entries}), encoding="utf-8")
+    return PackageResult(out, len(files), reused, bytes_in, st.st_size,
+                         time.perf_counter() - t0)
+
+
+def summarize(r: PackageResult) -> str:
+    return (f"📦 {r.path.name}: {r.files} file(s), {r.reused} reused, "
+            f"{r.bytes_in / 1e6:.1f} MB recompressed, {r.bytes_out / 1e6:.1f} MB zip "
+            f"in {r.seconds:.1f} s.")
+
+
+if __name__ == "__main__":
+    import argparse
+    ap = argparse.ArgumentParser(description="Package a Visuino library as a zip.")
+    ap.add_argument("root", type=Path)
+    ap.add_argument("-o", "--out", type=Path)
+    ap.add_argument("--level", type=int, default=6)
+    ap.add_argument("--workers", type=int)
+    args = ap.parse_args()
+    print(summarize(package_library(args.root.expanduser(), args.out, args.level, args.workers)))
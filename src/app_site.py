@@ -0,0 +1,312 @@
+"""
+Static HTML catalog of a library.
+
+One page per component file (`components/<comp>.html`), one page per
+category (`categories/<Category>.html`) and `index.html`, rendered from the
+parsed models into `<library>/catalog/` (or `-o`).
+
+Builds are incremental. `.vtpc/site.json` keeps, per `.vcomp`, its (size,
+mtime) and the summary rows the index and category pages show. A build
+re-renders the pages of files whose stamp changed (or whose header or icon
+appeared, vanished or changed); the index and a category page are rewritten
+only when the rows they list changed. Parsing and rendering component pages
+run on a process pool in batches, and any page whose text did not change is
+not rewritten.
+
+    python app_site.py <library> [-o out] [--nick NICK] [--workers N]
+"""
+
+from __future__ import annotations
+
+import html
+import json
+import os
+import re
+import shutil
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+from urllib.parse import quote
+
+import app_templates
+from app_index import Entry, entries_for
+from app_library import CACHE_DIRNAME, header_files, stat_components
+
+SITE_DIR = "catalog"
+BATCH    = 200          # files per pool task
+_VERSION = 2            # bump when the templates or file names change, forces a full rebuild
+
+
+class SiteResult(NamedTuple):
+    out: Path
+    pages: int          # component pages (re)rendered
+    written: int        # files actually written, index/category pages included
+    removed: int
+    seconds: float
+
+
+# ── templates ───────────────────────────────────────────────────────────
+_PAGE = app_templates.compile("""\
+<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>{title}</title>
+<link rel="stylesheet" href="{up}style.css"></head>
+<body><nav><a href="{up}index.html">{library}</a></nav>
+<h1>{title}</h1>
+{body}</body></html>
+""")
+_COMPONENT = app_templates.compile("""\
+<section>
+<h2>{name}</h2>
+<dl>
+<dt>Class</dt><dd><code>{class_name}</code></dd>
+<dt>Namespace</dt><dd><code>{namespace}</code></dd>
+<dt>Category</dt><dd><a href="../categories/{category_href}.html">{category}</a></dd>
+<dt>Header</dt><dd><code>{include}</code>{header_note}</dd>
+</dl>
+{icon}<table><tr><th>Pin</th><th>Type</th><th>Direction</th></tr>
+{pins}</table>
+</section>
+""")
+_PIN = app_templates.compile(
+    "<tr><td>{name}</td><td><code>{type}</code></td><td>{direction}</td></tr>\n")
+_ROW = app_templates.compile(
+    "<tr><td><a href=\"{up}components/{href}.html\">{name}</a></td>"
+    "<td><code>{class_name}</code></td><td>{category}</td></tr>\n")
+_TABLE = app_templates.compile(
+    "<table><tr><th>Component</th><th>Class</th><th>Category</th></tr>\n"
+    "{rows}</table>\n")
+_STYLE = """\
+body { font-family: sans-serif; margin: 2em auto; max-width: 60em; }
+table { border-collapse: collapse; } td, th { padding: .2em .8em; text-align: left; }
+tr:nth-child(even) { background: #f4f4f4; } dt { font-weight: bold; }
+"""
+
+_UNSAFE = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+
+
+def _fname(name: str) -> str:
+    """File name (without extension) a component, category or icon is written under."""
+    return _UNSAFE.sub("_", name).strip(" .") or "_"
+
+
+def _href(name: str) -> str:
+    """`_fname(name)` as it goes inside an href attribute."""
+    return html.escape(quote(_fname(name)))
+
+
+def render_component_page(library: str, comp: str, rows: list[Entry],
+                          icons: set[str] = frozenset()) -> str:
+    body = []
+    for r in rows:
+        if not r.class_name:
+            body.append("<p>No component declared yet.</p>\n")
+            continue
+        icon = (f'<img src="../icons/{_href(r.class_name)}.png" alt="">\n'
+                if r.class_name in icons else "")
+        body.append(_COMPONENT({
+            "name": html.escape(r.name or r.class_name),
+            "class_name": html.escape(r.class_name),
+            "namespace": html.escape(r.namespace),
+            "category": html.escape(r.category or "(none)"),
+            "category_href": _href(r.category or "(none)"),
+            "include": html.escape(r.include),
+            "header_note": "" if r.has_header else " <em>(missing)</em>", "icon": icon,
+            "pins": "".join(_PIN({"name": html.escape(p.name), "type": html.escape(p.type),
+                                  "direction": p.direction}) for p in r.pins),
+        }))
+    return _PAGE({"title": html.escape(comp), "up": "../", "library": html.escape(library),
+                  "body": "".join(body)})
+
+
+def _table(rows: list[tuple[str, ...]], up: str) -> str:
+    return _TABLE({"rows": "".join(
+        _ROW({"up": up, "href": _href(comp), "name": html.escape(name),
+              "class_name": html.escape(cls), "category": html.escape(cat)})
+        for comp, cls, name, cat in rows)})
+
+
+def render_index(library: str, by_cat: dict[str, list]) -> str:
+    cats = "".join(f'<li><a href="categories/{_href(c)}.html">{html.escape(c)}</a> '
+                   f'({len(rows)})</li>\n' for c, rows in sorted(by_cat.items()))
+    every = sorted((r for rows in by_cat.values() for r in rows), key=lambda r: r[0].lower())
+    body = f"<h2>Categories</h2>\n<ul>\n{cats}</ul>\n<h2>All components</h2>\n{_table(every, '')}"
+    return _PAGE({"title": html.escape(library), "up": "", "library": html.escape(library),
+                  "body": body})
+
+
+def render_category(library: str, category: str, rows: list) -> str:
+    return _PAGE({"title": html.escape(category), "up": "../", "library": html.escape(library),
+                  "body": _table(sorted(rows, key=lambda r: r[0].lower()), "../")})
+
+
+# ── building ────────────────────────────────────────────────────────────
+def _write_if_changed(path: str, text: str) -> bool:
+    try:
+        with open(path, encoding="utf-8") as f:
+            if f.read() == text:
+                return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    return True
+
+
+def _summary(r: Entry) -> list[str]:
+    return [r.comp, r.class_name, r.name or r.class_name, r.category or "(none)"]
+
+
+def _icon_stamp(images: str, class_name: str) -> list[int] | None:
+    try:
+        st = os.stat(os.path.join(images, f"{class_name}.png"))
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+_HEADERS: set[str] = set()    # SRC headers, set once per pool worker
+
+
+def _init(headers: set[str]) -> None:
+    global _HEADERS
+    _HEADERS = headers
+
+
+def _render_batch(library: str, images: str, out: str,
+                  batch: list[tuple[str, str, int, int]]) -> list[tuple[str, list, int]]:
+    """Pool worker: parse files, write their pages and icons; returns (file, state, written)."""
+    done = []
+    for comp, path, size, mtime in batch:
+        rows = entries_for(comp, path, size, mtime, _HEADERS)
+        icons, written = {}, 0
+        for r in rows:
+            if r.class_name and (stamp := _icon_stamp(images, r.class_name)):
+                dst = os.path.join(out, "icons", f"{_fname(r.class_name)}.png")
+                shutil.copyfile(os.path.join(images, f"{r.class_name}.png"), dst)
+                icons[r.class_name] = stamp
+                written += 1
+        page = render_component_page(library, comp, rows, set(icons))
+        written += _write_if_changed(os.path.join(out, "components", f"{_fname(comp)}.html"), page)
+        state = [size, mtime, comp, [[*_summary(r), r.include, r.has_header,
+                                      icons.get(r.class_name)] for r in rows if r.class_name]]
+        done.append((os.path.basename(path), state, written))
+    return done
+
+
+def _current(prev: list | None, size: int, mtime: int, headers: set[str], images: str) -> bool:
+    """Whether a file's page is still what `prev` (its saved state) says."""
+    if prev is None or prev[:2] != [size, mtime]:
+        return False
+    for _, cls, _, _, inc, has, icon in prev[3]:
+        if (bool(inc) and inc in headers) != has or _icon_stamp(images, cls) != icon:
+            return False
+    return True
+
+
+def _state_path(root: Path) -> Path:
+    return root / CACHE_DIRNAME / "site.json"
+
+
+def build_site(root: Path, out: Path | None = None, nick: str = "",
+               workers: int | None = None) -> SiteResult:
+    t0 = time.perf_counter()
+    out = Path(out) if out else root / SITE_DIR
+    library = root.name
+    try:
+        state = json.loads(_state_path(root).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        state = {}
+    if state.get("out") == os.fspath(out) and state.get("version") != _VERSION:
+        for sub in ("components", "categories", "icons"):   # pages an older build named
+            shutil.rmtree(out / sub, ignore_errors=True)
+    if state.get("version") != _VERSION or state.get("out") != os.fspath(out):
+        state = {}
+    old: dict[str, list] = state.get("files", {})
+    for sub in ("components", "categories", "icons"):
+        (out / sub).mkdir(parents=True, exist_ok=True)
+
+    headers, images = header_files(root), os.fspath(root / "Visuino" / "images")
+    files, todo = {}, []
+    for comp, path, size, mtime in stat_components(root, nick):
+        name, prev = os.path.basename(path), old.get(os.path.basename(path))
+        if _current(prev, size, mtime, headers, images):
+            files[name] = prev
+        else:
+            todo.append((comp, path, size, mtime))
+
+    written = removed = 0
+    if todo:
+        batches = [todo[i:i + BATCH] for i in range(0, len(todo), BATCH)]
+        args = (library, images, os.fspath(out))
+        if len(batches) > 1 and (workers or os.cpu_count() or 1) > 1:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init,
+                                     initargs=(headers,)) as pool:
+                done = [d for res in pool.map(_render_batch, *zip(*((*args, b) for b in batches)))
+                        for d in res]
+        else:
+            _init(headers)
+            done = [d for b in batches for d in _render_batch(*args, b)]
+        for name, st, n in done:
+            files[name] = st
+            written += n
+
+    # pages and icons of files or components that are gone
+    live = {cls for *_, rows in files.values() for _, cls, *_ in rows}
+    for name in old.keys() - files.keys():
+        page = out / "components" / f"{_fname(old[name][2])}.html"
+        if page.exists():
+            page.unlink()
+            removed += 1
+    for *_, rows in old.values():
+        for _, cls, *_ in rows:
+            if cls not in live:
+                (out / "icons" / f"{_fname(cls)}.png").unlink(missing_ok=True)
+
+    # index and category pages: only where the listed rows changed
+    def by_category(fs: dict[str, list]) -> dict[str, list]:
+        cats = defaultdict(list)
+        for *_, rows in fs.values():
+            for comp, cls, disp, cat, *_ in rows:
+                cats[cat].append((comp, cls, disp, cat))
+        return {c: sorted(rows) for c, rows in cats.items()}
+
+    new_cats, old_cats = by_category(files), by_category(old)
+    dirty = False
+    for cat in new_cats.keys() | old_cats.keys():
+        page = out / "categories" / f"{_fname(cat)}.html"
+        if cat not in new_cats:
+            dirty = True
+            if page.exists():
+                page.unlink()
+                removed += 1
+        elif new_cats[cat] != old_cats.get(cat) or not page.exists():
+            dirty = True
+            written += _write_if_changed(os.fspath(page),
+                                         render_category(library, cat, new_cats[cat]))
+    if dirty or not (out / "index.html").exists():
+        written += _write_if_changed(os.fspath(out / "index.html"),
+                                     render_index(library, new_cats))
+    written += _write_if_changed(os.fspath(out / "style.css"), _STYLE)
+
+    _state_path(root).parent.mkdir(exist_ok=True)
+    _state_path(root).write_text(json.dumps({"version": _VERSION, "out": os.fspath(out),
+                                             "files": files}), encoding="utf-8")
+    return SiteResult(out, len(todo), written, removed, time.perf_counter() - t0)
+
+
+def summarize(r: SiteResult) -> str:
+    return (f"🌐 Catalog in {r.out}: {r.pages} component page(s) rendered, "
+            f"{r.written} file(s) written, {r.removed} removed in {r.seconds:.1f} s.")
+
+
+if __name__ == "__main__":
+    import argparse
+    ap = argparse.ArgumentParser(description="Build a static HTML catalog of a library.")
+    ap.add_argument("root", type=Path)
+    ap.add_argument("-o", "--out", type=Path)
+    ap.add_argument("--nick", default="")
+    ap.add_argument("--workers", type=int)
+    args = ap.parse_args()
+    print(summarize(build_site(args.root.expanduser(), args.out, args.nick, args.workers)))
@@ -0,0 +1,19 @@
+"""
+Text templates compiled once at import, shared by the generated examples and
+the static catalog.
+"""
+
+from __future__ import annotations
+
+from string import Formatter
+from typing import Callable
+
+
+def compile(template: str) -> Callable[[dict], str]:
+    """Split a `str.format` template once; rendering is then a single join."""
+    parts = [(lit, field) for lit, field, _, _ in Formatter().parse(template)]
+
+    def render(values: dict) -> str:
+        return "".join(lit + (values[field] if field is not None else "")
+                       for lit, field in parts)
+    return render
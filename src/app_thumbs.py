@@ -0,0 +1,125 @@
+"""
+Icon thumbnails for the component list.
+
+The list is a `sg.Tree` whose rows are components. `ThumbnailLoader.pump()`
+runs once per event-loop turn: it looks at which rows are scrolled into view
+(plus a small margin) and queues those rows' icons on a worker thread, which
+resolves the component's class name through the parse cache, reads
+`Visuino/images/<ClassName>.png` and shrinks it to a small PNG. The GUI thread
+only wraps the finished bytes in a `PhotoImage`. Photos live in a bounded LRU;
+an evicted photo is detached from its row so Tk can free it.
+"""
+
+from __future__ import annotations
+
+import base64
+import struct
+import tkinter as tk
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+THUMB  = 16
+MARGIN = 10             # rows above/below the viewport to prefetch
+
+
+def load_thumbnail(vcomp: Path, size: int = THUMB) -> str | None:
+    """Base64 PNG of the component's icon scaled to `size`, or None."""
+    from app_assets import decode_png, encode_png, scale_to_fit
+    from app_cache import CACHE
+    from app_vcomp import iter_components
+    try:
+        comp = next(iter_components(CACHE.model(vcomp)), None)
+        if comp is None:
+            return None
+        icon = vcomp.parent / "images" / f"{comp.class_name}.png"
+        w, h, rgba = decode_png(icon.read_bytes())
+    except (OSError, UnicodeDecodeError, ValueError, zlib.error, struct.error):
+        return None             # truncated or corrupt icon: the row shows none
+    png = encode_png(size, size, scale_to_fit(w, h, rgba, size))
+    return base64.b64encode(png).decode("ascii")
+
+
+class ThumbnailLoader:
+    EVENT = "-THUMB-"
+
+    def __init__(self, capacity: int = 512, size: int = THUMB, workers: int = 2) -> None:
+        self.capacity, self.size = capacity, size
+        self._photos: OrderedDict[str, tk.PhotoImage | None] = OrderedDict()  # path → photo
+        self._rows: list[tuple[str, str]] = []          # (row key, .vcomp path) in list order
+        self._row_of: dict[str, str] = {}               # path → row key
+        self._pending: set[str] = set()
+        self._wanted: set[str] = set()                  # read by workers, replaced atomically
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="thumbs")
+        self._view = None
+
+    def set_rows(self, rows: list[tuple[str, str]]) -> None:
+        """Rows now shown in the list; call right after the Tree was refilled."""
+        self._rows = rows
+        self._row_of = {p: k for k, p in rows}
+        self._view = None                               # force a re-scan in pump()
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def clear(self) -> None:
+        """Drop every photo, e.g. after icons were regenerated."""
+        self._photos.clear()
+        self._view = None
+
+    # ── GUI thread ───────────────────────────────────────────────────
+    def pump(self, win, tree_key: str) -> None:
+        tree = win[tree_key].TKTreeview
+        if not self._rows or not tree.winfo_ismapped():
+            return
+        top, bottom = tree.yview()
+        view = (top, bottom, len(self._rows))
+        if view == self._view:
+            return
+        self._view = view
+        n = len(self._rows)
+        first = max(0, int(top * n) - MARGIN)
+        last = min(n, int(bottom * n) + 1 + MARGIN)
+        wanted = {p for _, p in self._rows[first:last]}
+        self._wanted = wanted
+        for path in wanted:
+            if path in self._photos:
+                self._photos.move_to_end(path)
+                self._attach(win, tree_key, path)
+            elif path not in self._pending:
+                self._pending.add(path)
+                self._pool.submit(self._job, win, path)
+
+    def _job(self, win, path: str) -> None:
+        data, done = None, path in self._wanted        # not wanted: scrolled away meanwhile
+        try:
+            if done:
+                data = load_thumbnail(Path(path), self.size)
+        finally:
+            # always answer, or the path would stay in _pending and never be asked again
+            win.write_event_value(self.EVENT, (path, data, done))
+
+    def _attach(self, win, tree_key: str, path: str) -> None:
+        key = self._row_of.get(path)
+        elem = win[tree_key]
+        iid = elem.KeyToID.get(key) if key is not None else None
+        if iid:
+            photo = self._photos.get(path)
+            elem.TKTreeview.item(iid, image=photo if photo is not None else "")
+
+    def handle_event(self, event, vals, win, tree_key: str) -> bool:
+        if event != self.EVENT:
+            return False
+        path, data, done = vals[event]
+        self._pending.discard(path)
+        if not done:
+            self._view = None                           # ask again if it scrolls back
+            return True
+        self._photos[path] = tk.PhotoImage(master=win.TKroot, data=data) if data else None
+        self._photos.move_to_end(path)
+        while len(self._photos) > self.capacity:
+            old, _ = self._photos.popitem(last=False)
+            self._attach(win, tree_key, old)            # row falls back to no image
+        self._attach(win, tree_key, path)
+        return True
@@ -0,0 +1,580 @@
+"""
+Headless `.vcomp` model: tokenizer, parser and the Pre populate templates.
+
+Nothing in here imports PySimpleGUI, so the same code backs the editor, the
+watch command and any batch tooling.
+
+The parser is deliberately forgiving: it never raises on malformed input but
+records `Diagnostic`s next to whatever it could recover.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple
+
+from app_library import matching_brace
+
+######################################################################
+# tokens
+######################################################################
+
+NAME, STRING, NUMBER, PUNCT, COMMENT, NEWLINE, ERROR = (
+    "NAME", "STRING", "NUMBER", "PUNCT", "COMMENT", "NEWLINE", "ERROR")
+
+_TOKEN_RE = re.compile(r"""
+    (?P<ws>[ \t\r\f]+)
+  | (?P<COMMENT>//[^\n]*)
+  | (?P<STRING>'(?:[^'\n]|'')*')
+  | (?P<NUMBER>[-+]?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][-+]?\d+)?)
+  | (?P<NAME>[A-Za-z_][A-Za-z_0-9]*(?:\.[A-Za-z_][A-Za-z_0-9]*)*)
+  | (?P<PUNCT>[\[\](),:;=+\-<>{}.])
+  | (?P<NEWLINE>\n)
+  | (?P<ERROR>.)
+""", re.VERBOSE)
+
+
+class Token(NamedTuple):
+    kind: str
+    value: str
+    line: int       # 0-based
+    col: int
+
+
+def tokenize_lines(lines: Iterable[str], first_line: int = 0) -> Iterator[Token]:
+    """Tokenize line by line; memory use is bounded by the longest line."""
+    lineno = first_line - 1
+    for lineno, line in enumerate(lines, first_line):
+        for m in _TOKEN_RE.finditer(line):
+            kind = m.lastgroup
+            if kind != "ws":
+                yield Token(kind, m.group(), lineno, m.start())
+        if not line.endswith("\n"):
+            yield Token(NEWLINE, "", lineno, len(line))
+
+
+def tokenize(text: str) -> Iterator[Token]:
+    return tokenize_lines(text.splitlines(keepends=True))
+
+
+def unquote(s: str) -> str:
+    """`'It''s'` → `It's`; anything not quoted is returned unchanged."""
+    if len(s) >= 2 and s[0] == s[-1] == "'":
+        return s[1:-1].replace("''", "'")
+    return s
+
+
+######################################################################
+# model
+######################################################################
+
+class Diagnostic(NamedTuple):
+    line: int
+    col: int
+    message: str
+    severity: str = "error"     # "error" | "warning"
+
+
+@dataclass
+class Attribute:
+    name: str
+    args: list[str] = field(default_factory=list)    # unquoted
+    line: int = 0
+
+    @property
+    def value(self) -> str:
+        return self.args[0] if self.args else ""
+
+
+@dataclass
+class Node:
+    """One declaration: `[+]Name : Type [= value]`, optionally with a body."""
+    name: str
+    type: str
+    attrs: list[Attribute] = field(default_factory=list)
+    children: list["Node"] = field(default_factory=list)
+    plus: bool = False
+    value: str = ""
+    block: bool = False
+    line: int = 0
+    end_line: int = 0
+
+    def attr(self, name: str) -> Attribute | None:
+        for a in self.attrs:
+            if a.name == name:
+                return a
+        return None
+
+
+@dataclass
+class Document:
+    nodes: list[Node] = field(default_factory=list)
+    errors: list[Diagnostic] = field(default_factory=list)
+
+
+class Pin(NamedTuple):
+    name: str
+    type: str
+    direction: str      # "in" | "out"
+
+
+@dataclass
+class ComponentInfo:
+    """The fields Pre populate writes, read back from a parsed file."""
+    namespace: str
+    class_name: str
+    base: str
+    name: str = ""
+    create_name: str = ""
+    include: str = ""
+    arduino_class: str = ""
+    category: str = ""
+    loop_begin: bool = False
+    pins: list[Pin] = field(default_factory=list)
+    line: int = 0
+
+
+######################################################################
+# parser
+######################################################################
+
+class _Parser:
+    def __init__(self, tokens: Iterable[Token]) -> None:
+        self._it  = iter(tokens)
+        self._tok = None
+        self.errors: list[Diagnostic] = []
+        self._advance()
+
+    def _advance(self) -> Token | None:
+        prev = self._tok
+        self._tok = next(self._it, None)
+        return prev
+
+    def _skip_trivia(self) -> None:
+        while self._tok and self._tok.kind in (NEWLINE, COMMENT):
+            self._advance()
+
+    def _error(self, msg: str, tok: Token | None = None) -> None:
+        tok = tok or self._tok
+        line, col = (tok.line, tok.col) if tok else (-1, 0)
+        self.errors.append(Diagnostic(line, col, msg))
+
+    def _skip_line(self) -> None:
+        while self._tok and self._tok.kind != NEWLINE:
+            self._advance()
+
+    def _attribute(self) -> Attribute | None:
+        start = self._advance()                     # '['
+        if not self._tok or self._tok.kind != NAME:
+            self._error("Expected attribute name after '['")
+            self._skip_line()
+            return None
+        attr = Attribute(self._advance().value, line=start.line)
+        if self._tok and self._tok.value == "(":
+            self._advance()
+            depth, cur = 0, []
+            while self._tok and self._tok.kind != NEWLINE:
+                tok = self._advance()
+                if tok.value == "(" and tok.kind == PUNCT:
+                    depth += 1
+                elif tok.value == ")" and tok.kind == PUNCT:
+                    if depth == 0:
+                        break
+                    depth -= 1
+                elif tok.value == "," and depth == 0:
+                    attr.args.append(unquote("".join(cur)))
+                    cur = []
+                    continue
+                cur.append(tok.value)
+            else:
+                self._error(f"Unclosed '(' in attribute [{attr.name}]", start)
+                return attr
+            if cur:
+                attr.args.append(unquote("".join(cur)))
+        if self._tok and self._tok.value == "]":
+            self._advance()
+        else:
+            self._error(f"Expected ']' to close attribute [{attr.name}]", start)
+            self._skip_line()
+        return attr
+
+    def parse(self, in_namespace: bool = False, depth: int = 0) -> list[Node]:
+        nodes: list[Node] = []
+        attrs: list[Attribute] = []
+        while True:
+            self._skip_trivia()
+            tok = self._tok
+            if tok is None:
+                if depth:
+                    self._error("Missing ';' to close block")
+                break
+            if tok.value == ";":
+                if depth:
+                    break
+                self._error("Unexpected ';' at top level")
+                self._advance()
+                continue
+            if tok.value == "[":
+                a = self._attribute()
+                if a:
+                    attrs.append(a)
+                continue
+            node = self._decl(attrs, in_namespace, depth)
+            attrs = []
+            if node:
+                nodes.append(node)
+        if attrs:
+            self._error("Attributes not followed by a declaration",
+                        Token(PUNCT, "[", attrs[0].line, 0))
+        return nodes
+
+    def parse_unit(self) -> list[Node] | None:
+        """One top-level declaration with its attributes; None at end of input.
+
+        Calling this until it returns None is equivalent to `parse()`, but lets
+        a caller (the language server) cut the file at top-level boundaries.
+        """
+        attrs: list[Attribute] = []
+        while True:
+            self._skip_trivia()
+            tok = self._tok
+            if tok is None:
+                if attrs:
+                    self._error("Attributes not followed by a declaration",
+                                Token(PUNCT, "[", attrs[0].line, 0))
+                    return []
+                return None
+            if tok.value == ";":
+                self._error("Unexpected ';' at top level")
+                self._advance()
+                continue
+            if tok.value == "[":
+                a = self._attribute()
+                if a:
+                    attrs.append(a)
+                continue
+            node = self._decl(attrs, False, 0)
+            return [node] if node else []
+
+    def _decl(self, attrs, in_namespace, depth) -> Node | None:
+        start = self._tok
+        plus = start.value == "+"
+        if plus:
+            self._advance()
+        if not self._tok or self._tok.kind != NAME:
+            self._error(f"Unexpected {self._tok.value!r}" if self._tok else "Unexpected end")
+            self._advance()
+            self._skip_line()
+            return None
+        name = self._advance().value
+        if not self._tok or self._tok.value != ":":
+            self._error(f"Expected ':' after {name!r}")
+            self._skip_line()
+            return None
+        self._advance()
+        if not self._tok or self._tok.kind != NAME:
+            self._error(f"Expected type name for {name!r}")
+            self._skip_line()
+            return None
+        node = Node(name, self._advance().value, attrs, plus=plus,
+                    line=start.line, end_line=start.line)
+        if self._tok and self._tok.value == "=":
+            self._advance()
+            parts = []
+            while self._tok and self._tok.kind not in (NEWLINE, COMMENT):
+                parts.append(self._advance().value)
+            node.value = " ".join(parts)
+        node.block = plus or in_namespace or node.type == "Namespace"
+        if node.block:
+            node.children = self.parse(node.type == "Namespace", depth + 1)
+            if self._tok and self._tok.value == ";":
+                node.end_line = self._advance().line
+        return node
+
+
+def parse(text: str) -> Document:
+    """Parse `.vcomp` source into a `Document`; never raises."""
+    return parse_tokens(tokenize(text))
+
+
+def parse_tokens(tokens: Iterable[Token]) -> Document:
+    p = _Parser(tokens)
+    nodes = p.parse()
+    return Document(nodes, p.errors)
+
+
+######################################################################
+# model queries
+######################################################################
+
+def pin_direction(type_name: str) -> str | None:
+    """`TOWArduinoDigitalSinkPin` → "in", `...SourcePin` → "out", else None."""
+    if not type_name.endswith("Pin"):
+        return None
+    if "Sink" in type_name:
+        return "in"
+    if "Source" in type_name:
+        return "out"
+    return None
+
+
+def iter_components(doc: Document) -> Iterator[ComponentInfo]:
+    """Yield every `+Class` declared inside a namespace."""
+    for ns in doc.nodes:
+        if ns.type != "Namespace":
+            continue
+        for cls in ns.children:
+            if not cls.plus:
+                continue
+            get = lambda n: (cls.attr(n).value if cls.attr(n) else "")  # noqa: E731
+            pins = [Pin(m.name, m.type, d) for m in cls.children
+                    if (d := pin_direction(m.type))]
+            yield ComponentInfo(
+                namespace=ns.name, class_name=cls.name, base=cls.type,
+                name=get("Name"), create_name=get("CreateName"),
+                include=get("ArduinoInclude"), arduino_class=get("ArduinoClass"),
+                category=get("Category"), loop_begin=cls.attr("ArduinoLoopBegin") is not None,
+                pins=pins, line=cls.line,
+            )
+
+
+######################################################################
+# Pre populate templates
+######################################################################
+
+CATEGORIES = [
+    "TArduinoBooleanFlipFlopsToolbarCategory",
+    "TArduinoMathFunctionsToolbarCategory",
+    "TArduinoSignalSourcesToolbarCategory",
+]
+
+DEFAULT_PINS = [
+    Pin("InputPin", "TOWArduinoDigitalSinkPin", "in"),
+    Pin("OutputPin", "TOWArduinoDigitalSourcePin", "out"),
+]
+
+
+def camel_to_title(s: str) -> str:
+    """Convert *CamelCase* → "Camel Case"."""
+    return re.sub(r"(?<!^)(?=[A-Z])", " ", s).strip()
+
+
+def split_stem(comp_path: Path) -> tuple[str, str]:
+    """`Finn.Pulse.vcomp` → ("Finn", "Pulse"); no nickname → ("", stem)."""
+    parts = comp_path.stem.split(".", 1)
+    return (parts[0], parts[1]) if len(parts) == 2 else ("", parts[0])
+
+
+def component_path(root: Path, nick: str, comp: str) -> Path:
+    """Inverse of `split_stem`: where a component lives inside a library."""
+    return root / "Visuino" / (f"{nick}.{comp}.vcomp" if nick else f"{comp}.vcomp")
+
+
+def default_fields(comp_path: Path) -> dict:
+    """Pre populate defaults inferred from the file name alone."""
+    nickname, short = split_stem(comp_path)
+    disp_name   = camel_to_title(short)
+    create_name = re.sub(r"\s+", "", disp_name)
+    return dict(namespace=nickname or "MyNamespace", disp_name=disp_name,
+                create_name=create_name, header_file=f"{create_name}.h",
+                category=CATEGORIES[0], loop_flag=False)
+
+
+def render_vcomp(namespace: str, disp_name: str, create_name: str, header_file: str,
+                 category: str, loop_flag: bool, pins: list[Pin] = DEFAULT_PINS) -> str:
+    """Text of a freshly pre-populated `.vcomp`."""
+    lines = [
+        f"{namespace} : Namespace\n",
+        f"    [Name('{disp_name}')]\n",
+        f"    [CreateName('{create_name}')]\n",
+        f"    [ArduinoInclude( '{header_file}' )]\n",
+    ]
+    if loop_flag:
+        lines.append("    [ArduinoLoopBegin]\n")
+    lines.extend([
+        f"    [ArduinoClass( '{namespace}::{create_name}' )]\n",
+        f"    [Category( {category} )]\n\n",
+        f"        +TArduino{create_name}: TArduinoComponent\n\n",
+        *(f"            {p.name} : {p.type}\n" for p in pins),
+        "\n",
+        "        ; // TArduinoComponent\n\n\n",
+        f"; // {namespace}\n",
+    ])
+    return "".join(lines)
+
+
+def render_header(namespace: str, create_name: str, pins: list[Pin] = DEFAULT_PINS) -> str:
+    """Class skeleton written to `SRC/<header>` when it does not exist yet."""
+    outs = [p.name for p in pins if p.direction == "out"]
+    ins  = [p.name for p in pins if p.direction == "in"]
+    lines = []
+    if outs:
+        lines.append("  template <" + ", ".join(f"typename T_{o}" for o in outs) + ">")
+        lines.append(f"  class {create_name} : " + ", ".join(f"public T_{o}" for o in outs))
+    else:
+        lines.append(f"  class {create_name}")
+    lines.append("  {")
+    lines.extend(f"    _V_PIN_( {o} )" for o in outs)
+    lines.extend(["", "    // Inputs and outputs will be added later via editor"])
+    for i in ins:
+        lines.extend(["", f"    inline void {i}_o_Receive(void* _Data)",
+                      "    {", "      // placeholder", "    }"])
+    lines.append("  };")
+    body = "\n".join(lines)
+    return f"#pragma once\n\n#include <Mitov.h>\n\nnamespace {namespace}\n{{\n{body}\n}}\n"
+
+
+def patch_header(text: str, create_name: str, pins: list[Pin]) -> str | None:
+    """
+    Add missing `_V_PIN_` members, `T_<pin>` template parameters with their
+    `public T_<pin>` base classes and `<pin>_o_Receive` stubs to an existing
+    header, so it has the shape `render_header` would give it. Hand-written
+    code is left alone; returns None if the class cannot be located or nothing
+    is missing.
+    """
+    m = re.search(rf"(?:template\s*<(?P<params>[^>]*)>\s*)?class\s+{re.escape(create_name)}\b"
+                  rf"(?P<bases>[^{{;]*)\{{", text)
+    if not m:
+        return None
+    close = matching_brace(text, m.end() - 1)
+    if close < 0:
+        return None
+    body = text[m.end():close]
+    outs = [p.name for p in pins if p.direction == "out"
+            and not re.search(rf"_V_PIN_\(\s*{re.escape(p.name)}\s*\)", body)]
+    ins  = [p.name for p in pins if p.direction == "in"
+            and not re.search(rf"\b{re.escape(p.name)}_o_Receive\b", body)]
+    if not outs and not ins:
+        return None
+
+    line_at = text.rfind("\n", 0, m.start()) + 1
+    indent = re.match(r"[ \t]*", text[line_at:]).group()
+    if text.rfind("\n", 0, close) < m.end():
+        # `class X { ... };` on one line: give the body its own lines first
+        inner = body.strip()
+        return patch_header(text[:m.end()] + (f"\n{indent}  {inner}" if inner else "")
+                            + f"\n{indent}" + text[close:], create_name, pins)
+
+    # every edit is (start, end, text) against the original `text`; they are
+    # spliced back-to-front so the offsets of the others stay valid
+    edits: list[tuple[int, int, str]] = []
+    if ins:
+        at = text.rfind("\n", 0, close) + 1
+        edits.append((at, at, "".join(f"\n    inline void {i}_o_Receive(void* _Data)\n"
+                                      "    {\n      // placeholder\n    }\n" for i in ins)))
+    if outs:
+        last = list(re.finditer(r"_V_PIN_\([^)]*\)", body))
+        at = m.end() + (last[-1].end() if last else 0)
+        edits.append((at, at, "".join(f"\n    _V_PIN_( {o} )" for o in outs)))
+        bases = m.group("bases").rstrip()
+        if new := [o for o in outs if not re.search(rf"\bT_{o}\b", bases)]:
+            extra = ", ".join(f"public T_{o}" for o in new)
+            at = m.start("bases") + len(bases)
+            edits.append((at, at, f", {extra}" if bases.strip() else f" : {extra}"))
+        params = m.group("params")
+        if new := [o for o in outs if not re.search(rf"\bT_{o}\b", params or "")]:
+            extra = ", ".join(f"typename T_{o}" for o in new)
+            if params is not None:
+                edits.append((m.start("params"), m.end("params"),
+                              f"{params.strip()}, {extra}" if params.strip() else extra))
+            elif text[line_at:m.start()].strip():
+                edits.append((m.start(), m.start(), f"template <{extra}> "))
+            else:
+                edits.append((m.start(), m.start(), f"template <{extra}>\n{indent}"))
+
+    out = text
+    for start, end, insert in sorted(edits, key=lambda e: (e[0], e[1]), reverse=True):
+        out = out[:start] + insert + out[end:]
+    return out
+
+
+def write_header(src_dir: Path, info: ComponentInfo) -> str | None:
+    """
+    Generate `SRC/<include>` for a component, or patch it if it exists.
+    Returns a short description of what changed, or None if nothing did.
+    """
+    header_path = src_dir / info.include
+    create_name = info.create_name or info.class_name.removeprefix("TArduino")
+    pins = info.pins or DEFAULT_PINS
+    if not header_path.exists():
+        src_dir.mkdir(parents=True, exist_ok=True)
+        header_path.write_text(render_header(info.namespace, create_name, pins), encoding="utf-8")
+        return f"generated {info.include}"
+    patched = patch_header(header_path.read_text(encoding="utf-8"), create_name, pins)
+    if patched is None:
+        return None
+    header_path.write_text(patched, encoding="utf-8")
+    return f"patched {info.include}"
+
+
+def sync_headers(root: Path, comp_path: Path) -> list[str]:
+    """Re-parse one `.vcomp` and generate or patch the headers it includes."""
+    t0   = time.perf_counter()
+    doc  = parse(comp_path.read_text(encoding="utf-8"))
+    msgs = []
+    for info in iter_components(doc):
+        if not info.include:
+            msgs.append(f"⚠️ {comp_path.name}: {info.class_name} has no ArduinoInclude.")
+            continue
+        change = write_header(root / "SRC", info)
+        if change:
+            ms = (time.perf_counter() - t0) * 1000
+            msgs.append(f"✅ {comp_path.name}: {change} ({ms:.0f} ms)")
+    if doc.errors:
+        e = doc.errors[0]
+        msgs.append(f"⚠️ {comp_path.name}:{e.line + 1}: {e.message}")
+    return msgs
+
+
+def set_category(text: str, category: str) -> str:
+    """Replace (or add) the `[Category( ... )]` attribute of every component."""
+    new, n = re.subn(r"\[Category\(\s*[^)]*?\s*\)\]", f"[Category( {category} )]", text)
+    if n:
+        return new
+    # no Category yet: put one just above each `+Class` declaration
+    return re.sub(r"^([ \t]*)\+", lambda m: f"{m.group(1)}[Category( {category} )]\n{m.group(0)}",
+                  text, flags=re.MULTILINE)
+
+
+######################################################################
+# validation
+######################################################################
+
+_REQUIRED_ATTRS = ("Name", "CreateName", "ArduinoInclude", "ArduinoClass", "Category")
+_IDENT_RE       = re.compile(r"[A-Za-z_][A-Za-z_0-9]*")
+
+
+def validate(doc: Document, src_dir: Path | None = None) -> list[Diagnostic]:
+    """Structural checks on top of the parse errors; `src_dir` enables header checks."""
+    out = list(doc.errors)
+    comps = list(iter_components(doc))
+    if not comps and not doc.errors:
+        out.append(Diagnostic(0, 0, "No component (+Class inside a Namespace) declared"))
+    return out + check_components(doc, comps, src_dir)
+
+
+def check_components(doc: Document, comps: list[ComponentInfo],
+                     src_dir: Path | None = None) -> list[Diagnostic]:
+    """Per-component checks of `validate`, usable on part of a document."""
+    out = []
+    for c in comps:
+        cls = next(n for ns in doc.nodes for n in ns.children
+                   if n.line == c.line and n.name == c.class_name)
+        for name in _REQUIRED_ATTRS:
+            if cls.attr(name) is None:
+                out.append(Diagnostic(c.line, 0, f"{c.class_name}: missing [{name}]"))
+        if c.create_name and not _IDENT_RE.fullmatch(c.create_name):
+            out.append(Diagnostic(cls.attr("CreateName").line, 0,
+                                  f"CreateName {c.create_name!r} is not a C++ identifier"))
+        if c.arduino_class and c.create_name and \
+                c.arduino_class != f"{c.namespace}::{c.create_name}":
+            out.append(Diagnostic(cls.attr("ArduinoClass").line, 0,
+                                  f"ArduinoClass {c.arduino_class!r} does not match "
+                                  f"'{c.namespace}::{c.create_name}'", "warning"))
+        if src_dir is not None and c.include and not (src_dir / c.include).exists():
+            out.append(Diagnostic(cls.attr("ArduinoInclude").line, 0,
+                                  f"Header SRC/{c.include} does not exist", "warning"))
+    return out
@@ -1,7 +1,11 @@
 import PySimpleGUI as sg
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from glob import glob
 
+from app_thumbs import THUMB, ThumbnailLoader
+
 
 # ── helpers ─────────────────────────────────────────────────────────────
 def _default_arduino_lib_dir() -> Path:
@@ -20,17 +24,92 @@ paragraph=This library was generated using the Visuino Third Party Creator tool.
 category=Uncategorized
 url=https://example.com/your-library
 architectures=*
+depends=
 """
 
+# ── filesystem work (runs on the I/O pool, never on the Tk thread) ─────
+def structure_ok(root: Path) -> bool:
+    return all((root / p).exists() for p in
+               ["SRC", "Visuino/images", "library.properties", "visuino.library"])
+
+
+def verify_dir(root: Path) -> str:
+    """"ok", "partial" (directory without structure) or "missing"."""
+    if not root.exists():
+        return "missing"
+    return "ok" if structure_ok(root) else "partial"
+
+
+def create_dir(root: Path) -> None:
+    root.mkdir(parents=True, exist_ok=False)
+
+
+def scan_components(root: Path, nickname: str) -> list[str]:
+    pat = f"{nickname}*.vcomp" if nickname else "*.vcomp"
+    out = []
+    for p in glob(str(root / "Visuino" / pat)):
+        stem = Path(p).stem
+        if nickname and stem.startswith(nickname + "."):
+            stem = stem[len(nickname) + 1:]
+        out.append(stem)
+    return out
+
+
+def create_component_file(root: Path, nick: str, comp: str) -> str:
+    if not comp:
+        return "⚠️ No component name entered."
+    fname = f"{nick}.{comp}.vcomp" if nick else f"{comp}.vcomp"
+    fpath = root / "Visuino" / fname
+    try:
+        fpath.touch(exist_ok=False)
+        return f"✅ Created {fname}"
+    except FileExistsError:
+        return f"⚠️ {fname} already exists."
+    except Exception as e:
+        return f"❌ Error creating component: {e}"
+
+
+def scaffold_structure(root: Path) -> str:
+    """Create SRC/, Visuino/images and the two library files; return the properties."""
+    (root / "SRC").mkdir(parents=True, exist_ok=True)
+    (root / "Visuino" / "images").mkdir(parents=True, exist_ok=True)
+    (root / "visuino.library").touch(exist_ok=True)
+    if not (root / "library.properties").exists():
+        (root / "library.properties").write_text(_TEMPLATE_PROPERTIES)
+    return (root / "library.properties").read_text()
+
+
+def load_properties(root: Path) -> str:
+    return (root / "library.properties").read_text()
+
+
+def save_properties(root: Path, text: str) -> None:
+    (root / "library.properties").write_text(text, encoding="utf-8")
+
 
 class WorkdirWidget:
     VERIFY, CREATE, STRUCT = "-VERIFY-", "-CREATE-", "-STRUCT-"
     TOGGLE, SAVE           = "-TOGGLELIB-", "-SAVELIB-"
     LISTBTN                = "-LISTCOMP-"
     NEWBTN, EDITBTN        = "-NEWCOMP-", "-EDITCOMP-"
+    CHECKBTN, DUPESBTN     = "-CHECKHDR-", "-DUPES-"
+    PACKBTN, ICONBTN       = "-PACKAGE-", "-ICONS-"
+    EXPORTBTN, DEPSBTN     = "-EXPORT-", "-DEPS-"
+    INSTALLBTN             = "-INSTALL-"
+    EXAMPLESBTN            = "-EXAMPLES-"
+    SITEBTN                = "-SITE-"
+    BULKPREP, BULKVALID    = "-BULKPREPOP-", "-BULKVALID-"
+    BULKCAT, BULKHDR       = "-BULKCAT-", "-BULKHDR-"
+    BULKFMT                = "-BULKFMT-"
+    BULKDEL, BULKCANCEL    = "-BULKDEL-", "-BULKCANCEL-"
+    BULKBAR                = "-BULKBAR-"
+    BULKPROG, BULKDONE     = "-BULKPROGRESS-", "-BULKDONE-"    # posted by app_bulk
+    BULKBTNS               = (BULKPREP, BULKVALID, BULKCAT, BULKHDR, BULKFMT, BULKDEL)
+    IODONE                 = "-IODONE-"
     WORKDIR, NICK          = "-WORKDIR-", "-NICKNAME-"
     LIBTXT, LIBCOL         = "-LIBTXT-", "-LIBCOL-"
     LISTCOL, COMPLIST      = "-LISTCOL-", "-COMPLIST-"
+    SHARED                 = "-SHARED-"
 
     def __init__(self) -> None:
         default = _default_arduino_lib_dir()
@@ -54,32 +133,35 @@ class WorkdirWidget:
                 sg.Button("Show components", key=self.LISTBTN, disabled=True),
                 sg.Button("Create component", key=self.NEWBTN, disabled=True),
                 sg.Button("Edit component", key=self.EDITBTN, disabled=True),
+                sg.Button("Check headers", key=self.CHECKBTN, disabled=True),
+                sg.Button("Find duplicates", key=self.DUPESBTN, disabled=True),
+                sg.Button("Generate icons", key=self.ICONBTN, disabled=True),
+                sg.Button("Generate examples", key=self.EXAMPLESBTN, disabled=True),
+                sg.Button("Package library", key=self.PACKBTN, disabled=True),
+                sg.Button("Export catalog", key=self.EXPORTBTN, disabled=True),
+                sg.Button("Build HTML catalog", key=self.SITEBTN, disabled=True),
+                sg.Button("Check dependencies", key=self.DEPSBTN, disabled=True),
+                sg.Button("Install", key=self.INSTALLBTN, disabled=True),
             ],
         ]
 
         # ── shared area (editor ↔ list) ───────────────────────────────
-        shared = sg.Column(
-            [[
-                sg.Column(
-                    [
-                        [sg.Text("library.properties content:")],
-                        [sg.Multiline("", size=(80, 12), key=self.LIBTXT)],
-                        [sg.Button("Save properties", key=self.SAVE)],
-                    ],
-                    key=self.LIBCOL, visible=False, expand_x=True,
-                ),
-                sg.Column(
-                    [
-                        [sg.Text("Components in library:")],
-                        [sg.Listbox(values=[], size=(80, 12),
-                                    key=self.COMPLIST, enable_events=True)],
-                    ],
-                    key=self.LISTCOL, visible=False, expand_x=True,
-                ),
-            ]],
-            expand_x=True,
-        )
-        self.layout.append([shared])
+        # Both panels start hidden, so they are only built on first use
+        # (see `_panel`); this keeps the first paint of the window cheap.
+        self.layout.append([sg.Column([[]], key=self.SHARED, expand_x=True, pad=0)])
+        self._built: set[str] = set()
+        self._bulk = None       # app_bulk.BulkRunner, created on first use
+        self._thumbs = ThumbnailLoader()
+        self.log   = None       # callable(str) for worker messages, set by run_app
+        self.library: tuple[Path, str] | None = None   # (root, nick) once verified
+
+        # ── background file I/O ───────────────────────────────────────
+        self._io     = ThreadPoolExecutor(max_workers=4, thread_name_prefix="io")
+        self._tails: dict[Path, Future] = {}    # last queued job per library
+        self._tokens: dict[str, int] = {}       # newest request per result slot
+        self._busy: dict[str, int] = defaultdict(int)
+        self._want: dict[str, bool] = {}        # disabled state once idle
+
 
     # ── helpers ───────────────────────────────────────────────────────
     def _effective_path(self, vals) -> Path:
@@ -87,185 +169,533 @@ class WorkdirWidget:
         nick = vals[self.NICK].strip()
         return base / nick if nick else base
 
-    def _structure_ok(self, root: Path) -> bool:
-        return all((root / p).exists() for p in
-                   ["SRC", "Visuino/images", "library.properties", "visuino.library"])
-
-    def _scan_components(self, root: Path, nickname: str) -> list[str]:
-        pat = f"{nickname}*.vcomp" if nickname else "*.vcomp"
-        out = []
-        for p in glob(str(root / "Visuino" / pat)):
-            stem = Path(p).stem
-            if nickname and stem.startswith(nickname + "."):
-                stem = stem[len(nickname) + 1:]
-            out.append(stem)
-        return out
-
-    # --- create .vcomp skeleton --------------------------------------
-    def _create_component_file(self, root: Path, nick: str, comp: str) -> str:
-        if not comp:
-            return "⚠️ No component name entered."
-        fname = f"{nick}.{comp}.vcomp" if nick else f"{comp}.vcomp"
-        fpath = root / "Visuino" / fname
+    # ── lazily built panels ──────────────────────────────────────────
+    def _lib_panel(self):
+        return sg.Column(
+            [
+                [sg.Text("library.properties content:")],
+                [sg.Multiline("", size=(80, 12), key=self.LIBTXT)],
+                [sg.Button("Save properties", key=self.SAVE)],
+            ],
+            key=self.LIBCOL, visible=False, expand_x=True,
+        )
+
+    def _list_panel(self):
+        return sg.Column(
+            [
+                [sg.Text("Components in library:")],
+                [sg.Tree(sg.TreeData(), headings=[], col0_heading="Component",
+                         col0_width=60, num_rows=12, row_height=THUMB + 4,
+                         key=self.COMPLIST, enable_events=True,
+                         select_mode=sg.TABLE_SELECT_MODE_EXTENDED)],
+                [
+                    sg.Text("Selected:"),
+                    sg.Button("Pre populate", key=self.BULKPREP, disabled=True),
+                    sg.Button("Validate", key=self.BULKVALID, disabled=True),
+                    sg.Button("Re-categorize", key=self.BULKCAT, disabled=True),
+                    sg.Button("Regenerate headers", key=self.BULKHDR, disabled=True),
+                    sg.Button("Format", key=self.BULKFMT, disabled=True),
+                    sg.Button("Delete", key=self.BULKDEL, disabled=True,
+                              button_color=("white", "firebrick")),
+                ],
+                [
+                    sg.ProgressBar(1, orientation="h", size=(40, 12), key=self.BULKBAR),
+                    sg.Button("Cancel", key=self.BULKCANCEL, disabled=True),
+                ],
+            ],
+            key=self.LISTCOL, visible=False, expand_x=True,
+        )
+
+    def _panel(self, win, key: str):
+        """Return the LIBCOL/LISTCOL column, adding it to the window on first use."""
+        if key not in self._built:
+            factory = self._lib_panel if key == self.LIBCOL else self._list_panel
+            win.extend_layout(win[self.SHARED], [[factory()]])
+            self._built.add(key)
+        return win[key]
+
+    def _fill_list(self, win, root: Path, nick: str, comps: list[str]) -> None:
+        data, rows = sg.TreeData(), []
+        for comp in sorted(comps, key=str.lower):
+            data.insert("", comp, comp, [])
+            fname = f"{nick}.{comp}.vcomp" if nick else f"{comp}.vcomp"
+            rows.append((comp, str(root / "Visuino" / fname)))
+        win[self.COMPLIST].update(values=data)
+        self._thumbs.set_rows(rows)
+
+    def idle(self, win) -> None:
+        """Per event-loop turn: fetch icons for rows scrolled into view."""
+        if self._visible(win, self.LISTCOL):
+            self._thumbs.pump(win, self.COMPLIST)
+
+    def _visible(self, win, key: str) -> bool:
+        return key in self._built and win[key].visible
+
+    def _hide(self, win, key: str) -> None:
+        if key in self._built:
+            win[key].update(visible=False)
+
+    def _set(self, win, key: str, disabled: bool) -> None:
+        """Set a button's idle state; it stays disabled while its job runs."""
+        self._want[key] = disabled
+        win[key].update(disabled=disabled or self._busy[key] > 0)
+
+    def _submit(self, win, slot: str, op: str, fn, *args, root: Path | None = None,
+                busy: tuple = (), ctx=None) -> None:
+        """
+        Run `fn(*args)` on the I/O pool and post `IODONE` back to the window,
+        where `_done_<op>(result, ctx, vals, win)` applies it (`ctx` defaults
+        to `args`).
+
+        Jobs touching the same library (`root`) run in submission order, so a
+        save is never overtaken by a later read. Completions may still arrive
+        out of order across libraries; only the newest request per `slot` is
+        applied, older ones are dropped in `_io_done`.
+        """
+        token = self._tokens[slot] = self._tokens.get(slot, 0) + 1
+        for k in busy:
+            self._want.setdefault(k, bool(win[k].Disabled))
+            self._busy[k] += 1
+            win[k].update(disabled=True)
+
+        prev = self._tails.get(root) if root is not None else None
+
+        def job():
+            if prev is not None:
+                wait([prev])
+            return fn(*args)
+
+        fut = self._io.submit(job)
+        if root is not None:
+            self._tails[root] = fut
+        fut.add_done_callback(
+            lambda f: win.write_event_value(self.IODONE,
+                                            (slot, token, op, busy, ctx or args, root, f)))
+
+    def _io_done(self, vals, win) -> str | None:
+        slot, token, op, busy, ctx, root, fut = vals[self.IODONE]
+        if root is not None and self._tails.get(root) is fut:
+            del self._tails[root]               # nothing queued behind it
+        for k in busy:
+            self._busy[k] -= 1
+            win[k].update(disabled=self._want[k] or self._busy[k] > 0)
+        if token != self._tokens.get(slot):
+            return None                         # superseded by a newer request
         try:
-            fpath.touch(exist_ok=False)
-            return f"✅ Created {fname}"
-        except FileExistsError:
-            return f"⚠️ {fname} already exists."
+            result = fut.result()
         except Exception as e:
-            return f"❌ Error creating component: {e}"
+            return f"❌ {e}"
+        return getattr(self, f"_done_{op}")(result, ctx, vals, win)
+
+    def close(self) -> None:
+        """Let queued saves finish, then stop the worker threads (after the window closed)."""
+        self._io.shutdown(wait=True)
+        self._thumbs.close()
+        if self._bulk is not None:
+            self._bulk.close()
+
+    def _refresh_list(self, win, root: Path, nick: str) -> None:
+        self._submit(win, "list", "rescan", scan_components, root, nick, root=root)
+
+    def _ask_category(self) -> str | None:
+        from app_vcomp import CATEGORIES
+        win = sg.Window("Re-categorize", [
+            [sg.Text("New category:")],
+            [sg.Combo(CATEGORIES, default_value=CATEGORIES[0], key="-CAT-", size=(40, 1))],
+            [sg.Push(), sg.Button("OK"), sg.Button("Cancel")],
+        ], modal=True)
+        event, values = win.read(close=True)
+        cat = (values or {}).get("-CAT-", "").strip()
+        return cat if event == "OK" and cat else None
+
+    def _start_bulk(self, event, root: Path, nick: str, comps: list[str], win) -> str | None:
+        import app_bulk
+        if self._bulk is None:
+            self._bulk = app_bulk.BulkRunner(log=self.log)
+        if self._bulk.busy:
+            return "⏳ A bulk action is already running."
+
+        if event == self.BULKDEL:
+            if sg.popup_yes_no(f"Delete {len(comps)} component file(s)?",
+                               title="Delete components") != "Yes":
+                return None
+            label, action = "Delete", app_bulk.delete
+        elif event == self.BULKCAT:
+            cat = self._ask_category()
+            if cat is None:
+                return None
+            label, action = "Re-categorize", app_bulk.recategorize(cat)
+        else:
+            label, action = {
+                self.BULKPREP:  ("Pre populate", app_bulk.prepopulate),
+                self.BULKVALID: ("Validate", app_bulk.validate_one),
+                self.BULKHDR:   ("Regenerate headers", app_bulk.regenerate_headers),
+                self.BULKFMT:   ("Format", app_bulk.format_one),
+            }[event]
+
+        for k in (*self.BULKBTNS, self.EDITBTN, self.NEWBTN):
+            self._set(win, k, True)
+        self._set(win, self.BULKCANCEL, False)
+        win[self.BULKBAR].update(0, max=len(comps))
+        self._bulk.start(win, label, action, root, nick, comps)
+        return f"⏳ {label}: {len(comps)} component(s)…"
+
+    # ── I/O completions (Tk thread) ──────────────────────────────────
+    def _done_verify(self, state, ctx, vals, win) -> str:
+        self.library = (ctx[0], vals[self.NICK].strip()) if state == "ok" else None
+        if state == "ok":
+            # structure already fine
+            for k in (self.TOGGLE, self.LISTBTN, self.CHECKBTN, self.DUPESBTN,
+                      self.ICONBTN, self.PACKBTN, self.EXPORTBTN, self.DEPSBTN,
+                      self.INSTALLBTN, self.EXAMPLESBTN, self.SITEBTN):
+                self._set(win, k, False)
+            self._set(win, self.STRUCT, True)
+            self._set(win, self.CREATE, True)
+            self._set(win, self.EDITBTN, True)
+            return "✅ Directory & structure OK."
+        if state == "partial":
+            # dir exists, structure missing → enable STRUCT
+            self._set(win, self.CREATE, True)
+            self._set(win, self.STRUCT, False)
+            return "ℹ️ Directory exists, create structure next."
+        # dir missing → enable CREATE
+        self._set(win, self.CREATE, False)
+        self._set(win, self.STRUCT, True)
+        return "👍 Ready to create directory."
+
+    def _done_create(self, _, ctx, vals, win) -> str:
+        self._set(win, self.CREATE, True)
+        self._set(win, self.STRUCT, False)
+        return "✅ Directory created."
+
+    def _done_struct(self, props: str, ctx, vals, win) -> str:
+        self.library = (ctx[0], vals[self.NICK].strip())
+        # show editor panel
+        self._panel(win, self.LIBCOL).update(visible=True)
+        win[self.LIBTXT].update(props)
+        self._hide(win, self.LISTCOL)
+        win[self.TOGGLE].update(text="Hide structure info")
+        self._set(win, self.TOGGLE, False)
+        self._set(win, self.LISTBTN, False)
+        self._set(win, self.CHECKBTN, False)
+        self._set(win, self.DUPESBTN, False)
+        self._set(win, self.ICONBTN, False)
+        self._set(win, self.PACKBTN, False)
+        self._set(win, self.EXPORTBTN, False)
+        self._set(win, self.DEPSBTN, False)
+        self._set(win, self.INSTALLBTN, False)
+        self._set(win, self.EXAMPLESBTN, False)
+        self._set(win, self.SITEBTN, False)
+        self._set(win, self.NEWBTN, True)
+        self._set(win, self.STRUCT, True)
+        return "✅ Structure scaffolded."
+
+    def _done_props(self, props: str, ctx, vals, win) -> None:
+        if self._visible(win, self.LIBCOL):
+            win[self.LIBTXT].update(props)
+        return None
+
+    def _done_list(self, comps: list[str], ctx, vals, win) -> str:
+        self._panel(win, self.LISTCOL).update(visible=True)
+        self._fill_list(win, *ctx, comps)
+        self._hide(win, self.LIBCOL)
+        win[self.LISTBTN].update(text="Hide components")
+        self._set(win, self.NEWBTN, False)
+        self._set(win, self.EDITBTN, True)
+        win[self.TOGGLE].update(text="Show structure info")
+        return f"📚 {len(comps)} component(s)."
+
+    def _done_rescan(self, comps: list[str], ctx, vals, win) -> None:
+        if self.LISTCOL in self._built:
+            self._fill_list(win, *ctx, comps)
+        return None
+
+    def _done_newcomp(self, msg: str, ctx, vals, win) -> str:
+        root, nick, _ = ctx
+        self._refresh_list(win, root, nick)
+        return msg
+
+    def _done_edit(self, exists: bool, ctx, vals, win) -> str:
+        root, nick, comp_path = ctx
+        sel       = vals.get(self.COMPLIST) or []
+        comp_name = sel[0] if sel else comp_path.stem
+        if not exists:
+            sg.popup_error(f"Component file not found:\n{comp_path}")
+            return f"❌ {comp_path.name} is missing."
+
+        # Lazy-import to keep startup time low
+        try:
+            from app_edit_component import open_editor
+        except ImportError:
+            sg.popup_error(
+                "The file 'app_edit_component.py' could not be imported.\n"
+                "Make sure it is on PYTHONPATH or lives next to your main script."
+            )
+            return "❌ Component editor module missing."
+
+        # Open the modal editor window, disabling the main GUI meanwhile
+        win.disable()
+        try:
+            open_editor(comp_path)
+        finally:
+            win.enable()
+            win.bring_to_front()
+
+        # In case the user renamed or removed things in the editor, refresh list
+        self._refresh_list(win, root, nick)
+        return f"🛠  Finished editing {comp_name}"
+
+    def _done_check(self, results, ctx, vals, win) -> str:
+        from app_check import summarize
+        failed = [r for r in results if not r.ok]
+        if failed:
+            sg.popup_scrolled("\n\n".join(f"--- {r.header}\n{r.output}" for r in failed),
+                              title="Header check", size=(100, 30), non_blocking=True)
+        return summarize(results)
+
+    def _done_dupes(self, clusters, ctx, vals, win) -> str:
+        from app_dupes import report
+        if clusters:
+            sg.popup_scrolled(report(clusters), title="Duplicate components",
+                              size=(100, 30), non_blocking=True)
+        return f"🔍 {len(clusters)} duplicate cluster(s)." if clusters else report(clusters)
+
+    def _done_icons(self, result, ctx, vals, win) -> str:
+        from app_assets import summarize
+        self._thumbs.clear()
+        if result.errors:
+            sg.popup_scrolled("\n".join(result.errors), title="Icons", size=(100, 20),
+                              non_blocking=True)
+        return summarize(result)
+
+    def _done_examples(self, result, ctx, vals, win) -> str:
+        from app_examples import summarize
+        if result.errors:
+            sg.popup_scrolled("\n".join(result.errors), title="Examples", size=(100, 20),
+                              non_blocking=True)
+        return summarize(result)
+
+    def _done_package(self, result, ctx, vals, win) -> str:
+        from app_package import summarize
+        return summarize(result)
+
+    def _done_export(self, result, ctx, vals, win) -> str:
+        from app_export import summarize
+        return summarize(result)
+
+    def _done_site(self, result, ctx, vals, win) -> str:
+        from app_site import summarize
+        return summarize(result)
+
+    def _done_deps(self, result, ctx, vals, win) -> str:
+        from app_deps import report, summarize
+        if result.order or not result.ok or result.cycles or result.duplicates:
+            sg.popup_scrolled(report(result), title="Dependencies", size=(100, 20),
+                              non_blocking=True)
+        return summarize(result)
+
+    def _done_install(self, result, ctx, vals, win) -> str:
+        from app_install import summarize
+        return summarize(result)
+
+    def _done_save(self, _, ctx, vals, win) -> str:
+        return "💾 Saved library.properties"
 
     # ── dispatcher ────────────────────────────────────────────────────
     def handle_event(self, event, vals, win) -> str | None:
         root = self._effective_path(vals)
         nick = vals[self.NICK].strip()
+        sel  = vals.get(self.COMPLIST) or []     # list panel may not exist yet
+
+        # ---------- background I/O finished ----------
+        if event == self.IODONE:
+            return self._io_done(vals, win)
+
+        if self._thumbs.handle_event(event, vals, win, self.COMPLIST):
+            return None
 
         # ---------- VERIFY ----------
         if event == self.VERIFY:
-            if root.exists():
-                if self._structure_ok(root):
-                    # structure already fine
-                    for k in (self.TOGGLE, self.LISTBTN):
-                        win[k].update(disabled=False)
-                    win[self.STRUCT].update(disabled=True)
-                    win[self.CREATE].update(disabled=True)
-                    win[self.EDITBTN].update(disabled=True)
-                    return "✅ Directory & structure OK."
-                else:
-                    # dir exists, structure missing → enable STRUCT
-                    win[self.CREATE].update(disabled=True)
-                    win[self.STRUCT].update(disabled=False)
-                    return "ℹ️ Directory exists, create structure next."
-            else:
-                # dir missing → enable CREATE
-                win[self.CREATE].update(disabled=False)
-                win[self.STRUCT].update(disabled=True)
-                return "👍 Ready to create directory."
+            self._submit(win, "verify", "verify", verify_dir, root, root=root,
+                         busy=(self.VERIFY,))
+            return "⏳ Verifying…"
 
         # ---------- CREATE ----------
         if event == self.CREATE:
-            try:
-                root.mkdir(parents=True, exist_ok=False)
-                win[self.CREATE].update(disabled=True)
-                win[self.STRUCT].update(disabled=False)
-                return "✅ Directory created."
-            except Exception as e:
-                return f"❌ {e}"
+            self._submit(win, "create", "create", create_dir, root, root=root,
+                         busy=(self.VERIFY, self.CREATE))
+            return None
 
         # ---------- CREATE STRUCTURE ----------
         if event == self.STRUCT:
-            try:
-                (root / "SRC").mkdir(parents=True, exist_ok=True)
-                (root / "Visuino" / "images").mkdir(parents=True, exist_ok=True)
-                (root / "visuino.library").touch(exist_ok=True)
-                if not (root / "library.properties").exists():
-                    (root / "library.properties").write_text(_TEMPLATE_PROPERTIES)
-                # show editor panel
-                win[self.LIBTXT].update((root / "library.properties").read_text())
-                win[self.LIBCOL].update(visible=True)
-                win[self.TOGGLE].update(disabled=False, text="Hide structure info")
-                win[self.LISTBTN].update(disabled=False)
-                win[self.NEWBTN].update(disabled=True)
-                win[self.STRUCT].update(disabled=True)
-                return "✅ Structure scaffolded."
-            except Exception as e:
-                return f"❌ {e}"
+            self._submit(win, "struct", "struct", scaffold_structure, root, root=root,
+                         busy=(self.VERIFY, self.STRUCT))
+            return None
 
         # ---------- TOGGLE editor ----------
         if event == self.TOGGLE:
-            vis = win[self.LIBCOL].visible
-            win[self.LIBCOL].update(visible=not vis)
-            win[self.LISTCOL].update(visible=False)
+            vis = self._visible(win, self.LIBCOL)
+            self._panel(win, self.LIBCOL).update(visible=not vis)
+            self._hide(win, self.LISTCOL)
             win[self.TOGGLE].update(text="Hide structure info" if not vis
                                     else "Show structure info")
             win[self.LISTBTN].update(text="Show components")
-            win[self.NEWBTN].update(disabled=True)
-            win[self.EDITBTN].update(disabled=True)
+            self._set(win, self.NEWBTN, True)
+            self._set(win, self.EDITBTN, True)
+            self._tokens["panel"] = self._tokens.get("panel", 0) + 1   # drop pending list
             if not vis:
-                win[self.LIBTXT].update((root / "library.properties").read_text())
+                self._submit(win, "panel", "props", load_properties, root, root=root,
+                             busy=(self.SAVE,))
             return None
 
         # ---------- LIST components ----------
         if event == self.LISTBTN:
-            vis = win[self.LISTCOL].visible
+            vis = self._visible(win, self.LISTCOL)
+            self._tokens["panel"] = self._tokens.get("panel", 0) + 1   # drop pending props
             if vis:
-                win[self.LISTCOL].update(visible=False)
+                self._hide(win, self.LISTCOL)
                 win[self.LISTBTN].update(text="Show components")
-                win[self.NEWBTN].update(disabled=True)
-                win[self.EDITBTN].update(disabled=True)
+                self._set(win, self.NEWBTN, True)
+                self._set(win, self.EDITBTN, True)
                 return None
-            comps = self._scan_components(root, nick)
-            win[self.COMPLIST].update(values=comps)
-            win[self.LISTCOL].update(visible=True)
-            win[self.LIBCOL].update(visible=False)
-            win[self.LISTBTN].update(text="Hide components")
-            win[self.NEWBTN].update(disabled=False)
-            win[self.EDITBTN].update(disabled=True)
-            win[self.TOGGLE].update(text="Show structure info")
-            return f"📚 {len(comps)} component(s)."
+            self._submit(win, "panel", "list", scan_components, root, nick, root=root,
+                         busy=(self.LISTBTN,))
+            return None
 
         # ---------- LIST selection ----------
         if event == self.COMPLIST:
-            win[self.EDITBTN].update(disabled=not vals[self.COMPLIST])
+            busy = self._bulk is not None and self._bulk.busy
+            self._set(win, self.EDITBTN, len(sel) != 1 or busy)
+            for k in self.BULKBTNS:
+                self._set(win, k, not sel or busy)
+            return None
+
+        # ---------- BULK actions ----------
+        if event in self.BULKBTNS:
+            if not sel:
+                return None
+            return self._start_bulk(event, root, nick, list(sel), win)
+
+        if event == self.BULKCANCEL:
+            if self._bulk is not None:
+                self._bulk.cancel()
+            self._set(win, self.BULKCANCEL, True)
+            return "🛑 Cancelling…"
+
+        if event == self.BULKPROG:
+            done, total = vals[event]
+            win[self.BULKBAR].update(done, max=total)
             return None
 
-        # ---------- placeholder Create/Edit component ----------
-                # ---------- CREATE component ----------
+        if event == self.BULKDONE:
+            label, problems, cancelled = vals[event]
+            self._set(win, self.BULKCANCEL, True)
+            self._set(win, self.NEWBTN, False)
+            self._refresh_list(win, root, nick)
+            for k in (*self.BULKBTNS, self.EDITBTN):
+                self._set(win, k, True)
+            if problems:
+                sg.popup_scrolled("\n".join(problems), title=label, size=(100, 30),
+                                  non_blocking=True)
+            state = "cancelled" if cancelled else "done"
+            return f"{'🛑' if cancelled else '✅'} {label} {state}, {len(problems)} message(s)."
+
+        # ---------- CREATE component ----------
         if event == self.NEWBTN:
-            nick = vals[self.NICK].strip()
             comp = sg.popup_get_text("New component name:",
                                      title="Create component")
             if comp is None:        # user cancelled
                 return None
-            comp = comp.strip()
-            msg = self._create_component_file(root, nick, comp)
-            # refresh list
-            files = self._scan_components(root, nick)
-            win[self.COMPLIST].update(values=files)
-            return msg
+            self._submit(win, "newcomp", "newcomp", create_component_file,
+                         root, nick, comp.strip(), root=root, busy=(self.NEWBTN,))
+            return None
+
         # ---------- EDIT component ----------
         if event == self.EDITBTN:
             # Nothing should be enabled if there is no selection, but guard anyway
-            if not vals[self.COMPLIST]:
+            if not sel:
                 return None
 
             # Build the full path to the .vcomp the user picked
-            comp_name = vals[self.COMPLIST][0]
-            fname      = f"{nick}.{comp_name}.vcomp" if nick else f"{comp_name}.vcomp"
-            comp_path  = root / "Visuino" / fname
-
-            if not comp_path.exists():
-                sg.popup_error(f"Component file not found:\n{comp_path}")
-                return f"❌ {fname} is missing."
-
-            # Lazy-import to keep startup time low
-            try:
-                from app_edit_component import open_editor
-            except ImportError:
-                sg.popup_error(
-                    "The file 'app_edit_component.py' could not be imported.\n"
-                    "Make sure it is on PYTHONPATH or lives next to your main script."
-                )
-                return "❌ Component editor module missing."
-
-            # Open the modal editor window, disabling the main GUI meanwhile
-            win.disable()
-            try:
-                open_editor(comp_path)
-            finally:
-                win.enable()
-                win.bring_to_front()
-
-            # In case the user renamed or removed things in the editor, refresh list
-            files = self._scan_components(root, nick)
-            win[self.COMPLIST].update(values=files)
-
-            return f"🛠  Finished editing {comp_name}"
+            comp_name = sel[0]
+            fname     = f"{nick}.{comp_name}.vcomp" if nick else f"{comp_name}.vcomp"
+            comp_path = root / "Visuino" / fname
+            self._submit(win, "edit", "edit", comp_path.exists,
+                         busy=(self.EDITBTN,), ctx=(root, nick, comp_path))
+            return None
+
+        # ---------- CHECK headers ----------
+        if event == self.CHECKBTN:
+            from app_check import check_headers
+            self._submit(win, "check", "check", check_headers, root,
+                         busy=(self.CHECKBTN,))
+            return "⏳ Checking headers…"
+
+        # ---------- FIND duplicates ----------
+        if event == self.DUPESBTN:
+            from app_dupes import find_duplicates
+            self._submit(win, "dupes", "dupes", find_duplicates, [root],
+                         busy=(self.DUPESBTN,))
+            return "⏳ Looking for duplicate components…"
+
+        # ---------- GENERATE icons ----------
+        if event == self.ICONBTN:
+            from app_assets import generate_icons
+            self._submit(win, "icons", "icons", generate_icons, root, nick, root=root,
+                         busy=(self.ICONBTN,))
+            return "⏳ Generating component icons…"
+
+        # ---------- GENERATE examples ----------
+        if event == self.EXAMPLESBTN:
+            from app_examples import generate_examples
+            self._submit(win, "examples", "examples", generate_examples, root, nick, root=root,
+                         busy=(self.EXAMPLESBTN,))
+            return "⏳ Generating example sketches…"
 
+        # ---------- PACKAGE library ----------
+        if event == self.PACKBTN:
+            from app_package import package_library
+            self._submit(win, "package", "package", package_library, root, root=root,
+                         busy=(self.PACKBTN,))
+            return "⏳ Packaging library…"
+
+        # ---------- INSTALL into Arduino/libraries ----------
+        if event == self.INSTALLBTN:
+            from app_install import install_library
+            self._submit(win, "install", "install", install_library, root, root=root,
+                         busy=(self.INSTALLBTN,))
+            return "⏳ Installing library…"
+
+        # ---------- CHECK dependencies ----------
+        if event == self.DEPSBTN:
+            from app_deps import resolve_library
+            self._submit(win, "deps", "deps", resolve_library, root, root=root,
+                         busy=(self.DEPSBTN,))
+            return "⏳ Resolving dependencies…"
+
+        # ---------- BUILD HTML catalog ----------
+        if event == self.SITEBTN:
+            from app_site import build_site
+            self._submit(win, "site", "site", build_site, root, None, nick, root=root,
+                         busy=(self.SITEBTN,))
+            return "⏳ Building HTML catalog…"
+
+        # ---------- EXPORT catalog ----------
+        if event == self.EXPORTBTN:
+            from app_export import export
+            out = sg.popup_get_file("Export catalog to:", save_as=True,
+                                    default_path=str(root.parent / f"{root.name}-catalog.jsonl"),
+                                    file_types=(("JSON Lines", "*.jsonl"), ("CSV", "*.csv")))
+            if not out:
+                return None
+            self._submit(win, "export", "export", export, [root], out, None, nick,
+                         busy=(self.EXPORTBTN,))
+            return "⏳ Exporting catalog…"
 
         # ---------- SAVE ----------
         if event == self.SAVE:
-            (root / "library.properties").write_text(vals[self.LIBTXT], encoding="utf-8")
-            return "💾 Saved library.properties"
+            self._submit(win, "save", "save", save_properties, root, vals[self.LIBTXT],
+                         root=root, busy=(self.SAVE,))
+            return None
 
         return None
@@ -0,0 +1,188 @@
+"""
+Benchmarks for the library operations behind the GUI.
+
+    python bench.py [--sizes 10,1000,10000,100000] [--out bench_results.json]
+                    [--compare previous.json]
+
+For each size a synthetic library (components with realistic `.vcomp` files
+and headers) is generated in a temporary folder, then the same headless
+functions the GUI calls are timed. Results go to a JSON file; `--compare`
+prints the ratio against an earlier run and exits non-zero on regressions.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import app_bulk
+from app_cache import CACHE
+from app_vcomp import CATEGORIES, Pin, render_header, render_vcomp
+from app_workdir import (create_component_file, load_properties, save_properties,
+                         scaffold_structure, scan_components, verify_dir)
+
+NICK       = "Bench"
+PIN_TYPES  = ["TOWArduinoDigitalSinkPin", "TOWArduinoDigitalSourcePin",
+              "TOWArduinoAnalogSinkPin", "TOWArduinoAnalogSourcePin",
+              "TOWArduinoClockSinkPin"]
+REGRESSION = 1.25       # --compare flags ops that got this much slower
+
+
+# ── synthetic libraries ─────────────────────────────────────────────────
+def _pins(rng: random.Random) -> list[Pin]:
+    pins = []
+    for i in range(rng.randint(2, 6)):
+        t = rng.choice(PIN_TYPES)
+        pins.append(Pin(f"Pin{i}", t, "in" if "Sink" in t else "out"))
+    return pins
+
+
+def _filler(rng: random.Random, n: int) -> str:
+    """Method bodies so headers land at a few KB, like hand-written ones."""
+    return "".join(
+        f"\n    inline void Helper{i}()\n    {{\n"
+        + "".join(f"      FValue{j} = FValue{j} * {rng.randint(1, 99)} + {j};\n" for j in range(6))
+        + "    }\n" for i in range(n))
+
+
+def generate_library(root: Path, count: int, seed: int = 1) -> None:
+    rng = random.Random(seed)
+    scaffold_structure(root)
+    visuino, src = root / "Visuino", root / "SRC"
+    for i in range(count):
+        name = f"Comp{i:06d}"
+        pins = _pins(rng)
+        (visuino / f"{NICK}.{name}.vcomp").write_text(
+            render_vcomp(NICK, name, name, f"{name}.h", rng.choice(CATEGORIES),
+                         rng.random() < 0.3, pins), encoding="utf-8")
+        header = render_header(NICK, name, pins)
+        header = header.replace("  };\n}", _filler(rng, rng.randint(4, 10)) + "  };\n}")
+        (src / f"{name}.h").write_text(header, encoding="utf-8")
+
+
+# ── timing ──────────────────────────────────────────────────────────────
+def _time(fn, repeat: int) -> dict:
+    runs = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - t)
+    return {"min_s": min(runs), "median_s": statistics.median(runs), "runs": len(runs)}
+
+
+def bench_size(base: Path, count: int, repeat: int) -> dict:
+    root = base / f"lib{count}"
+    t = time.perf_counter()
+    generate_library(root, count)
+    gen_s = time.perf_counter() - t
+    comps = scan_components(root, NICK)
+    new   = [f"New{i:05d}" for i in range(min(count, 1000))]
+    props = load_properties(root)
+
+    def create():
+        for c in new:
+            create_component_file(root, NICK, c)
+
+    def cleanup_new():
+        for c in new:
+            (root / "Visuino" / f"{NICK}.{c}.vcomp").unlink(missing_ok=True)
+            (root / "SRC" / f"{c}.h").unlink(missing_ok=True)
+
+    def validate():
+        app_bulk.run_headless(app_bulk.validate_one, root, NICK, comps)
+
+    def validate_cold():
+        CACHE.clear()           # every repeat parses, not just the first
+        validate()
+
+    def create_and_prepopulate():
+        cleanup_new()
+        create()
+        app_bulk.run_headless(app_bulk.prepopulate, root, NICK, new)
+
+    ops = {
+        "structure_verify": (lambda: verify_dir(root), 1),
+        "component_scan":   (lambda: scan_components(root, NICK), count),
+        "create_component": (lambda: (cleanup_new(), create()), len(new)),
+        "prepopulate":      (create_and_prepopulate, len(new)),
+        "validate_cold":    (validate_cold, count),
+        "validate_warm":    (validate, count),      # parse cache hits only
+        "properties_load":  (lambda: load_properties(root), 1),
+        "properties_save":  (lambda: save_properties(root, props), 1),
+    }
+    out = {"components": count, "generate_s": gen_s, "ops": {}}
+    for name, (fn, items) in ops.items():
+        r = _time(fn, repeat)
+        r["items"] = items
+        r["per_item_us"] = r["median_s"] / max(items, 1) * 1e6
+        out["ops"][name] = r
+        print(f"  {count:>7} {name:<18} {r['median_s'] * 1000:10.2f} ms"
+              f"  ({r['per_item_us']:.1f} µs/item)")
+    return out
+
+
+def _git_rev() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, cwd=Path(__file__).parent).stdout.strip()
+    except OSError:
+        return ""
+
+
+def compare(current: dict, baseline: dict) -> list[str]:
+    """Ops whose median got slower than `REGRESSION`× the baseline."""
+    old = {(r["components"], op): v["median_s"]
+           for r in baseline["results"] for op, v in r["ops"].items()}
+    slow = []
+    for r in current["results"]:
+        for op, v in r["ops"].items():
+            before = old.get((r["components"], op))
+            if before:
+                ratio = v["median_s"] / before
+                flag = "  ⚠️" if ratio > REGRESSION else ""
+                print(f"  {r['components']:>7} {op:<18} ×{ratio:.2f}{flag}")
+                if flag:
+                    slow.append(f"{op}@{r['components']}")
+    return slow
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark headless library operations.")
+    ap.add_argument("--sizes", default="10,1000,10000,100000",
+                    help="comma separated component counts")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--out", type=Path, default=Path("bench_results.json"))
+    ap.add_argument("--compare", type=Path, help="earlier results file")
+    ap.add_argument("--workdir", type=Path, help="where to generate libraries (default: temp)")
+    args = ap.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    report = {
+        "version": _git_rev(), "python": sys.version.split()[0],
+        "platform": platform.platform(), "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "repeat": args.repeat, "results": [],
+    }
+    with tempfile.TemporaryDirectory(dir=args.workdir) as tmp:
+        for n in sizes:
+            report["results"].append(bench_size(Path(tmp), n, args.repeat))
+    args.out.write_text(json.dumps(report, indent=1), encoding="utf-8")
+    print(f"Results written to {args.out}")
+
+    if args.compare:
+        slow = compare(report, json.loads(args.compare.read_text(encoding="utf-8")))
+        if slow:
+            print(f"Regressions: {', '.join(slow)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
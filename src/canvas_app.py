@@ -1,44 +1,102 @@
+import pickle
+import threading
+import time
 import PySimpleGUI as sg
 from app_header   import header_section
 from app_workdir  import WorkdirWidget
+from app_log      import LogModel
+from app_metrics  import EventProfiler
+from app_cache    import CACHE
+from app_dashboard import Dashboard
+from app_blocks    import BlockView
 
 
-def run_app() -> None:
+def run_app(profile: bool | None = None, t_start: float | None = None) -> None:
+    """`t_start` (a `time.perf_counter()` stamp) enables the first-paint report."""
+    t_start = time.perf_counter() if t_start is None else t_start
+    prof = EventProfiler(profile)
+    log = LogModel()
     wd = WorkdirWidget()
+    wd.log = log.append
+    dash = Dashboard()
+    blocks = BlockView()
 
     layout = [
         header_section(),
         *wd.layout,
-        [sg.Text("Canvas area / background",
-                 size=(60, 15),
-                 background_color="lightgrey",
-                 key="-CANVAS-",
-                 expand_x=True, expand_y=True)],
-        [sg.Text("", key="-DEBUG-", size=(120, 2),
-                 text_color="white", background_color="black",
-                 font=("Consolas", 10, "bold"))],
+        [sg.TabGroup([[sg.Tab("Statistics", [[dash.element()]]),
+                       sg.Tab("Blocks", blocks.layout())]],
+                     key="-CANVAS-", expand_x=True, expand_y=True)],
+        [sg.Multiline("", key="-LOG-", size=(120, 6), disabled=True,
+                      autoscroll=True, expand_x=True,
+                      text_color="white", background_color="black",
+                      font=("Consolas", 10, "bold"))],
         [sg.Button("Exit")],
     ]
+    if prof.overlay:
+        layout.insert(-1, [sg.Text("", key="-PROFILE-", font=("Consolas", 9),
+                                   text_color="yellow", background_color="black",
+                                   expand_x=True)])
 
+    # No finalize=True: the first read() below builds and maps the window in
+    # one go, and the remaining setup happens once it is on screen.
     window = sg.Window("Visuino Component Creator",
                        layout,
                        size=(1200, 800),
-                       resizable=True,
-                       finalize=True)
+                       resizable=True)
+    window.read(timeout=0)
+    window.TKroot.update_idletasks()
+    log.append(f"🚀 Window shown in {(time.perf_counter() - t_start) * 1000:.0f} ms.")
     window.TKroot.minsize(1200, 800)
+    # Warm the parse cache from the previous session without delaying startup
+    threading.Thread(target=CACHE.load, daemon=True, name="cache-load").start()
+    blocks.bind(window)
+    dash.start(window)
 
+    prof.install(sg)
+    clock, last_overlay = time.perf_counter_ns, 0
     while True:
-        event, values = window.read()
+        t_read = clock() if prof.enabled else 0
+        # Wake up periodically so log lines posted by workers get rendered
+        event, values = window.read(timeout=100)
         if event in (sg.WINDOW_CLOSED, "Exit"):
             break
 
         # Forward all events to widget
-        dbg = wd.handle_event(event, values, window)
-        if dbg:
-            window["-DEBUG-"].update(dbg)
-            print(dbg)
+        t_handle = clock() if prof.enabled else 0
+        if event == dash.EVENT:
+            dash.handle_event(event, values, window)
+            _, delta, first = values[event]
+            if first:
+                blocks.reset(window)
+            if delta is not None:
+                blocks.apply(delta, window)
+        elif event != sg.TIMEOUT_EVENT and not blocks.handle_event(event, values, window):
+            dbg = wd.handle_event(event, values, window)
+            if dbg:
+                log.append(dbg)
+            if wd.library != dash.library:
+                dash.set_library(wd.library)
+        if prof.enabled:
+            t_end = clock()
+            idle = event == sg.TIMEOUT_EVENT
+            prof.record(event, t_read, t_handle, t_handle if idle else t_end, idle)
+            if prof.overlay and t_end - last_overlay > 1_000_000_000:
+                last_overlay = t_end
+                window["-PROFILE-"].update(prof.summary())
+        wd.idle(window)
+        log.render(window["-LOG-"])
 
     window.close()
+    wd.close()
+    if prof.enabled:
+        prof.uninstall(sg)
+        log.append(f"📈 Profile written to {prof.dump()}")
+    try:
+        CACHE.save()
+    except (OSError, pickle.PicklingError) as e:
+        log.append(f"⚠️ Could not save parse cache: {e}")
+    log.close()
 
 
 if __name__ == "__main__":
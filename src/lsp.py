@@ -0,0 +1,421 @@
+"""
+Language server for `.vcomp` files, speaking LSP over stdio.
+
+    python lsp.py           # configure it as the editor's server for *.vcomp
+
+Offers diagnostics (parse errors plus the validator's checks), completion of
+attribute names, categories, pin types, `SRC/` headers and classes, and
+go-to-definition from `ArduinoInclude` / `ArduinoClass` to the header.
+
+Documents are synced incrementally. Tokens are cached per line, and the parse
+is cached per top-level declaration ("segment") with line numbers relative to
+the segment start. An edit retokenizes only the touched lines and reparses
+from the segment containing the edit until the parser reaches a boundary an
+old segment also started at; every segment after that is reused unchanged.
+All open documents of a library share one workspace index (components through
+`ComponentIndex`, headers and their classes), refreshed in the background on
+save; the server's state lock keeps those refreshes from publishing while a
+request is editing or reading a document.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import sys
+import threading
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from pathlib import Path
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+from app_vcomp import (CATEGORIES, DEFAULT_PINS, Diagnostic, Document, Node, Token, _Parser,
+                       check_components, iter_components, tokenize_lines, validate)
+
+ATTRIBUTES = ("Name", "CreateName", "ArduinoInclude", "ArduinoClass", "Category",
+              "ArduinoLoopBegin")
+BASE_TYPES = ("Namespace", "TArduinoComponent")
+
+_ATTR_ARG_RE = re.compile(r"\[\s*(\w+)\s*\(\s*'?[^'()]*$")
+_ATTR_NAME_RE = re.compile(r"\[\s*\w*$")
+_TYPE_RE = re.compile(r"^\s*\+?\w+\s*:\s*\w*$")
+_INCLUDE_RE = re.compile(r"ArduinoInclude\(\s*'([^']*)'")
+_CLASS_RE = re.compile(r"ArduinoClass\(\s*'([^']*)'")
+_CPP_NS_RE = re.compile(r"^\s*namespace\s+(\w+)")
+_CPP_CLASS_RE = re.compile(r"^\s*(?:template\s*<[^>]*>\s*)?(?:class|struct)\s+(\w+)\b(?!\s*;)")
+
+
+# ── helpers ─────────────────────────────────────────────────────────────
+def uri_to_path(uri: str) -> Path:
+    return Path(url2pathname(urlparse(uri).path))
+
+
+def _index(line: str, utf16: int) -> int:
+    """LSP character offset (UTF-16 code units) → str index."""
+    if line.isascii():
+        return min(utf16, len(line))
+    units = 0
+    for i, ch in enumerate(line):
+        if units >= utf16:
+            return i
+        units += 2 if ord(ch) > 0xFFFF else 1
+    return len(line)
+
+
+def _utf16(line: str, index: int) -> int:
+    head = line[:index]
+    return len(head) if head.isascii() else len(head.encode("utf-16-le")) // 2
+
+
+def _tok_line(line: str) -> list[Token]:
+    return list(tokenize_lines([line + "\n"]))
+
+
+def _rebase(nodes: list[Node], offset: int) -> None:
+    for n in nodes:
+        n.line -= offset
+        n.end_line -= offset
+        for a in n.attrs:
+            a.line -= offset
+        _rebase(n.children, offset)
+
+
+# ── documents ───────────────────────────────────────────────────────────
+@dataclass
+class Segment:
+    """Lines [start, start + length) holding whole top-level declarations."""
+    start: int
+    length: int
+    nodes: list[Node]               # line numbers relative to `start`
+    errors: list[Diagnostic]        # relative; line -1 means "end of file"
+    checks: list[Diagnostic] | None = None      # validator output, None when stale
+    comps: list = field(default_factory=list)
+
+
+class VDoc:
+    def __init__(self, uri: str, text: str) -> None:
+        self.uri, self.path = uri, uri_to_path(uri)
+        self.lines = text.split("\n")
+        self.toks = [_tok_line(l) for l in self.lines]
+        self.segs: list[Segment] = []
+        self.reparsed = 0                   # lines parsed by the last update
+        self._reparse(0, -1, -1, 0)
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self.lines)
+
+    def _stream(self, first: int):
+        for i in range(first, len(self.lines)):
+            for t in self.toks[i]:
+                yield Token(t.kind, t.value, i, t.col)
+
+    def _starts_line(self, tok: Token) -> bool:
+        return self.toks[tok.line][0].col == tok.col
+
+    def _reparse(self, first: int, old_last: int, new_last: int, delta: int) -> None:
+        """Reparse after lines [first, old_last] became [first, new_last]."""
+        old = self.segs
+        i = max(0, bisect_right([s.start for s in old], first) - 1)
+        head, start = old[:i], (old[i].start if old else 0)
+        tail = [s for s in old[i:] if s.start > old_last]
+        for s in tail:
+            s.start += delta
+        resume = {s.start: k for k, s in enumerate(tail)}
+
+        p = _Parser(self._stream(start))
+        new, nodes, err0, seg_start = [], [], 0, start
+
+        def close(end: int) -> None:
+            errs = [e if e.line < 0 else e._replace(line=e.line - seg_start)
+                    for e in p.errors[err0:]]
+            _rebase(nodes, seg_start)
+            new.append(Segment(seg_start, end - seg_start, nodes, errs))
+
+        while True:
+            unit = p.parse_unit()
+            if unit is None:
+                close(len(self.lines))
+                tail = []
+                break
+            nodes += unit
+            p._skip_trivia()
+            nxt = p._tok
+            if nxt is None or not self._starts_line(nxt):
+                continue
+            close(nxt.line)
+            seg_start, nodes, err0 = nxt.line, [], len(p.errors)
+            if seg_start > new_last and seg_start in resume:
+                tail = tail[resume[seg_start]:]
+                break
+        self.reparsed = sum(s.length for s in new)
+        self.segs = head + new + tail
+
+    def apply(self, change: dict) -> None:
+        if "range" not in change:
+            self.__init__(self.uri, change["text"])
+            return
+        r, last = change["range"], len(self.lines) - 1
+        sl, el = min(r["start"]["line"], last), min(r["end"]["line"], last)
+        sc = _index(self.lines[sl], r["start"]["character"] if r["start"]["line"] <= last else 1 << 30)
+        ec = _index(self.lines[el], r["end"]["character"] if r["end"]["line"] <= last else 1 << 30)
+        new = (self.lines[sl][:sc] + change["text"] + self.lines[el][ec:]).split("\n")
+        self.lines[sl:el + 1] = new
+        self.toks[sl:el + 1] = [_tok_line(l) for l in new]
+        self._reparse(sl, el, sl + len(new) - 1, len(new) - (el - sl + 1))
+
+    def invalidate_checks(self) -> None:
+        for s in self.segs:
+            s.checks = None
+
+    def diagnostics(self, src_dir: Path | None) -> list[Diagnostic]:
+        out, any_comp, any_err = [], False, False
+        last = len(self.lines) - 1
+        for s in self.segs:
+            if s.checks is None:
+                doc = Document(s.nodes, [])
+                s.comps = list(iter_components(doc))
+                s.checks = check_components(doc, s.comps, src_dir)
+            any_comp |= bool(s.comps)
+            any_err |= bool(s.errors)
+            out += [e._replace(line=last if e.line < 0 else e.line + s.start)
+                    for e in s.errors]
+            out += [e._replace(line=e.line + s.start) for e in s.checks]
+        if not any_comp and not any_err:
+            out += validate(Document())     # the "no component declared" notice
+        return out
+
+
+# ── workspace index ─────────────────────────────────────────────────────
+class Library:
+    """Completion data for one library, shared by all of its open documents."""
+
+    def __init__(self, root: Path) -> None:
+        from app_index import ComponentIndex
+        self.root = root
+        self._index = ComponentIndex(root, "")
+        self._lock = threading.Lock()
+        self._header_classes: dict[str, tuple[int, dict[str, int]]] = {}   # rel → (mtime, classes)
+        self.categories: list[str] = list(CATEGORIES)
+        self.pin_types: list[str] = sorted({p.type for p in DEFAULT_PINS})
+        self.headers: list[str] = []
+        self.classes: dict[str, tuple[str, int]] = {}      # "ns::Class" → (header, line)
+
+    def refresh(self) -> None:
+        with self._lock:
+            self._index.refresh()
+            cats, pins = set(CATEGORIES), {p.type for p in DEFAULT_PINS}
+            for e in self._index.entries():
+                if e.category:
+                    cats.add(e.category)
+                pins.update(p.type for p in e.pins)
+            headers, classes = [], {}
+            for h in sorted((self.root / "SRC").rglob("*.h")):
+                rel = h.relative_to(self.root / "SRC").as_posix()
+                headers.append(rel)
+                for name, line in self._scan_header(h, rel).items():
+                    classes[name] = (rel, line)
+            self.categories, self.pin_types = sorted(cats), sorted(pins)
+            self.headers, self.classes = headers, classes
+
+    def _scan_header(self, path: Path, rel: str) -> dict[str, int]:
+        try:
+            mtime = path.stat().st_mtime_ns
+            cached = self._header_classes.get(rel)
+            if cached and cached[0] == mtime:
+                return cached[1]
+            found, ns = {}, ""
+            with open(path, encoding="utf-8", errors="replace") as f:
+                for n, line in enumerate(f):
+                    if m := _CPP_NS_RE.match(line):
+                        ns = m.group(1)
+                    elif m := _CPP_CLASS_RE.match(line):
+                        found[f"{ns}::{m.group(1)}" if ns else m.group(1)] = n
+        except OSError:
+            return {}
+        self._header_classes[rel] = (mtime, found)
+        return found
+
+
+# ── server ──────────────────────────────────────────────────────────────
+class Server:
+    def __init__(self, rfile=None, wfile=None) -> None:
+        self.rfile = rfile or sys.stdin.buffer
+        self.wfile = wfile or sys.stdout.buffer
+        self.docs: dict[str, VDoc] = {}
+        self.libs: dict[Path, Library] = {}
+        self._write_lock = threading.Lock()
+        self._lock = threading.Lock()       # docs/libs: request handlers vs index refreshes
+        self._shutdown = False
+
+    # ── JSON-RPC ─────────────────────────────────────────────────────
+    def read(self) -> dict | None:
+        length = None
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return None
+            line = line.strip()
+            if not line:
+                break
+            key, _, value = line.decode("ascii").partition(":")
+            if key.strip().lower() == "content-length":
+                length = int(value)
+        return json.loads(self.rfile.read(length)) if length else {}
+
+    def send(self, msg: dict) -> None:
+        body = json.dumps({"jsonrpc": "2.0", **msg}, separators=(",", ":")).encode()
+        with self._write_lock:
+            self.wfile.write(b"Content-Length: %d\r\n\r\n" % len(body) + body)
+            self.wfile.flush()
+
+    def serve(self) -> int:
+        while (msg := self.read()) is not None:
+            method, mid = msg.get("method"), msg.get("id")
+            if method == "exit":
+                return 0 if self._shutdown else 1
+            handler = getattr(self, "on_" + (method or "").replace("/", "_"), None)
+            if handler is None:
+                if mid is not None and method:
+                    self.send({"id": mid, "error": {"code": -32601,
+                                                    "message": f"Unhandled {method}"}})
+                continue
+            try:
+                with self._lock:
+                    result = handler(msg.get("params") or {})
+            except Exception as e:  # noqa: BLE001 - keep serving
+                if mid is not None:
+                    self.send({"id": mid, "error": {"code": -32603, "message": str(e)}})
+                continue
+            if mid is not None:
+                self.send({"id": mid, "result": result})
+        return 0
+
+    # ── library / diagnostics ────────────────────────────────────────
+    def library(self, doc: VDoc) -> Library | None:
+        if doc.path.parent.name != "Visuino":
+            return None
+        root = doc.path.parent.parent
+        lib = self.libs.get(root)
+        if lib is None:
+            lib = self.libs[root] = Library(root)
+            self._refresh(lib)
+        return lib
+
+    def _refresh(self, lib: Library) -> None:
+        def run():
+            lib.refresh()                   # the slow part, outside the server lock
+            with self._lock:
+                for doc in self.docs.values():
+                    if self.library(doc) is lib:
+                        doc.invalidate_checks()
+                        self.publish(doc)
+        threading.Thread(target=run, daemon=True, name="lsp-index").start()
+
+    def publish(self, doc: VDoc) -> None:
+        lib = self.library(doc)
+        out = []
+        for d in doc.diagnostics(lib.root / "SRC" if lib else None):
+            line = doc.lines[d.line] if d.line < len(doc.lines) else ""
+            out.append({
+                "range": {"start": {"line": d.line, "character": _utf16(line, d.col)},
+                          "end": {"line": d.line, "character": _utf16(line, len(line))}},
+                "severity": 1 if d.severity == "error" else 2,
+                "source": "vcomp",
+                "message": d.message,
+            })
+        self.send({"method": "textDocument/publishDiagnostics",
+                   "params": {"uri": doc.uri, "diagnostics": out}})
+
+    # ── lifecycle ────────────────────────────────────────────────────
+    def on_initialize(self, params) -> dict:
+        return {"capabilities": {
+                    "textDocumentSync": {"openClose": True, "change": 2,
+                                         "save": {"includeText": False}},
+                    "completionProvider": {"triggerCharacters": ["[", "(", "'", ":"]},
+                    "definitionProvider": True},
+                "serverInfo": {"name": "vcomp-lsp"}}
+
+    def on_initialized(self, params) -> None:
+        return None
+
+    def on_shutdown(self, params) -> None:
+        self._shutdown = True
+        return None
+
+    # ── documents ────────────────────────────────────────────────────
+    def on_textDocument_didOpen(self, params) -> None:
+        td = params["textDocument"]
+        doc = self.docs[td["uri"]] = VDoc(td["uri"], td["text"])
+        self.publish(doc)
+
+    def on_textDocument_didChange(self, params) -> None:
+        doc = self.docs.get(params["textDocument"]["uri"])
+        if doc is None:
+            return
+        for change in params["contentChanges"]:
+            doc.apply(change)
+        self.publish(doc)
+
+    def on_textDocument_didSave(self, params) -> None:
+        doc = self.docs.get(params["textDocument"]["uri"])
+        lib = self.library(doc) if doc else None
+        if lib is not None:
+            self._refresh(lib)
+
+    def on_textDocument_didClose(self, params) -> None:
+        uri = params["textDocument"]["uri"]
+        self.docs.pop(uri, None)
+        self.send({"method": "textDocument/publishDiagnostics",
+                   "params": {"uri": uri, "diagnostics": []}})
+
+    # ── features ─────────────────────────────────────────────────────
+    def _line(self, params) -> tuple[VDoc | None, str, int]:
+        doc = self.docs.get(params["textDocument"]["uri"])
+        pos = params["position"]
+        if doc is None or pos["line"] >= len(doc.lines):
+            return None, "", 0
+        line = doc.lines[pos["line"]]
+        return doc, line, _index(line, pos["character"])
+
+    def on_textDocument_completion(self, params) -> list[dict]:
+        doc, line, col = self._line(params)
+        if doc is None:
+            return []
+        lib, pre = self.library(doc), line[:col]
+        if m := _ATTR_ARG_RE.search(pre):
+            if lib is None:
+                words, kind = (CATEGORIES if m.group(1) == "Category" else []), 20
+            else:
+                words, kind = {"Category": (lib.categories, 20),
+                               "ArduinoInclude": (lib.headers, 17),
+                               "ArduinoClass": (list(lib.classes), 7)}.get(m.group(1), ([], 1))
+        elif _ATTR_NAME_RE.search(pre):
+            words, kind = ATTRIBUTES, 10
+        elif _TYPE_RE.search(pre):
+            words, kind = [*BASE_TYPES, *(lib.pin_types if lib else
+                                          sorted({p.type for p in DEFAULT_PINS}))], 7
+        else:
+            return []
+        return [{"label": w, "kind": kind} for w in words]
+
+    def on_textDocument_definition(self, params) -> dict | None:
+        doc, line, _ = self._line(params)
+        lib = self.library(doc) if doc else None
+        if lib is None:
+            return None
+        target = None
+        if m := _INCLUDE_RE.search(line):
+            target = (m.group(1), 0)
+        elif m := _CLASS_RE.search(line):
+            target = lib.classes.get(m.group(1))
+        if target is None or not (lib.root / "SRC" / target[0]).exists():
+            return None
+        pos = {"line": target[1], "character": 0}
+        return {"uri": (lib.root / "SRC" / target[0]).resolve().as_uri(),
+                "range": {"start": pos, "end": pos}}
+
+
+if __name__ == "__main__":
+    sys.exit(Server().serve())
@@ -0,0 +1,56 @@
+// Stand-in for Visuino's Mitov.h, used only by the offline header check
+// (app_check.py). It declares just enough of the runtime for generated
+// component headers to pass `-fsyntax-only`; nothing here is linked.
+#pragma once
+
+#include <stdint.h>
+#include <stddef.h>
+
+// ── Arduino core stand-ins ─────────────────────────────────────────────
+typedef uint8_t byte;
+typedef bool    boolean;
+
+#define HIGH   0x1
+#define LOW    0x0
+#define INPUT  0x0
+#define OUTPUT 0x1
+
+unsigned long millis();
+unsigned long micros();
+void          pinMode( uint8_t, uint8_t );
+void          digitalWrite( uint8_t, uint8_t );
+int           digitalRead( uint8_t );
+int           analogRead( uint8_t );
+void          analogWrite( uint8_t, int );
+void          delay( unsigned long );
+
+// ── pin declaration helper ─────────────────────────────────────────────
+#define _V_PIN_( A ) T_##A A;
+
+namespace Mitov
+{
+  class OpenWirePin
+  {
+  public:
+    inline void Notify( void *_Data ) {}
+    inline bool IsConnected() { return true; }
+  };
+
+  class TOWArduinoDigitalSinkPin   : public OpenWirePin {};
+  class TOWArduinoDigitalSourcePin : public OpenWirePin {};
+  class TOWArduinoAnalogSinkPin    : public OpenWirePin {};
+  class TOWArduinoAnalogSourcePin  : public OpenWirePin {};
+  class TOWArduinoClockSinkPin     : public OpenWirePin {};
+  class TOWArduinoClockSourcePin   : public OpenWirePin {};
+  class TOWArduinoIntegerSinkPin   : public OpenWirePin {};
+  class TOWArduinoIntegerSourcePin : public OpenWirePin {};
+
+  template <typename T> class TypedPin : public OpenWirePin
+  {
+  public:
+    inline void SetPinValue( T AValue ) {}
+  };
+
+  template <typename T_Value> class DigitalPin : public TypedPin<bool> {};
+  template <typename T_Value> class AnalogPin  : public TypedPin<float> {};
+} // Mitov
@@ -0,0 +1,131 @@
+"""
+Watch mode: regenerate `SRC/` headers while `.vcomp` files are being edited.
+
+    python watch.py <library root> [--debounce 0.15] [--workers 2]
+
+`Visuino/*.vcomp` is polled (no extra dependencies); a file is handled once
+its size/mtime has been stable for the debounce window, so an editor's burst
+of saves costs one regeneration. Changed files go through a bounded queue to a
+fixed set of workers, which parse the component and generate or patch its
+header with the same templates Pre populate uses (`app_vcomp`).
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+from app_vcomp import sync_headers
+
+
+class Watcher:
+    def __init__(self, root: Path, *, debounce: float = 0.15, interval: float = 0.05,
+                 workers: int = 2, queue_size: int = 64,
+                 log: Callable[[str], None] = print) -> None:
+        self.root     = root
+        self.debounce = debounce
+        self.interval = interval
+        self.log      = log
+        self._queue: queue.Queue[Path] = queue.Queue(maxsize=queue_size)
+        self._seen: dict[str, tuple[int, int]] = {}
+        self._pending: dict[str, float] = {}     # path → time of last change
+        self._inflight: set[str] = set()
+        self._lock    = threading.Lock()
+        self._stop    = threading.Event()
+        self._workers = [threading.Thread(target=self._work, daemon=True, name=f"watch-{i}")
+                         for i in range(workers)]
+
+    # ── scanning ─────────────────────────────────────────────────────
+    def _scan(self) -> dict[str, tuple[int, int]]:
+        out = {}
+        try:
+            with os.scandir(self.root / "Visuino") as it:
+                for e in it:
+                    if e.name.endswith(".vcomp") and e.is_file():
+                        try:
+                            st = e.stat()
+                        except OSError:
+                            continue
+                        out[e.path] = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            pass
+        return out
+
+    def prime(self) -> None:
+        """Treat the current state of the folder as already processed."""
+        self._seen = self._scan()
+
+    def poll(self) -> None:
+        """One scan: record changes, then hand settled files to the workers."""
+        now, snap = time.monotonic(), self._scan()
+        for path, sig in snap.items():
+            if self._seen.get(path) != sig:
+                self._pending[path] = now       # restart the debounce window
+        for path in self._seen.keys() - snap.keys():
+            self._pending.pop(path, None)
+        self._seen = snap
+
+        for path, t in list(self._pending.items()):
+            if now - t < self.debounce:
+                continue
+            with self._lock:
+                if path in self._inflight:      # picked up again after it finishes
+                    continue
+                try:
+                    self._queue.put_nowait(Path(path))
+                except queue.Full:              # back-pressure: retry next poll
+                    break
+                self._inflight.add(path)
+            del self._pending[path]
+
+    # ── workers ──────────────────────────────────────────────────────
+    def _work(self) -> None:
+        while True:
+            path = self._queue.get()
+            try:
+                for msg in sync_headers(self.root, path):
+                    self.log(msg)
+            except Exception as e:  # noqa: BLE001
+                self.log(f"❌ {path.name}: {e}")
+            finally:
+                with self._lock:
+                    self._inflight.discard(str(path))
+                self._queue.task_done()
+
+    def run(self) -> None:
+        for w in self._workers:
+            w.start()
+        self.prime()
+        self.log(f"👀 Watching {self.root / 'Visuino'} (Ctrl+C to stop)")
+        while not self._stop.is_set():
+            self.poll()
+            self._stop.wait(self.interval)
+
+    def stop(self) -> None:
+        self._stop.set()
+
+
+def main(argv: list[str] | None = None) -> None:
+    ap = argparse.ArgumentParser(description="Regenerate SRC/ headers as .vcomp files change.")
+    ap.add_argument("root", type=Path, help="library root (contains Visuino/ and SRC/)")
+    ap.add_argument("--debounce", type=float, default=0.15, help="seconds a file must be stable")
+    ap.add_argument("--interval", type=float, default=0.05, help="seconds between scans")
+    ap.add_argument("--workers", type=int, default=2)
+    ap.add_argument("--queue-size", type=int, default=64)
+    args = ap.parse_args(argv)
+
+    w = Watcher(args.root.expanduser(), debounce=args.debounce, interval=args.interval,
+                workers=args.workers, queue_size=args.queue_size)
+    try:
+        w.run()
+    except KeyboardInterrupt:
+        w.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""The PNG codec rejects damaged files with ValueError, which the icon stage reports."""
+
+import struct
+import zlib
+
+import pytest
+
+from app_assets import _chunk, decode_png, encode_png, generate_icons
+from app_vcomp import render_vcomp
+
+
+def _png(w, h, raw, ctype=6):
+    return (b"\x89PNG\r\n\x1a\n"
+            + _chunk(b"IHDR", struct.pack(">IIBBBBB", w, h, 8, ctype, 0, 0, 0))
+            + _chunk(b"IDAT", zlib.compress(raw)) + _chunk(b"IEND", b""))
+
+
+def test_round_trip():
+    rgba = bytes(range(64))
+    assert decode_png(encode_png(4, 4, rgba)) == (4, 4, bytearray(rgba))
+
+
+@pytest.mark.parametrize("raw", [bytes(5), bytes(4 * 17 + 1), b"\x07" + bytes(16) * 4])
+def test_bad_image_data(raw):
+    with pytest.raises(ValueError):
+        decode_png(_png(4, 4, raw))
+
+
+def test_palette_index_out_of_range():
+    data = _png(1, 1, b"\0\x05", ctype=3)
+    data = data[:33] + _chunk(b"PLTE", bytes(6)) + data[33:]
+    with pytest.raises(ValueError):
+        decode_png(data)
+
+
+def test_one_bad_icon_does_not_stop_the_stage(tmp_path):
+    (tmp_path / "Visuino").mkdir()
+    (tmp_path / "icons").mkdir()
+    for name in ("Good", "Bad"):
+        (tmp_path / "Visuino" / f"Me.{name}.vcomp").write_text(
+            render_vcomp("Me", name, name, f"{name}.h", "Math", False), encoding="utf-8")
+    (tmp_path / "icons" / "TArduinoGood.png").write_bytes(encode_png(4, 4, bytes(64)))
+    (tmp_path / "icons" / "TArduinoBad.png").write_bytes(_png(4, 4, bytes(5)))
+    res = generate_icons(tmp_path, "Me", workers=1)
+    assert res.written == 1
+    assert len(res.errors) == 1 and "TArduinoBad" in res.errors[0]
+    assert (tmp_path / "Visuino" / "images" / "TArduinoGood.png").exists()
@@ -0,0 +1,89 @@
+"""depends= parsing, version constraints and resolution against installed libraries."""
+
+import pytest
+
+from app_deps import (DependencyIndex, Requirement, parse_depends, resolve_library,
+                      satisfies)
+
+
+def _install(libraries, folder, name=None, version="1.0.0", depends=""):
+    d = libraries / folder
+    d.mkdir(parents=True)
+    (d / "library.properties").write_text(
+        f"name={name or folder}\nversion={version}\ndepends={depends}\n")
+    return d
+
+
+def test_parse_depends():
+    assert parse_depends("Adafruit GFX Library (>=1.10.0), Wire,  Servo ( <2.0 )") == (
+        Requirement("Adafruit GFX Library", ">=1.10.0"), Requirement("Wire"),
+        Requirement("Servo", "<2.0"))
+    assert parse_depends("") == ()
+
+
+@pytest.mark.parametrize("version, constraint, ok", [
+    ("1.2.3", "", True),
+    ("1.2.3", ">=1.2", True),
+    ("1.2.3", "=1.2.3", True),
+    ("1.2", "==1.2.0", True),
+    ("1.10.0", ">1.9.0", True),              # numeric, not string, order
+    ("1.2.3", "<1.2.3", False),
+    ("1.2.3", "!=1.2.3", False),
+    ("2.0.0-beta", "<2.0.0", True),          # a pre-release sorts before the release
+    ("v1.5.0", ">=1.5", True),
+    ("1.5.0", ">=1.0 && <2.0", True),
+    ("2.5.0", ">=1.0 && <2.0", False),
+    ("0.9.0", "<1.0 || >=3.0", True),
+    ("1.5.0", "!(>=1.0 && <2.0)", False),
+    ("1.5.0", "!=1.4", True),
+    ("", ">=1.0", False),                    # no version satisfies a constraint
+])
+def test_satisfies(version, constraint, ok):
+    assert satisfies(version, constraint) is ok
+
+
+def test_transitive_order_missing_and_conflicts(tmp_path):
+    _install(tmp_path, "Core", version="1.4.0")
+    _install(tmp_path, "Gfx", version="2.1.0", depends="Core (>=1.2)")
+    _install(tmp_path, "Bus", version="0.3.0", depends="Core, Gone")
+    me = _install(tmp_path, "Me", depends="Gfx (>=2.0), Bus (>=1.0), Core")
+    r = resolve_library(me)
+    assert [d.name for d in r.order] == ["Core", "Gfx", "Bus"]     # dependencies first
+    assert [(p.library, p.requirement.name) for p in r.missing] == [("Bus", "Gone")]
+    assert [(p.library, p.requirement, p.found) for p in r.conflicts] == \
+        [("Me", Requirement("Bus", ">=1.0"), "0.3.0")]
+    assert not r.ok and r.cycles == [] and r.duplicates == []
+
+
+def test_cycles_are_reported_once_and_terminate(tmp_path):
+    _install(tmp_path, "A", depends="B")
+    _install(tmp_path, "B", depends="C")
+    _install(tmp_path, "C", depends="A")
+    r = resolve_library(tmp_path / "A")
+    assert r.cycles == [["A", "B", "C", "A"]]
+    assert [d.name for d in r.order] == ["C", "B"]
+    assert r.ok
+
+
+def test_duplicates(tmp_path):
+    _install(tmp_path, "Core", version="1.0.0")
+    _install(tmp_path, "Core-copy", name="Core", version="2.0.0")
+    me = _install(tmp_path, "Me", depends="Core")
+    _install(tmp_path, "Me-old", name="Me", version="0.1.0")
+    r = resolve_library(me)
+    assert r.ok
+    assert [(d.chosen.folder, [o.folder for o in d.others]) for d in r.duplicates] == \
+        [("Me", ["Me-old"]), ("Core", ["Core-copy"])]
+    assert r.order[0].folder == "Core"
+
+
+def test_refresh_rereads_only_edited_files(tmp_path):
+    _install(tmp_path, "A", depends="B")
+    _install(tmp_path, "B")
+    idx = DependencyIndex(tmp_path)
+    assert idx.refresh() == 2
+    assert idx.refresh() == 0
+    assert DependencyIndex(tmp_path).refresh() == 0         # stamps come from deps.json
+    (tmp_path / "B" / "library.properties").write_text("name=B\nversion=3.0.0\n")
+    assert idx.refresh() == 1
+    assert idx.get("B").version == "3.0.0"
@@ -0,0 +1,33 @@
+"""Duplicate detection does not mistake the Pre populate skeleton for copying."""
+
+from app_dupes import find_duplicates
+from app_vcomp import CATEGORIES, DEFAULT_PINS, Pin, render_vcomp
+
+EXTRA = [Pin("Clock", "TOWArduinoClockSinkPin", "in"),
+         Pin("Value", "TOWArduinoAnalogSourcePin", "out"),
+         Pin("Reset", "TOWArduinoClockSinkPin", "in")]
+
+
+def _write(root, name, category=CATEGORIES[0], loop=False, pins=DEFAULT_PINS):
+    (root / "Visuino" / f"Me.{name}.vcomp").write_text(
+        render_vcomp("Me", name, name, f"{name}.h", category, loop, pins), encoding="utf-8")
+
+
+def test_prepopulated_components_do_not_cluster(tmp_path):
+    (tmp_path / "Visuino").mkdir()
+    for i in range(450):
+        _write(tmp_path, f"Comp{i}", CATEGORIES[i % len(CATEGORIES)], i % 2 == 0)
+    assert find_duplicates([tmp_path], workers=1) == []
+
+
+def test_copied_components_still_cluster(tmp_path):
+    (tmp_path / "Visuino").mkdir()
+    for i in range(20):
+        _write(tmp_path, f"Comp{i}", CATEGORIES[i % len(CATEGORIES)])
+    _write(tmp_path, "Counter", pins=[*DEFAULT_PINS, *EXTRA])
+    _write(tmp_path, "CounterCopy", pins=[*DEFAULT_PINS, *EXTRA])
+    _write(tmp_path, "Other", pins=[*DEFAULT_PINS, EXTRA[1]])
+    clusters = find_duplicates([tmp_path], workers=1)
+    assert len(clusters) == 1
+    assert [p.rsplit(".", 2)[-2] for p in clusters[0].paths] == ["Counter", "CounterCopy"]
+    assert clusters[0].exact
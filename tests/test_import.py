@@ -0,0 +1,38 @@
+"""Importing an Arduino library never shadows the upstream headers."""
+
+import subprocess
+
+import pytest
+
+from app_check import STUB_DIR, find_compiler
+from app_import import import_library
+
+
+@pytest.fixture
+def servo(tmp_path):
+    up = tmp_path / "Servo" / "src"
+    up.mkdir(parents=True)
+    (up / "Servo.h").write_text(
+        "#pragma once\nclass Servo\n{\npublic:\n  void attach(int pin);\n};\n")
+    root = tmp_path / "Me"
+    (root / "SRC").mkdir(parents=True)
+    (root / "Visuino" / "images").mkdir(parents=True)
+    return tmp_path / "Servo", root
+
+
+def test_wrapper_for_same_named_header(servo):
+    lib, root = servo
+    res = import_library(lib, root, "Me", workers=1)
+    assert res.created == ["Servo"] and not res.errors
+    assert not (root / "SRC" / "Servo.h").exists()
+    wrapper = (root / "SRC" / "Me_Servo.h").read_text(encoding="utf-8")
+    assert "#include <Servo.h>" in wrapper and "::Servo FInstance;" in wrapper
+    assert "ArduinoInclude( 'Me_Servo.h' )" in (root / "Visuino" / "Me.Servo.vcomp").read_text()
+
+    compiler = find_compiler()
+    if compiler is None:
+        pytest.skip("no C++ compiler")
+    proc = subprocess.run([compiler, "-fsyntax-only", "-x", "c++", "-I", str(STUB_DIR),
+                           "-I", str(root / "SRC"), "-I", str(lib / "src"),
+                           str(root / "SRC" / "Me_Servo.h")], capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
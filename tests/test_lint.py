@@ -0,0 +1,23 @@
+"""A broken vcomp-lint.json is reported as a finding, not raised."""
+
+import pytest
+
+from app_lint import CONFIG_NAME, lint_library
+from app_vcomp import render_vcomp
+
+
+@pytest.mark.parametrize("config, words", [
+    ('{"disable": [', "ignored"),
+    ("[1]", "ignored"),
+    ('{"plugins": ["no_such_lint_rules"]}', "no_such_lint_rules"),
+])
+def test_bad_config(tmp_path, config, words):
+    (tmp_path / "Visuino").mkdir()
+    (tmp_path / "Visuino" / "A.vcomp").write_text(
+        render_vcomp("N", "A", "A", "A.h", "Math", False), encoding="utf-8")
+    (tmp_path / CONFIG_NAME).write_text(config, encoding="utf-8")
+    results = lint_library(tmp_path, workers=1)
+    assert results[0].path.endswith(CONFIG_NAME)
+    (diag, rule), = results[0].diagnostics
+    assert rule == "config" and diag.severity == "error" and words in diag.message
+    assert len(results) == 2
@@ -0,0 +1,58 @@
+"""Random didChange edits leave VDoc's segments equal to a parse of the full text."""
+
+import copy
+import random
+
+import pytest
+
+from app_vcomp import DEFAULT_PINS, Document, parse, render_vcomp
+from lsp import VDoc, _rebase
+
+BASE = "".join(render_vcomp("Me", f"Comp{i}", f"Comp{i}", f"Comp{i}.h", "Logic", i % 2 == 0,
+                            DEFAULT_PINS) for i in range(4))
+FRAGMENTS = ["", "\n", "\n\n", "{", "}", "[", "]", "'", "x", " : ", "=", "// note\n",
+             "[Name('X')]\n", "  +Pin : TOWArduinoDigitalSinkPin\n",
+             "Other : Namespace\n", "Other : Namespace\n{\n", "  }\n}\n",
+             "    [ArduinoClass( 'Me::X' )]\n    +X : TArduinoComponent\n    {\n    }\n"]
+
+
+def _as_document(doc: VDoc) -> Document:
+    """The segments glued back together, with absolute line numbers."""
+    nodes, errors = [], []
+    for s in doc.segs:
+        seg = copy.deepcopy(s.nodes)
+        _rebase(seg, -s.start)
+        nodes += seg
+        errors += [e if e.line < 0 else e._replace(line=e.line + s.start) for e in s.errors]
+    return Document(nodes, errors)
+
+
+def _random_change(rng: random.Random, lines: list[str]) -> dict:
+    a, b = sorted((rng.randrange(len(lines)), rng.randrange(len(lines))))
+    sc, ec = rng.randint(0, len(lines[a])), rng.randint(0, len(lines[b]))
+    if a == b and ec < sc:
+        sc, ec = ec, sc
+    if rng.random() < 0.5:          # mostly small edits, like typing
+        b, ec = a, min(len(lines[a]), sc + rng.randint(0, 3))
+    return {"range": {"start": {"line": a, "character": sc},
+                      "end": {"line": b, "character": ec}},
+            "text": rng.choice(FRAGMENTS)}
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_edits_match_a_full_parse(seed):
+    rng = random.Random(seed)
+    doc = VDoc("file:///tmp/Me.Comp.vcomp", BASE)
+    for _ in range(60):
+        doc.apply(_random_change(rng, doc.lines))
+        assert _as_document(doc) == parse(doc.text)
+        assert doc.diagnostics(None) == VDoc(doc.uri, doc.text).diagnostics(None)
+
+
+def test_edit_reparses_only_its_segment():
+    doc = VDoc("file:///tmp/Me.Comp.vcomp", BASE)
+    line = doc.lines.index("    [Name('Comp2')]")
+    doc.apply({"range": {"start": {"line": line, "character": 12},
+                         "end": {"line": line, "character": 17}}, "text": "Renamed"})
+    assert _as_document(doc) == parse(doc.text)
+    assert doc.reparsed < len(doc.lines) // 2
@@ -0,0 +1,83 @@
+"""package_library writes zips zipfile can read, and a repackage copies unchanged entries."""
+
+import io
+import os
+import random
+import zipfile
+import zlib
+
+import pytest
+
+import app_package
+from app_package import _ZipWriter, package_library
+
+
+@pytest.fixture
+def lib(tmp_path):
+    root = tmp_path / "Lib"
+    (root / "SRC" / "sub").mkdir(parents=True)
+    (root / "Visuino").mkdir()
+    (root / "SRC" / "a.h").write_text("// a\n")
+    (root / "SRC" / "sub" / "b.h").write_text("// b\n" * 100)
+    (root / "Visuino" / "Me.A.vcomp").write_text("Me : Namespace\n")
+    (root / "library.properties").write_text("name=Lib\n")
+    return root
+
+
+def _contents(path):
+    with zipfile.ZipFile(path) as z:
+        assert z.testzip() is None
+        return {n: z.read(n) for n in z.namelist()}
+
+
+def _expected(root):
+    return {arc: open(p, "rb").read() for arc, p, _ in app_package.collect(root)}
+
+
+def test_round_trip_across_chunks(lib, monkeypatch):
+    monkeypatch.setattr(app_package, "CHUNK", 1000)     # several deflate segments per file
+    (lib / "SRC" / "big.h").write_bytes(random.Random(1).randbytes(5500))
+    r = package_library(lib, workers=2)
+    assert (r.files, r.reused) == (5, 0)
+    assert _contents(r.path) == _expected(lib)
+    assert "Lib/SRC/sub/b.h" in _contents(r.path)
+
+
+def test_repackage_reuses_unchanged_entries(lib):
+    for i in range(2000):
+        (lib / "SRC" / f"h{i:04d}.h").write_text(f"// header {i}\n")
+    first = package_library(lib, workers=2)
+    assert first.files == 2004
+
+    (lib / "SRC" / "h0001.h").write_text("// changed, and longer\n")
+    (lib / "SRC" / "h0002.h").unlink()
+    (lib / "SRC" / "new.h").write_text("// new\n")
+    st = (lib / "SRC" / "h0003.h").stat()          # touched, same bytes
+    os.utime(lib / "SRC" / "h0003.h", ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    second = package_library(lib, workers=2)
+    assert (second.files, second.reused) == (2004, 2002)
+    assert _contents(second.path) == _expected(lib)
+
+    third = package_library(lib, workers=2)
+    assert third.reused == third.files
+    assert _contents(third.path) == _expected(lib)
+
+
+def test_level_change_recompresses(lib):
+    package_library(lib, level=6)
+    assert package_library(lib, level=1).reused == 0
+
+
+def test_zip64_end_record_past_65535_entries():
+    data = zlib.compress(b"x", 6)[2:-4]
+    src, out = io.BytesIO(data), io.BytesIO()
+    st = os.stat_result((0o644, 0, 0, 1, 0, 0, 1, 0, 315532800, 0))
+    w = _ZipWriter(out)
+    n = 0x10000 + 5
+    for i in range(n):
+        w.copy(f"f{i}", st, zlib.crc32(b"x"), len(data), src, 0)
+    w.close()
+    with zipfile.ZipFile(out) as z:
+        names = z.namelist()
+        assert len(names) == n
+        assert z.read(names[-1]) == b"x"
@@ -0,0 +1,53 @@
+"""patch_header brings an existing header to the shape render_header gives it."""
+
+import pytest
+
+from app_vcomp import DEFAULT_PINS, Pin, patch_header, render_header
+
+MORE_PINS = [*DEFAULT_PINS, Pin("Out2", "TOWArduinoAnalogSourcePin", "out"),
+             Pin("In2", "TOWArduinoClockSinkPin", "in")]
+
+STUB = "inline void InputPin_o_Receive(void* _Data)"
+
+
+@pytest.mark.parametrize("pins", [DEFAULT_PINS[:1], DEFAULT_PINS, []])
+def test_patched_header_matches_a_fresh_one(pins):
+    assert patch_header(render_header("Me", "Pulse", pins), "Pulse", MORE_PINS) \
+        == render_header("Me", "Pulse", MORE_PINS)
+
+
+def test_nothing_missing():
+    assert patch_header(render_header("Me", "Pulse"), "Pulse", DEFAULT_PINS) is None
+
+
+def test_class_without_pins():
+    text = "namespace Me\n{\n  class Pulse\n  {\n    int x;\n  };\n}\n"
+    assert patch_header(text, "Pulse", DEFAULT_PINS) == (
+        "namespace Me\n{\n"
+        "  template <typename T_OutputPin>\n"
+        "  class Pulse : public T_OutputPin\n  {\n"
+        "    _V_PIN_( OutputPin )\n    int x;\n\n"
+        f"    {STUB}\n    {{\n      // placeholder\n    }}\n"
+        "  };\n}\n")
+
+
+@pytest.mark.parametrize("body", ["{}", "{ }", "{ int x; }"])
+def test_one_line_body(body):
+    text = f"namespace Me\n{{\n  class Pulse {body};\n}}\n"
+    out = patch_header(text, "Pulse", DEFAULT_PINS)
+    lines = out.splitlines()
+    assert lines[:4] == ["namespace Me", "{", "  template <typename T_OutputPin>",
+                         "  class Pulse : public T_OutputPin {"]
+    assert lines[4] == "    _V_PIN_( OutputPin )"
+    assert ("int x;" in out) == ("int x" in body)
+    assert f"    {STUB}" in lines
+    assert lines[-2:] == ["  };", "}"]
+    assert patch_header(out, "Pulse", DEFAULT_PINS) is None
+
+
+def test_one_line_namespace_and_class():
+    out = patch_header("namespace Me { class Pulse {}; }\n", "Pulse", DEFAULT_PINS)
+    assert out.startswith("namespace Me { template <typename T_OutputPin> "
+                          "class Pulse : public T_OutputPin {\n    _V_PIN_( OutputPin )\n")
+    assert out.endswith("    }\n}; }\n")
+    assert patch_header(out, "Pulse", DEFAULT_PINS) is None
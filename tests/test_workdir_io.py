@@ -0,0 +1,117 @@
+"""WorkdirWidget keeps the event loop responsive while the filesystem is slow."""
+
+import queue
+import threading
+import time
+from collections import defaultdict
+
+import app_workdir
+from app_workdir import WorkdirWidget
+
+SLOW = 0.3
+
+
+class FakeElement:
+    def __init__(self) -> None:
+        self.Disabled = False
+        self.visible = False
+
+    def update(self, *args, disabled=None, **kwargs) -> None:
+        if disabled is not None:
+            self.Disabled = disabled
+
+
+class FakeWindow:
+    """Just enough of `sg.Window`: elements by key and `write_event_value`."""
+
+    def __init__(self) -> None:
+        self.elements = defaultdict(FakeElement)
+        self.events: queue.Queue = queue.Queue()
+
+    def __getitem__(self, key):
+        return self.elements[key]
+
+    def write_event_value(self, key, value) -> None:
+        self.events.put((key, value))
+
+    def next_event(self, timeout: float = 5.0):
+        return self.events.get(timeout=timeout)
+
+
+def _vals(wd: WorkdirWidget, root) -> dict:
+    return {wd.WORKDIR: str(root), wd.NICK: ""}
+
+
+def test_verify_returns_immediately_and_reenables(monkeypatch, tmp_path):
+    def slow_verify(root):
+        time.sleep(SLOW)
+        return "ok"
+    monkeypatch.setattr(app_workdir, "verify_dir", slow_verify)
+    wd, win = WorkdirWidget(), FakeWindow()
+    vals = _vals(wd, tmp_path)
+    try:
+        t0 = time.perf_counter()
+        assert wd.handle_event(wd.VERIFY, vals, win) == "⏳ Verifying…"
+        assert time.perf_counter() - t0 < 0.05
+        assert win[wd.VERIFY].Disabled
+        assert win.events.empty()
+
+        event, payload = win.next_event()
+        assert event == wd.IODONE
+        assert wd.handle_event(event, {**vals, event: payload}, win) == "✅ Directory & structure OK."
+        assert not win[wd.VERIFY].Disabled
+        assert not win[wd.LISTBTN].Disabled
+        assert wd._tails == {}
+    finally:
+        wd.close()
+
+
+def test_stale_out_of_order_completion_is_dropped(monkeypatch, tmp_path):
+    slow_root, fast_root = tmp_path / "slow", tmp_path / "fast"
+    release = threading.Event()
+
+    def scan(root, nick):
+        if root == slow_root:
+            release.wait(5)
+        return [root.name]
+    monkeypatch.setattr(app_workdir, "scan_components", scan)
+    wd, win = WorkdirWidget(), FakeWindow()
+    applied = []
+    monkeypatch.setattr(wd, "_done_rescan",
+                        lambda comps, ctx, vals, win: applied.append(comps))
+    try:
+        t0 = time.perf_counter()
+        wd._refresh_list(win, slow_root, "")       # older request, finishes last
+        wd._refresh_list(win, fast_root, "")
+        assert time.perf_counter() - t0 < 0.05
+
+        event, payload = win.next_event()
+        assert wd.handle_event(event, {**_vals(wd, fast_root), event: payload}, win) is None
+        assert applied == [["fast"]]
+
+        release.set()
+        event, payload = win.next_event()
+        assert wd.handle_event(event, {**_vals(wd, slow_root), event: payload}, win) is None
+        assert applied == [["fast"]]                # stale token: dropped
+        assert wd._tails == {}
+    finally:
+        release.set()
+        wd.close()
+
+
+def test_close_cancels_a_running_bulk_action(tmp_path):
+    import app_bulk
+    started = threading.Event()
+
+    def slow(root, nick, comp):
+        started.set()
+        time.sleep(0.05)
+        return None
+    wd, win = WorkdirWidget(), FakeWindow()
+    wd._bulk = app_bulk.BulkRunner(workers=1)
+    wd._bulk.start(win, "Slow", slow, tmp_path, "", [f"C{i}" for i in range(200)])
+    assert started.wait(5)
+    t0 = time.perf_counter()
+    wd.close()
+    assert time.perf_counter() - t0 < 1.0            # 200 × 50 ms if nothing was cancelled
+    assert wd._bulk._pool._shutdown